@@ -3,19 +3,31 @@
 # Celebrating Microsoft's 50th anniversary by emulating one the first products Micro-Soft launched: Altair 4K BASIC!
 
 
-from opcodes import opcodes_8080
-import winsound
-import msvcrt
 import time
-import tkinter as tk
-from tkinter import scrolledtext, filedialog
-from PIL import Image, ImageTk
-import threading
+
+# Start-up phase timings for --timings, the clock starts before the imports
+startup_clock = time.perf_counter()
+startup_timings = []
+
+from opcodes import opcodes_8080
+import cpu8080
+import blocks8080
+import array
+import collections
+import contextlib
+import glob
 import os
+import random
+import sys
 import argparse
 import datetime
 import leds8800
 import switches8800
+import console8800
+import breakpoints8800
+import trace8800
+import snapshot8800
+import profile8800
 
 # Support for USR(0) - return Sense switch settings
 usrfn_code=[
@@ -74,6 +86,16 @@ ALTAIR_SWITCHES = 25
 
 USRFN_ADDR = 0x0FF0
 
+# Front panel image, scaled to the window width once and cached on disk next to the original
+PANEL_IMAGE = 'altair8800frontpanel.png'
+PANEL_WIDTH = 800
+
+# Intel 8080 clock on the Altair 8800
+ALTAIR_CLOCK_HZ = 2000000
+
+# Default length of the power-on lamp test
+LAMP_TEST_SECONDS = 3.0
+
 # Global variables
 emulator_parser = None
 emulator_args = None
@@ -90,41 +112,91 @@ def hex_type(value):
     except ValueError:
         raise argparse.ArgumentTypeError(f"{value} is not a valid hexadecimal number")
 
+
+def breakpoint_type(value):
+    # ADDR[:CONDITION][#COUNT], see breakpoints8800
+    try:
+        addr, condition, count = breakpoints8800.parse_spec(value)
+        if addr is None and condition is None:
+            raise ValueError("no address or condition")
+        if condition:
+            breakpoints8800.compile_condition(condition)
+        return value
+    except (ValueError, SyntaxError) as error:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid breakpoint: {error}")
+
+
+def watchpoint_type(value):
+    # ADDR[:CONDITION][#COUNT], the address is required
+    try:
+        addr, condition, count = breakpoints8800.parse_spec(value)
+        if addr is None:
+            raise ValueError("no address")
+        if condition:
+            breakpoints8800.compile_condition(condition)
+        return value
+    except (ValueError, SyntaxError) as error:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid watchpoint: {error}")
+
 class Altair8800:
     def __init__(self, text_widget, canvas, root):
-        self.memory = [0] * 65536  # 64KB memory
-        self.registers = {
-            'A': 0, 'B': 0, 'C': 0, 'D': 0, 'E': 0, 'H': 0, 'L': 0,
-            'PC': 0, 'SP': 0xFFFF, 'FLAGS': 0x02
-        }
+        self.memory = bytearray(65536)  # 64KB memory, one byte per location
+        self.memory_view = memoryview(self.memory)  # zero-copy access for loaders and dumps
+        self.registers = cpu8080.RegisterFile()
         self.rom_file = None
-        self.inputbuffer = []
+        self.inputbuffer = collections.deque()  # TTY input, append/extend and popleft are safe across threads
         self.inputchar = 0x00    
         self.interrupt_enabled = False
         self.altair_singlestep = False
         self.singlestep = False
-        self.breakpoints = []
+        self.breakpoints = breakpoints8800.Breakpoints()
         self.running = False
         self.debuglevel = 0
         self.debuglogger = False
-        self.debugloggerfile = None
+        self.tracer = None  # trace8800.TraceWriter while --debuglogger is on
+        self.snapshot_file = None  # save a snapshot here when the CPU stops
+        self.profiler = None  # profile8800.Profiler while --profile is on
+        self.line_profiler = None  # profile8800.LineProfiler while --lineprofile is on
+        self.histogram = profile8800.OpcodeHistogram()  # opcodes run by this machine
+        self.histogram_file = None  # save the histogram here when the CPU stops
         self.text_widget = text_widget
         self.load_button = None
         self.running = False
         self.canvas = canvas
         self.root = root
         self.leds = []
-        self.create_leds()
+        self.panel = leds8800.PanelState()
+        self.panel_renderer = None
         self.switches = [] 
-        self.create_switches()
+        self.headless = canvas is None  # no front panel or TTY window, e.g. batch runs
+        self.ttyout = sys.stdout  # TTY output stream when headless
+        self.tty = None  # console8800.TtyOutput for the TTY window
+        self.stop_reason = None
+        if self.headless == False:
+            self.create_leds()
+            self.panel_renderer = leds8800.PanelRenderer(self.canvas, self.leds, self.panel)
+            self.tty = console8800.TtyOutput(self.text_widget, sys.stdout)
+            self.create_switches()
         self.sense_switches = 0x00 # upper 8 bits from Address switches A15 - A8
         self.data_switches = 0x00
         self.address_switches = 0x0000     
         self.address_lock = False   
         self.ttycount = 0
-        self.create_load_button()
+        if self.headless == False:
+            self.create_load_button()
         self.play_sound = True
+        self.keyboard = console8800.QueueKeyboard()  # replaced by a console backend in setup_altair
+        self.sound = console8800.NullSound()
+        self.printer_sound = None  # console8800.SoundWorker when the TTY printer sound is on
         self.usrfunction = False
+        self.core = "table"
+        self.blocks = None  # blocks8080.BlockCache while the block core runs
+        self.tstates = 0  # 8080 clock cycles executed
+        self.instructions = 0  # 8080 instructions executed
+        self.throttle = 0.0  # pace to this multiple of ALTAIR_CLOCK_HZ, 0 = unlimited
+        self.pace_start = 0.0
+        self.pace_tstates = 0
+        self.lamp_test = LAMP_TEST_SECONDS  # power-on lamp test length, 0 = none
 
     def create_leds(self):
         # Create 36 LED objects
@@ -142,28 +214,14 @@ class Altair8800:
 
 
     def set_data_leds(self, value):
-        bitno = 0x01       
-        
-        for led in range(0, 8):            
-            if bitno & value:
-                self.leds[led].turn_on()
-            else:
-                self.leds[led].turn_off()
-            bitno = bitno << 1
+        self.panel.data = value & 0xFF
 
         if self.debuglevel >= 2:
             print(f"Data LEDs: 0x{value:02X}")
 
 
     def set_address_leds(self, value):
-        bitno = 0x0001       
-        
-        for led in range(8, 24):            
-            if bitno & value:
-                self.leds[led].turn_on()
-            else:
-                self.leds[led].turn_off()
-            bitno = bitno << 1
+        self.panel.address = value & 0xFFFF
 
         if self.debuglevel >= 2:
             print(f"Address LEDs: 0x{value:04X}")
@@ -184,23 +242,14 @@ class Altair8800:
 
     def nextcmd_altair(self):
         if self.altair_singlestep == True:               
-            print(f"Altair Single Step: PC=0x{self.registers['PC']:04X}")
+            print(f"Altair Single Step: PC=0x{self.registers.PC:04X}")
             self.inputbuffer.append(0x0D)
 
 
     def reset_altair(self):
         if self.altair_singlestep == True:
             print("Reset Altair: PC=0x0000")
-            self.registers['A'] = 0x00
-            self.registers['B'] = 0x00
-            self.registers['C'] = 0x00
-            self.registers['D'] = 0x00
-            self.registers['E'] = 0x00
-            self.registers['H'] = 0x00
-            self.registers['L'] = 0x00
-            self.registers['PC'] = 0x0000
-            self.registers['SP'] = 0xFFFF
-            self.registers['FLAGS'] = 0x02
+            self.registers.reset()
             #self.inputbuffer.append(0x0D)
 
 
@@ -269,6 +318,7 @@ class Altair8800:
            self.set_data_leds(self.data_switches)
 
            self.memory[self.address_switches] = self.data_switches & 0xFF
+           self.code_changed(self.address_switches)
 
            print(f"Deposit 0x{self.address_switches:04X} < 0x{self.data_switches:02X}")
 
@@ -281,10 +331,22 @@ class Altair8800:
            self.set_data_leds(self.data_switches)
 
            self.memory[self.address_switches] = self.data_switches & 0xFF
+           self.code_changed(self.address_switches)
 
            print(f"Deposit Next 0x{self.address_switches:04X} < 0x{self.data_switches:02X}")
 
 
+    def code_changed(self, addr):
+        # Memory was written outside the CPU - drop any translated block covering addr
+        if self.blocks is not None:
+            self.blocks.invalidate(addr, addr)
+
+
+    def code_changed_all(self):
+        if self.blocks is not None:
+            self.blocks.flush()
+
+
     def examine_memory(self):
        if self.altair_singlestep == True:
            self.switch_positions()
@@ -350,12 +412,16 @@ class Altair8800:
              
         
     def create_load_button(self):
+        import tkinter as tk
+
         self.load_button = tk.Button(self.root, text="Load", command=self.load_text_file)
         #self.load_button.place(relx=0.70, rely=0.28, width=30, height=25)  # Use relative positioning #0.23
         self.load_button.place(relx=1.0, rely=1.0, anchor='se', x=-10, y=-10) 
 
 
     def load_text_file(self):
+        from tkinter import filedialog
+
         # Open file selection dialog
         filename = filedialog.askopenfilename(
             initialdir=".",
@@ -364,28 +430,43 @@ class Altair8800:
     
         # Check if a file was selected
         if filename:
-            with open(filename, 'r') as file:
-                for line in file:
-                    for char in line:
-                        self.inputbuffer.append(ord(char))
-                    self.inputbuffer.append(ord('\r')) # Append carriage return character
-                    self.inputbuffer.append(ord('\n')) # Append newline character
+            self.queue_text_file(filename)
             print(f"Loaded {filename} into program memory.")                  
+
+
+    def queue_text_file(self, filename):
+        # Type a text file into the TTY input, one line at a time
+        codes = []
+        with open(filename, 'r') as file:
+            for line in file:
+                codes.extend(map(ord, line))
+                codes.append(ord('\r')) # Append carriage return character
+                codes.append(ord('\n')) # Append newline character
+
+        self.queue_input(codes)
+
+
+    def queue_line(self, line):
+        # Type one line into the TTY input as if entered on the keyboard
+        self.queue_input(list(map(ord, line.upper())) + [ord('\r')])
+
+
+    def queue_input(self, codes):
+        # Bulk enqueue of TTY input character codes, e.g. a pasted BASIC listing
+        self.inputbuffer.extend(codes)
         
 
     def load_rom(self, filename):
         print("Loading binary...")
         
-        with open(filename, 'rb') as f:
-            rom = f.read()
-
-            if len(rom) > len(self.memory):
-                raise MemoryError("CRASH: ROM size exceeds memory size!")
-            else:
-                print(f"Program Size: {len(rom)}\n")
+        # check the size first, a ROM that doesn't fit must not overwrite any memory
+        if os.path.getsize(filename) > len(self.memory):
+            raise MemoryError("CRASH: ROM size exceeds memory size!")
 
-            for i in range(len(rom)):
-                self.memory[i] = rom[i]   
+        with open(filename, 'rb') as f:
+            # read the ROM straight into memory starting at 0x0000
+            romsize = f.readinto(self.memory_view)
+            print(f"Program Size: {romsize}\n")
 
         # change the FunctionCallError to the USR function at 0x0FF0
         if self.usrfunction == True:
@@ -410,66 +491,77 @@ class Altair8800:
             elif port == 0x00 and (pc == 0x0382 or pc == 0x0473):
                 if len(self.inputbuffer) > 0:
                     return 0x00 # buffered characters
-                
-                if msvcrt.kbhit():
-                    while msvcrt.kbhit() and self.running == True:
-                        try:
-                            cnc = msvcrt.getch().decode('utf-8')
-                            c = cnc.upper()
-                            self.inputbuffer.append(ord(c))
-                        except UnicodeDecodeError:
-                            # Skip characters that can't be decoded
-                            continue
-                    return 0x00  # TTY character received
-                
+
+                if self.headless == True:
+                    # BASIC is waiting for a line and all scripted input has been typed
+                    if pc == 0x0382:
+                        self.stop_reason = "input exhausted"
+                        self.running = False
+
+                # keyboard characters are typed into inputbuffer by the console backend thread
                 return 0x01  # No character received                    
             elif port == 0x01:
                 if pc == 0x0D28:
                     return 0x0D
                 else:
-                    return self.inputbuffer.pop(0)                                               
+                    return self.inputbuffer.popleft()                                               
             elif port == 0xFF:
                 return self.sense_switches
             else:
-                return int(input(f"Port: {port:02X} Input: "), 16)
+                return int(self.console_input(f"Port: {port:02X} Input: "), 16)
          
     
-    def play_sound_async(self, sound_file):
-        winsound.PlaySound(sound_file, winsound.SND_FILENAME)
+    def console_input(self, prompt):
+        # Read a line for the debugger while the keyboard backend leaves the console alone
+        self.keyboard.pause()
+        try:
+            return input(prompt)
+        finally:
+            self.keyboard.resume()
 
 
     def output_port(self, value, port):
         value &= 0x7F
-        if port == 0x01:
-            print(chr(value), end='')  # Print the ASCII character without a newline
-
-            # process backspace
-            if value == 0x08: 
-                # Get the current cursor position
-                cursor_pos = self.text_widget.index(tk.INSERT)
-
-                # Check if the cursor is not at the beginning
-                if cursor_pos != "1.0":
-                    # Delete the character before the cursor
-                    self.text_widget.delete(f"{cursor_pos} - 1 char", cursor_pos)
-            else:
-                self.text_widget.insert(tk.END, chr(value))  # Print to Tkinter text widget
-                self.text_widget.see(tk.END)  # Scroll to the end
-
-            self.ttycount = (self.ttycount+1) % 21
-            if self.ttycount == 1:
-                if self.play_sound == True:
-                    # Play sound asynchronously
-                    threading.Thread(target=self.play_sound_async, args=("ttyprinter2s.wav",)).start()             
+        if port == 0x01 and self.headless == True:
+            self.ttyout.write(chr(value))
+        elif port == 0x01:
+            # console and Tkinter text widget are updated in chunks by the Tk timer, backspace included
+            self.tty.write(chr(value))
+
+            if self.printer_sound is not None and self.play_sound == True:
+                self.ttycount = (self.ttycount+1) % 21
+                if self.ttycount == 1:
+                    # Play sound asynchronously, requests during playback are coalesced
+                    self.printer_sound.request()
             
         else:
             print(f"Port: {port:02X} Output: {value:02X}")
 
 
+    def save_snapshot(self, filename):
+        snapshot8800.save(self, filename)
+        print(f"Saved snapshot {filename} at PC={self.registers.PC:04X}")
+
+
+    def restore_snapshot(self, filename):
+        snapshot8800.restore(self, filename)
+        self.code_changed_all()
+        # pace from the restored cycle count
+        self.pace_start = time.perf_counter()
+        self.pace_tstates = self.tstates
+        print(f"Restored snapshot {filename} at PC={self.registers.PC:04X}")
+
+
+    def print_breakpoints(self):
+        print("Breakpoints:")
+        for breakpoint in self.breakpoints.all():
+            print(f"  {breakpoint}")
+
+
     def print_stack(self):
         print("Stack Dump:")
         for i in range(20):
-            addr = self.registers['SP'] + i
+            addr = self.registers.SP + i
             if addr < len(self.memory):
                 print(f"Address {addr:04X}: {self.memory[addr]:02X}")
             else:
@@ -479,42 +571,42 @@ class Altair8800:
 
 
     def print_flags(self):
-        print(f"Flags: {self.registers['FLAGS']:02X}")
+        print(f"Flags: {self.registers.FLAGS:02X}")
 
-        if self.registers['FLAGS'] & 0x80:
+        if self.registers.FLAGS & 0x80:
             print("  Sign: 1")
         else:
             print("  Sign: 0")
 
-        if self.registers['FLAGS'] & 0x40:
+        if self.registers.FLAGS & 0x40:
             print("  Zero: 1")
         else:
             print("  Zero: 0")
 
         print("0")
         
-        if self.registers['FLAGS'] & 0x10:
+        if self.registers.FLAGS & 0x10:
             print("    AC: 1")
         else:
             print("    AC: 0")
 
         print("0")
 
-        if self.registers['FLAGS'] & 0x04:
+        if self.registers.FLAGS & 0x04:
             print("Parity: 1")
         else:
             print("Parity: 0")
 
         print("1")
 
-        if self.registers['FLAGS'] & 0x01:
+        if self.registers.FLAGS & 0x01:
             print(" Carry: 1")
         else:
             print(" Carry: 0")
 
 
     def memory_dump(self):
-        memstart = int(input(f"Input memory start address: "), 16)
+        memstart = int(self.console_input(f"Input memory start address: "), 16)
 
         addr = memstart
         for i in range(20):
@@ -529,21 +621,9 @@ class Altair8800:
         print("\n\n")
 
 
-    def debug_addr_write(self, dbf, addr, value):
-        if self.debuglogger == True:
-            dbf.write(f"WRITE MEM {addr:04X} = {value:02X}\n")
-
-
-    def debug_write(self, dbfile):
-        dbfile.write(f"SP: {self.registers['SP']:04X}\n")
-        dbfile.write(f"A Reg: {self.registers['A']:02X} | B Reg: {self.registers['B']:02X} | C Reg: {self.registers['C']:02X}\n")
-        dbfile.write(f"D Reg: {self.registers['D']:02X} | E Reg: {self.registers['E']:02X} | Flags: {self.registers['FLAGS']:02X}\n")
-        dbfile.write(f"H Reg: {self.registers['H']:02X} | L Reg: {self.registers['L']:02X}\n\n")
-
-
     def debug_memory_map(self):
         # memory map info
-        print(f"SP=0x{self.registers['SP']:04X}")  
+        print(f"SP=0x{self.registers.SP:04X}")  
 
         addr = self.memory[0x0166]<<8 | self.memory[0x0165]
         print(f"Program Base=0x{addr:04X}") 
@@ -562,24 +642,30 @@ class Altair8800:
 
 
     def debug(self):
-        print(f"\nSP: {self.registers['SP']:04X}")
-        print(f"A Reg: {self.registers['A']:02X} | B Reg: {self.registers['B']:02X} | C Reg: {self.registers['C']:02X}")
-        print(f"D Reg: {self.registers['D']:02X} | E Reg: {self.registers['E']:02X} | Flags: {self.registers['FLAGS']:02X}")
-        print(f"H Reg: {self.registers['H']:02X} | L Reg: {self.registers['L']:02X}")
+        print(f"\nSP: {self.registers.SP:04X}")
+        print(f"A Reg: {self.registers.A:02X} | B Reg: {self.registers.B:02X} | C Reg: {self.registers.C:02X}")
+        print(f"D Reg: {self.registers.D:02X} | E Reg: {self.registers.E:02X} | Flags: {self.registers.FLAGS:02X}")
+        print(f"H Reg: {self.registers.H:02X} | L Reg: {self.registers.L:02X}")
         if self.singlestep == True:
-            xxx = input("\n--Single Step: [ENTER] to step, mem, cont, stack or flags--\n").lower()
+            xxx = self.console_input("\n--Single Step: [ENTER] to step, mem, cont, stack, flags, bp or snap--\n").lower()
             if xxx == "stack":
                 self.print_stack()
-                xxx = input("\n[ENTER] to continue\n").lower()
+                xxx = self.console_input("\n[ENTER] to continue\n").lower()
             elif xxx == "flags":
                 self.print_flags()
-                xxx = input("\n[ENTER] to continue\n").lower()
+                xxx = self.console_input("\n[ENTER] to continue\n").lower()
             elif xxx == "mem":
                 self.memory_dump()
-                xxx = input("\n[ENTER] to continue\n").lower()
+                xxx = self.console_input("\n[ENTER] to continue\n").lower()
+            elif xxx == "snap":
+                self.save_snapshot(self.console_input("Snapshot file name: ").strip())
+                xxx = self.console_input("\n[ENTER] to continue\n").lower()
+            elif xxx == "bp":
+                self.print_breakpoints()
+                xxx = self.console_input("\n[ENTER] to continue\n").lower()
             elif xxx == "map":
                 self.debug_memory_map()
-                xxx = input("\n[ENTER] to continue\n").lower()
+                xxx = self.console_input("\n[ENTER] to continue\n").lower()
             elif xxx == "cont":
                 self.singlestep = False
                 self.debuglevel = 0            
@@ -587,2607 +673,3019 @@ class Altair8800:
             print("\n")
  
 
-    def execute(self):
-        # reduce delays from INPUT LED control
-        inledcnt = 0
-
-        self.running = True
+    def lamp_test_frames(self):
+        # Every lamp for a moment, then the Altair 8800 power-up pattern
+        power_up = (0xA7 << leds8800.DATA_LED_BASE) | (0xFB92 << leds8800.ADDRESS_LED_BASE)
+        for ledno in (WAIT_LED, WO_LED, MI_LED, MEMR_LED):
+            power_up |= 1 << ledno
 
-        # simulate Altair 8800 powering up and reset
-        self.leds[WAIT_LED].turn_on()
-        self.leds[WO_LED].turn_on()
-        self.leds[MI_LED].turn_on()
-        self.leds[MEMR_LED].turn_on()
-        self.set_data_leds(0xA7)
-        self.set_address_leds(0xFB92)
+        return [((1 << ALTAIR_LEDS) - 1, self.lamp_test / 3), (power_up, self.lamp_test * 2 / 3)]
 
-        time.sleep(3)
 
-        self.leds[WAIT_LED].turn_off()
-        self.leds[WO_LED].turn_off()
-        self.leds[MI_LED].turn_off() 
-        self.leds[MEMR_LED].turn_off()           
+    def execute(self):
+        self.running = True
 
+        # simulate Altair 8800 powering up and reset - the lamp test is played
+        # by the front panel timer while the CPU starts
+        if self.panel_renderer is not None and self.lamp_test > 0:
+            self.panel_renderer.play(self.lamp_test_frames())
 
         self.set_data_leds(0x00)
         self.set_address_leds(0x0000)
 
      
         if self.debuglogger == True:
-            self.debugloggerfile = open("dblogger.txt", "w") 
-              
-        while self.running == True:
-            pc = self.registers['PC']
+            # binary trace, py trace8800.py turns it into dblogger.txt
+            self.tracer = trace8800.TraceWriter("dblogger.trc")
 
-            if pc >= len(self.memory):
-                print(f"Exceeded program memory: PC={pc:04X}")
-                self.running = False
+        self.keyboard.start(self)
+        self.pace_start = time.perf_counter()
+        self.pace_tstates = self.tstates
 
-            opcode = self.memory[pc] & 0xFF
+        if self.core == "legacy":
+            self.execute_legacy()
+        elif self.core == "block":
+            self.execute_blocks()
+        else:
+            self.execute_table()
 
-            if self.altair_singlestep == True and self.address_lock == False:
-                self.set_address_leds(pc)
-                self.set_data_leds(opcode)
-            
-            if pc == self.registers['SP']:
-                 self.leds[STACK_LED].turn_on()
-            else:
-                self.leds[STACK_LED].turn_off()
+        self.keyboard.stop()
+
+        if self.tracer is not None:
+            self.tracer.close(self.registers)
+
+        if self.profiler is not None:
+            self.profiler.report(sys.stdout)
+
+        if self.line_profiler is not None:
+            self.line_profiler.report(sys.stdout, ALTAIR_CLOCK_HZ)
+
+        if self.histogram_file is not None:
+            self.histogram.save(self.histogram_file)
+            print(f"Saved opcode histogram {self.histogram_file}")
 
-            # update the Opcode Histogram
-            opcodes_8080[opcode][1] +=1
+        if self.snapshot_file is not None:
+            self.save_snapshot(self.snapshot_file)
 
+
+    def before_instruction(self, pc, opcode):
+        if self.altair_singlestep == True and self.address_lock == False:
+            self.set_address_leds(pc)
+            self.set_data_leds(opcode)
+        
+        if pc == self.registers.SP:
+            self.panel.status_on(STACK_LED)
+        else:
+            self.panel.status_off(STACK_LED)
+
+        # update the Opcode Histogram
+        if self.histogram.sample == 0:
+            self.histogram.counts[opcode] += 1
+
+        if self.debuglevel >= 1:
             now = datetime.datetime.now()
+            print(f"{now.hour}:{now.minute}:{now.second} {pc:04X} : {opcode:02X} {opcodes_8080[opcode][0]}")
 
-            if self.debuglevel >= 1:
-                print(f"{now.hour}:{now.minute}:{now.second} {pc:04X} : {opcode:02X} {opcodes_8080[opcode][0]}")
+        if self.debuglogger == True:
+            self.tracer.instruction(pc, opcode, self.registers, self.memory)
 
-            if self.debuglogger == True:
-                self.debugloggerfile.write(f"{now.hour}:{now.minute}:{now.second} {pc:04X} : {opcode:02X} {opcodes_8080[opcode][0]}\n")
-                self.debug_write(self.debugloggerfile)
+        if self.profiler is not None:
+            self.profiler.count(pc, opcode)
 
-            if pc in self.breakpoints:
-                bpgo = input(f"\aBreakpoint at {pc:04X} - press [ENTER]\n")
+        if self.breakpoints:
+            hit = self.breakpoints.check(pc, opcode, self.registers, self.memory)
+            if hit is not None:
+                bpgo = self.console_input(f"\a{hit}, PC={pc:04X} - press [ENTER]\n")
                 self.debuglevel = 2
                 self.singlestep = True
 
-            self.registers['PC'] += 1
+
+    def after_instruction(self):
+        if self.altair_singlestep == True:
+            while len(self.inputbuffer) == 0 and self.altair_singlestep == True:
+                time.sleep(0.1)
+
+            if len(self.inputbuffer):
+                self.inputbuffer.popleft()   
+
+        if self.singlestep == True:
+            self.debug()
+
+        if self.debuglogger == True:
+            self.tracer.after_instruction(self.memory)
+
+
+    def in_instruction(self, pc, port):
+        self.panel.pulse(INP_LED)
+
+        return self.input_port(pc, port)
+
+
+    def out_instruction(self, value, port):
+        self.panel.pulse(OUT_LED)
+        self.output_port(value, port)
+
+
+    def halt(self, pc):
+        # No interrupt controller is emulated, so HLT stops the CPU
+        self.running = False
+        self.stop_reason = "halt"
+        self.panel.status_on(HLTA_LED)
+
+        print(f"\nHLT at {pc:04X} - Altair 8800 halted")
+
+
+    def undefined_opcode(self, opcode, pc):
+        self.running = False
+        self.stop_reason = "undefined opcode"
+
+        print(f"Undefined opcode: {opcode:02X} at {pc:04X} = ABORTING!!!")
+
+        for opc in range(0,0x100):
+            if self.histogram.counts[opc] == 1:
+                print(f"{opcodes_8080[opc][0]}")
+
+        if self.debuglogger == True:
+            self.debuglogger = False
+            self.tracer.close(self.registers)
+
+
+    def throttle_batch(self):
+        # Clock cycles the CPU loops run between calls to pace(), 10 ms of Altair
+        # time or less when the BASIC line profiler samples more often
+        if self.throttle > 0:
+            batch = max(1, int(ALTAIR_CLOCK_HZ * self.throttle / 100))
+        else:
+            batch = ALTAIR_CLOCK_HZ // 100
+
+        if self.line_profiler is not None:
+            batch = max(1, min(batch, self.line_profiler.interval))
+
+        if self.histogram.sample > 0:
+            # a random length, so the samples don't fall in step with a loop in the 8080 code
+            batch = max(1, min(batch, random.randint(self.histogram.sample // 2, self.histogram.sample * 3 // 2)))
+
+        return batch
+
+
+    def pace(self, tstates):
+        # Add a batch of clock cycles to the T-state counter and, when throttled,
+        # sleep until wall time catches up with the emulated Altair time
+        self.tstates += tstates
+
+        if self.line_profiler is not None:
+            self.line_profiler.sample(self)
+
+        if self.histogram.sample > 0:
+            self.histogram.sample_opcode(self)
+
+        if self.throttle <= 0:
+            return
+
+        now = time.perf_counter()
+        ahead = self.pace_start + (self.tstates - self.pace_tstates) / (ALTAIR_CLOCK_HZ * self.throttle) - now
+        if ahead > 0:
+            time.sleep(ahead)
+        elif ahead < -0.25:
+            # fell behind, e.g. stopped in the debugger - pace from here on
+            self.pace_start = now
+            self.pace_tstates = self.tstates
+
+
+    def counting_opcodes(self):
+        # --histogram without sampling counts every instruction, in the fast loops too
+        return self.histogram_file is not None and self.histogram.sample == 0
+
+
+    def instrumented(self):
+        # Something has to see every instruction: front panel single step, the
+        # debugger, debug output, the logger or breakpoints
+        return self.altair_singlestep == True or self.singlestep == True or self.debuglogger == True or \
+               self.debuglevel >= 1 or len(self.breakpoints) > 0
+
+
+    def execute_table(self):
+        # Table driven core: one handler per opcode, built from opcodes_8080.
+        # Runs the fast loop until instrumentation is needed and switches back
+        # when it is no longer, e.g. after leaving the debugger.
+        table = cpu8080.build_dispatch_table(self)
+
+        while self.running == True:
+            if self.instrumented():
+                self.run_instrumented(table)
+            elif self.profiler is not None:
+                self.run_profiled(table)
+            elif self.counting_opcodes():
+                self.run_counted(table)
+            else:
+                self.run_fast(table)
+
+
+    def run_fast(self, table):
+        # No per instruction debugging work. PC is kept in a local and the
+        # instrumentation switches are only checked every throttle batch.
+        tstates_8080 = cpu8080.tstates_8080
+        memory = self.memory
+        registers = self.registers
+        pc = registers.PC
+        batch = self.throttle_batch()
+        tstates = 0
+        executed = 0
+
+        try:
+            while self.running == True:
+                opcode = memory[pc]
+                pc = table[opcode](pc)
+
+                executed += 1
+                tstates += tstates_8080[opcode]
+                if tstates >= batch:
+                    registers.PC = pc
+                    self.instructions += executed
+                    executed = 0
+                    self.pace(tstates)
+                    tstates = 0
+                    batch = self.throttle_batch()
+                    if self.instrumented():
+                        break
+        except IndexError:
+            # only an instruction running off the top of memory, not an emulator error
+            if pc < len(self.memory) - 2:
+                raise
+            self.exceeded_memory(pc)
+
+        registers.PC = pc
+        self.tstates += tstates
+        self.instructions += executed
+
+
+    def run_counted(self, table):
+        # The fast loop with the opcode histogram updated for every instruction
+        tstates_8080 = cpu8080.tstates_8080
+        memory = self.memory
+        registers = self.registers
+        opcodes = self.histogram.counts
+        pc = registers.PC
+        batch = self.throttle_batch()
+        tstates = 0
+        executed = 0
+
+        try:
+            while self.running == True:
+                opcode = memory[pc]
+                opcodes[opcode] += 1
+                pc = table[opcode](pc)
+
+                executed += 1
+                tstates += tstates_8080[opcode]
+                if tstates >= batch:
+                    registers.PC = pc
+                    self.instructions += executed
+                    executed = 0
+                    self.pace(tstates)
+                    tstates = 0
+                    batch = self.throttle_batch()
+                    if self.instrumented():
+                        break
+        except IndexError:
+            # only an instruction running off the top of memory, not an emulator error
+            if pc < len(self.memory) - 2:
+                raise
+            self.exceeded_memory(pc)
+
+        registers.PC = pc
+        self.tstates += tstates
+        self.instructions += executed
+
+
+    def run_profiled(self, table):
+        # The fast loop with every instruction and its clock cycles counted at
+        # its address for the profiler
+        tstates_8080 = cpu8080.tstates_8080
+        memory = self.memory
+        registers = self.registers
+        counts = self.profiler.counts
+        cycles = self.profiler.tstates
+        opcodes = self.histogram.counts if self.histogram.sample == 0 else array.array('Q', bytes(8 * 0x100))
+        pc = registers.PC
+        batch = self.throttle_batch()
+        tstates = 0
+        executed = 0
+
+        try:
+            while self.running == True:
+                opcode = memory[pc]
+                counts[pc] += 1
+                cycles[pc] += tstates_8080[opcode]
+                opcodes[opcode] += 1
+                pc = table[opcode](pc)
+
+                executed += 1
+                tstates += tstates_8080[opcode]
+                if tstates >= batch:
+                    registers.PC = pc
+                    self.instructions += executed
+                    executed = 0
+                    self.pace(tstates)
+                    tstates = 0
+                    batch = self.throttle_batch()
+                    if self.instrumented():
+                        break
+        except IndexError:
+            # only an instruction running off the top of memory, not an emulator error
+            if pc < len(self.memory) - 2:
+                raise
+            self.exceeded_memory(pc)
+
+        registers.PC = pc
+        self.tstates += tstates
+        self.instructions += executed
+
+
+    def run_instrumented(self, table):
+        # One instruction at a time with the front panel, debugger, logger and
+        # breakpoint hooks, until none of them is needed any more. Clock cycles
+        # still go to pace() a throttle batch at a time.
+        tstates_8080 = cpu8080.tstates_8080
+        memory = self.memory
+        registers = self.registers
+        code_map = self.blocks.code_map if self.blocks is not None else None
+        batch = self.throttle_batch()
+        tstates = 0
+
+        while self.running == True:
+            pc = registers.PC
+            if pc >= len(memory):
+                self.exceeded_memory(pc)
+                break
+
+            opcode = memory[pc]
+
+            self.before_instruction(pc, opcode)
+
+            if code_map is not None:
+                # the table handlers don't check the code map, drop the cached blocks this instruction stores into
+                for addr in breakpoints8800.memory_accesses(opcode, pc, registers, memory)[1]:
+                    if code_map[addr]:
+                        self.blocks.invalidate(addr, addr)
+
+            registers.PC = table[opcode](pc)
+            self.instructions += 1
+            tstates += tstates_8080[opcode]
+            if tstates >= batch:
+                self.pace(tstates)
+                tstates = 0
+                batch = self.throttle_batch()
+
+            if self.debuglevel >= 4:
+                print(f"{opcodes_8080[opcode][0]}: A={registers.A:02X} FLAGS={registers.FLAGS:02X} SP={registers.SP:04X}")
+
+            self.after_instruction()
+
+            if not self.instrumented():
+                break
+
+        self.tstates += tstates
+
+
+    def exceeded_memory(self, pc):
+        print(f"Exceeded program memory: PC={pc:04X}")
+        self.running = False
+        self.stop_reason = "exceeded memory"
+
+
+    def execute_blocks(self):
+        # Block translation core: straight-line 8080 code is compiled into one
+        # Python function per block and cached by address (see blocks8080).
+        # While single stepping, debugging, logging, profiling or with breakpoints
+        # set, instructions run one at a time through the table handlers instead.
+        table = cpu8080.build_dispatch_table(self)
+        self.blocks = blocks8080.BlockCache(self, table)
+
+        while self.running == True:
+            if self.instrumented():
+                self.run_instrumented(table)
+            elif self.profiler is not None:
+                self.run_profiled(table)
+            elif self.counting_opcodes():
+                self.run_counted(table)
+            else:
+                self.run_blocks()
+
+        if self.debuglevel >= 1:
+            print(f"Block cache: {self.blocks.translated} blocks translated, {self.blocks.invalidated} invalidated")
+
+
+    def run_blocks(self):
+        blocks = self.blocks.blocks
+        block_tstates = self.blocks.tstates
+        block_instructions = self.blocks.instructions
+        translate = self.blocks.translate
+        registers = self.registers
+        pc = registers.PC
+        batch = self.throttle_batch()
+        tstates = 0
+        executed = 0
+
+        try:
+            while self.running == True:
+                block = blocks[pc]
+                if block is None:
+                    block = translate(pc)
+
+                tstates += block_tstates[pc]
+                executed += block_instructions[pc]
+                pc = block(pc)
+
+                if tstates >= batch:
+                    registers.PC = pc
+                    self.instructions += executed
+                    executed = 0
+                    self.pace(tstates)
+                    tstates = 0
+                    batch = self.throttle_batch()
+                    if self.instrumented():
+                        break
+        except IndexError:
+            # only an instruction running off the top of memory, not an emulator error
+            if pc < len(self.memory) - 2:
+                raise
+            self.exceeded_memory(pc)
+
+        registers.PC = pc
+        self.tstates += tstates
+        self.instructions += executed
+
+
+    def execute_legacy(self):
+        # T-states are counted per opcode, taken conditional CALL/RET extras are not included
+        tstates_8080 = cpu8080.tstates_8080
+        batch = self.throttle_batch()
+        tstates = 0
+
+        while self.running == True:
+            pc = self.registers.PC
+
+            if pc >= len(self.memory):
+                print(f"Exceeded program memory: PC={pc:04X}")
+                self.running = False
+                self.stop_reason = "exceeded memory"
+
+            opcode = self.memory[pc] & 0xFF
+
+            self.before_instruction(pc, opcode)
+
+            self.instructions += 1
+            tstates += tstates_8080[opcode]
+            if tstates >= batch:
+                self.pace(tstates)
+                tstates = 0
+                batch = self.throttle_batch()
+
+            self.registers.PC += 1
 
             if opcode == 0x00:  # NOP
                 if self.debuglevel >= 4:
                     print("NOP")
             elif opcode == 0x01: # LXI B, word
-                self.registers['C'] = self.memory[self.registers['PC']]
-                self.registers['B'] = self.memory[self.registers['PC'] + 1]
-                self.registers['PC'] += 2
+                self.registers.C = self.memory[self.registers.PC]
+                self.registers.B = self.memory[self.registers.PC + 1]
+                self.registers.PC += 2
                 
                 if self.debuglevel >= 4:
-                    print(f"LXI B : B={self.registers['B']:02X}, C={self.registers['C']:02X}")
+                    print(f"LXI B : B={self.registers.B:02X}, C={self.registers.C:02X}")
             elif opcode == 0x02:  # STAX B
-                addr = (self.registers['B'] << 8) | self.registers['C']  # Calculate the memory address from B and C registers
-                self.memory[addr] = self.registers['A']  # Store the value of the accumulator into memory
+                addr = (self.registers.B << 8) | self.registers.C  # Calculate the memory address from B and C registers
+                self.memory[addr] = self.registers.A  # Store the value of the accumulator into memory
 
                 if self.debuglevel >= 4:
-                    print(f"STAX B: {addr:04X}, A={self.registers['A']:02X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['A'])
+                    print(f"STAX B: {addr:04X}, A={self.registers.A:02X}")
             elif opcode == 0x03:  # INX B
-                bc = (self.registers['B'] << 8) | self.registers['C']
+                bc = (self.registers.B << 8) | self.registers.C
                 bc = (bc + 1) & 0xFFFF  # Ensure it wraps around at 16 bits
-                self.registers['B'] = (bc >> 8) & 0xFF
-                self.registers['C'] = bc & 0xFF
+                self.registers.B = (bc >> 8) & 0xFF
+                self.registers.C = bc & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"INX B : B={self.registers['B']:02X}, C={self.registers['C']:02X}")
+                    print(f"INX B : B={self.registers.B:02X}, C={self.registers.C:02X}")
             elif opcode == 0x04: # INR B
-                aux_carryflag_before = self.registers['B'] & 0x0F  # Save the lower nibble before increment
-                self.registers['B'] = (self.registers['B'] + 1) & 0xFF  # Increment B and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.B & 0x0F  # Save the lower nibble before increment
+                self.registers.B = (self.registers.B + 1) & 0xFF  # Increment B and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['B'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['B'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['B']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.B == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.B & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.B).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before + 1 > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag   
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag   
 
                 if self.debuglevel >= 4:
-                    print(f"INR B: B={self.registers['B']:02X}")                        
+                    print(f"INR B: B={self.registers.B:02X}")                        
             elif opcode == 0x05: # DCR B
-                aux_carryflag_before = self.registers['B'] & 0x0F  # Save the lower nibble before decrement
-                self.registers['B'] = (self.registers['B'] - 1) & 0xFF  # Decrement B and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.B & 0x0F  # Save the lower nibble before decrement
+                self.registers.B = (self.registers.B - 1) & 0xFF  # Decrement B and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['B'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['B'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['B']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.B == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.B & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.B).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 
                 if self.debuglevel >= 4:
-                    print(f"DCR B: B={self.registers['B']:02X}")
+                    print(f"DCR B: B={self.registers.B:02X}")
             elif opcode == 0x06:  # MVI B, byte
-                self.registers['B'] = self.memory[self.registers['PC']]                
+                self.registers.B = self.memory[self.registers.PC]                
 
                 if self.debuglevel >= 4:
-                    print(f"MVI B, byte: {self.registers['PC']:04X}, B={self.registers['B']:02X}")
+                    print(f"MVI B, byte: {self.registers.PC:04X}, B={self.registers.B:02X}")
 
-                self.registers['PC'] += 1
+                self.registers.PC += 1
             elif opcode == 0x07:  # RLC
-                carry = (self.registers['A'] & 0x80) >> 7  # Extract the most significant bit (bit 7)
-                self.registers['A'] = ((self.registers['A'] << 1) & 0xFF) | carry  # Rotate left and set bit 0 to the carry
+                carry = (self.registers.A & 0x80) >> 7  # Extract the most significant bit (bit 7)
+                self.registers.A = ((self.registers.A << 1) & 0xFF) | carry  # Rotate left and set bit 0 to the carry
 
                 # Clear flags
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set the carry flag based on the rotated bit
                 if carry:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"RLC: A={self.registers['A']:02X}")
+                    print(f"RLC: A={self.registers.A:02X}")
             elif opcode == 0x08: # not ussed in 8080
                 pass
             elif opcode == 0x09: # DAD B
-                hl = (self.registers['H'] << 8) | self.registers['L']
-                bc = (self.registers['B'] << 8) | self.registers['C']
+                hl = (self.registers.H << 8) | self.registers.L
+                bc = (self.registers.B << 8) | self.registers.C
                 result = hl + bc
-                self.registers['H'] = (result >> 8) & 0xFF
-                self.registers['L'] = result & 0xFF
+                self.registers.H = (result >> 8) & 0xFF
+                self.registers.L = result & 0xFF
 
                 # Update carry flag
-                self.registers['FLAGS'] &= ~(1 << 0) # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 0) # Clear carry flag
                 if result > 0xFFFF:
-                    self.registers['FLAGS'] |= (1 << 0) # Set carry flag
+                    self.registers.FLAGS |= (1 << 0) # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DAD B : HL={hl:04X} + BC={bc:04X} = {result:04X}, CY={self.registers['FLAGS'] & 0x01}")
+                    print(f"DAD B : HL={hl:04X} + BC={bc:04X} = {result:04X}, CY={self.registers.FLAGS & 0x01}")
             elif opcode == 0x0A:  # LDAX B
-                addr = (self.registers['B'] << 8) | self.registers['C']
-                self.registers['A'] = self.memory[addr]
+                addr = (self.registers.B << 8) | self.registers.C
+                self.registers.A = self.memory[addr]
                 
                 if self.debuglevel >= 4:
-                    print(f"LDAX B : A={self.registers['A']:02X}, [BC]={addr:04X} = {self.memory[addr]:02X}")
+                    print(f"LDAX B : A={self.registers.A:02X}, [BC]={addr:04X} = {self.memory[addr]:02X}")
             elif opcode == 0x0B:  # DCX B
-                bc = (self.registers['B'] << 8) | self.registers['C']
+                bc = (self.registers.B << 8) | self.registers.C
                 bc = (bc - 1) & 0xFFFF  # Ensure it wraps around at 16 bits
-                self.registers['B'] = (bc >> 8) & 0xFF
-                self.registers['C'] = bc & 0xFF
+                self.registers.B = (bc >> 8) & 0xFF
+                self.registers.C = bc & 0xFF
                 
                 if self.debuglevel >= 4:
-                    print(f"DCX B : B={self.registers['B']:02X}, C={self.registers['C']:02X}")
+                    print(f"DCX B : B={self.registers.B:02X}, C={self.registers.C:02X}")
             elif opcode == 0x0C: # INR C
-                aux_carryflag_before = self.registers['C'] & 0x0F  # Save the lower nibble before increment
-                self.registers['C'] = (self.registers['C'] + 1) & 0xFF  # Increment C and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.C & 0x0F  # Save the lower nibble before increment
+                self.registers.C = (self.registers.C + 1) & 0xFF  # Increment C and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['C'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['C'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['C']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.C == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.C & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.C).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before + 1 > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag   
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag   
 
                 if self.debuglevel >= 4:
-                    print(f"INR C: C={self.registers['C']:02X}")         
+                    print(f"INR C: C={self.registers.C:02X}")         
             elif opcode == 0x0D: # DCR C
-                aux_carryflag_before = self.registers['C'] & 0x0F  # Save the lower nibble before decrement
-                self.registers['C'] = (self.registers['C'] - 1) & 0xFF  # Decrement C and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.C & 0x0F  # Save the lower nibble before decrement
+                self.registers.C = (self.registers.C - 1) & 0xFF  # Decrement C and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['C'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['C'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['C']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.C == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.C & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.C).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DCR C: C={self.registers['C']:02X}")
+                    print(f"DCR C: C={self.registers.C:02X}")
             elif opcode == 0x0E:  # MVI C, byte
-                self.registers['C'] = self.memory[self.registers['PC']]
+                self.registers.C = self.memory[self.registers.PC]
 
                 if self.debuglevel >= 4:
-                    print(f"MVI C: C={self.registers['C']:02X} addr={self.registers['PC']:04X}")  
+                    print(f"MVI C: C={self.registers.C:02X} addr={self.registers.PC:04X}")  
 
-                self.registers['PC'] += 1
+                self.registers.PC += 1
             elif opcode == 0x0F:  # RRC
-                carry = self.registers['A'] & 0x01  # Extract the least significant bit (bit 0)
-                self.registers['A'] = (self.registers['A'] >> 1) | (carry << 7)  # Rotate right and set bit 7 to the carry
+                carry = self.registers.A & 0x01  # Extract the least significant bit (bit 0)
+                self.registers.A = (self.registers.A >> 1) | (carry << 7)  # Rotate right and set bit 7 to the carry
 
                 # Clear flags
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set the carry flag based on the rotated bit
                 if carry:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"RRC: A={self.registers['A']:02X}")  
+                    print(f"RRC: A={self.registers.A:02X}")  
             elif opcode == 0x10: # not ussed in 8080
                 pass
             elif opcode == 0x11:  # LXI D, word
-                self.registers['E'] = self.memory[self.registers['PC']]
-                self.registers['D'] = self.memory[self.registers['PC'] + 1]
-                self.registers['PC'] += 2
+                self.registers.E = self.memory[self.registers.PC]
+                self.registers.D = self.memory[self.registers.PC + 1]
+                self.registers.PC += 2
 
                 if self.debuglevel >= 4:
-                    print(f"LXI D: D={self.registers['D']:02X} E={self.registers['E']:02X}")  
+                    print(f"LXI D: D={self.registers.D:02X} E={self.registers.E:02X}")  
             elif opcode == 0x12: # MOV M, D = 0x72 WRONG - this is STAX D
-                addr = (self.registers['D'] << 8) | self.registers['E']
-                self.memory[addr] = self.registers['A'] & 0xFF
+                addr = (self.registers.D << 8) | self.registers.E
+                self.memory[addr] = self.registers.A & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"STAX D {addr:04X} : {self.registers['A']:02X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['A'])
+                    print(f"STAX D {addr:04X} : {self.registers.A:02X}")
             elif opcode == 0x13: # INX D
-                de = (self.registers['D'] << 8) | self.registers['E']
+                de = (self.registers.D << 8) | self.registers.E
                 de = ((de + 1) & 0xFFFF) # Increment DE and ensure it wraps around at 16 bits
-                self.registers['D'] = (de >> 8) & 0xFF
-                self.registers['E'] = de & 0xFF
+                self.registers.D = (de >> 8) & 0xFF
+                self.registers.E = de & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"INX D: D={self.registers['D']:02X} E={self.registers['E']:02X}")  
+                    print(f"INX D: D={self.registers.D:02X} E={self.registers.E:02X}")  
             elif opcode == 0x14: # INR D
-                aux_carryflag_before = self.registers['D'] & 0x0F  # Save the lower nibble before increment
-                self.registers['D'] = (self.registers['D'] + 1) & 0xFF  # Increment D and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.D & 0x0F  # Save the lower nibble before increment
+                self.registers.D = (self.registers.D + 1) & 0xFF  # Increment D and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['D'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['D'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['D']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.D == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.D & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.D).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before + 1 > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"INR D: D={self.registers['D']:02X}") 
+                    print(f"INR D: D={self.registers.D:02X}") 
             elif opcode == 0x15:  # DCR D
                 # Save the lower nibble before decrement
-                aux_carryflag_before = self.registers['D'] & 0x0F
+                aux_carryflag_before = self.registers.D & 0x0F
                 
                 # Decrement D and ensure it wraps around at 8 bits
-                self.registers['D'] = (self.registers['D'] - 1) & 0xFF
+                self.registers.D = (self.registers.D - 1) & 0xFF
                 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
                 
-                if self.registers['D'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['D'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['D']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.D == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.D & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.D).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DCR D: D={self.registers['D']:02X}") 
+                    print(f"DCR D: D={self.registers.D:02X}") 
             elif opcode == 0x16:  # MVI D, byte
-                self.registers['D'] = self.memory[self.registers['PC']]
+                self.registers.D = self.memory[self.registers.PC]
 
                 if self.debuglevel >= 4:
-                    print(f"MVI D: addr={self.registers['PC']:04X} D={self.registers['D']:02X}")  
+                    print(f"MVI D: addr={self.registers.PC:04X} D={self.registers.D:02X}")  
 
-                self.registers['PC'] += 1
+                self.registers.PC += 1
             elif opcode == 0x17:  # RAL
-                carry = (self.registers['A'] & 0x80) >> 7  # Extract the most significant bit (bit 7)
-                self.registers['A'] = ((self.registers['A'] << 1) & 0xFF) | (self.registers['FLAGS'] & 0x01)  # Rotate left through carry
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                carry = (self.registers.A & 0x80) >> 7  # Extract the most significant bit (bit 7)
+                self.registers.A = ((self.registers.A << 1) & 0xFF) | (self.registers.FLAGS & 0x01)  # Rotate left through carry
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set the carry flag based on the rotated bit
                 if carry:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"RAL: A={self.registers['A']:02X}") 
+                    print(f"RAL: A={self.registers.A:02X}") 
             elif opcode == 0x18: # not ussed in 8080
                 pass
             elif opcode == 0x19:  # DAD D
-                hl = (self.registers['H'] << 8) | self.registers['L']
-                de = (self.registers['D'] << 8) | self.registers['E']
+                hl = (self.registers.H << 8) | self.registers.L
+                de = (self.registers.D << 8) | self.registers.E
                 result = hl + de
-                self.registers['H'] = (result >> 8) & 0xFF
-                self.registers['L'] = result & 0xFF
+                self.registers.H = (result >> 8) & 0xFF
+                self.registers.L = result & 0xFF
 
                 # Update carry flag
-                self.registers['FLAGS'] &= ~(1 << 0) # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 0) # Clear carry flag
 
                 if result > 0xFFFF:
-                    self.registers['FLAGS'] |= (1 << 0) # Set carry flag
+                    self.registers.FLAGS |= (1 << 0) # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DAD D : HL={hl:04X} + DE={de:04X} = {result:04X}, CY={self.registers['FLAGS'] & 0x01}")
+                    print(f"DAD D : HL={hl:04X} + DE={de:04X} = {result:04X}, CY={self.registers.FLAGS & 0x01}")
             elif opcode == 0x1A: # LDAX D
-                addr = (self.registers['D'] << 8) | self.registers['E']
-                self.registers['A'] = self.memory[addr]
+                addr = (self.registers.D << 8) | self.registers.E
+                self.registers.A = self.memory[addr]
 
                 if self.debuglevel >= 4:
                     print(f"LDAX D {addr:04X} = {self.memory[addr]:02X}")
             elif opcode == 0x1B:  # DCX D
-                de = (self.registers['D'] << 8) | self.registers['E']  # Combine D and E to form DE
+                de = (self.registers.D << 8) | self.registers.E  # Combine D and E to form DE
                 de = (de - 1) & 0xFFFF  # Decrement DE and ensure it wraps around at 16 bits
-                self.registers['D'] = (de >> 8) & 0xFF  # Update D with the high byte of DE
-                self.registers['E'] = de & 0xFF  # Update E with the low byte of DE
+                self.registers.D = (de >> 8) & 0xFF  # Update D with the high byte of DE
+                self.registers.E = de & 0xFF  # Update E with the low byte of DE
 
                 if self.debuglevel >= 4:
-                    print(f"DCX D: D={self.registers['D']:02X} E={self.registers['E']:02X}") 
+                    print(f"DCX D: D={self.registers.D:02X} E={self.registers.E:02X}") 
             elif opcode == 0x1C: # INR E
-                aux_carryflag_before = self.registers['E'] & 0x0F  # Save the lower nibble before increment
-                self.registers['E'] = (self.registers['E'] + 1) & 0xFF  # Increment E and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.E & 0x0F  # Save the lower nibble before increment
+                self.registers.E = (self.registers.E + 1) & 0xFF  # Increment E and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['E'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['E'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['E']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.E == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.E & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.E).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before + 1 > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"INR E: E={self.registers['E']:02X}") 
+                    print(f"INR E: E={self.registers.E:02X}") 
             elif opcode == 0x1D:  # DCR E
-                aux_carryflag_before = self.registers['E'] & 0x0F
-                self.registers['E'] = (self.registers['E'] - 1) & 0xFF
+                aux_carryflag_before = self.registers.E & 0x0F
+                self.registers.E = (self.registers.E - 1) & 0xFF
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['E'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['E'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['E']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.E == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.E & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.E).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 # Auxiliary carry flag calculation
                 if (aux_carryflag_before - 1) & 0x10:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DCR E: E={self.registers['E']:02X}") 
+                    print(f"DCR E: E={self.registers.E:02X}") 
             elif opcode == 0x1E:  # MVI E, byte
-                self.registers['E'] = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
+                self.registers.E = self.memory[self.registers.PC]
+                self.registers.PC += 1
                 
                 if self.debuglevel >= 4:
-                    print(f"MVI E, byte : E={self.registers['E']:02X}")
+                    print(f"MVI E, byte : E={self.registers.E:02X}")
             elif opcode == 0x1F:  # RAR
-                carry = self.registers['A'] & 0x01  # Extract the least significant bit (bit 0)
-                self.registers['A'] = (self.registers['A'] >> 1) | ((self.registers['FLAGS'] & 0x01) << 7)  # Rotate right through carry
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                carry = self.registers.A & 0x01  # Extract the least significant bit (bit 0)
+                self.registers.A = (self.registers.A >> 1) | ((self.registers.FLAGS & 0x01) << 7)  # Rotate right through carry
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set the carry flag based on the rotated bit
                 if carry:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"RAR: A={self.registers['A']:02X}") 
+                    print(f"RAR: A={self.registers.A:02X}") 
             elif opcode == 0x2D:  # DCR L
-                aux_carryflag_before = self.registers['L'] & 0x0F  # Save the lower nibble before decrement
-                self.registers['L'] = (self.registers['L'] - 1) & 0xFF  # Decrement L and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.L & 0x0F  # Save the lower nibble before decrement
+                self.registers.L = (self.registers.L - 1) & 0xFF  # Decrement L and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['L'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['L'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['L']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.L == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.L & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.L).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DCR L: L={self.registers['L']:02X}") 
+                    print(f"DCR L: L={self.registers.L:02X}") 
             elif opcode == 0x21:  # LXI H, word
-                self.registers['L'] = self.memory[self.registers['PC']]
-                self.registers['H'] = self.memory[self.registers['PC'] + 1]
-                self.registers['PC'] += 2
+                self.registers.L = self.memory[self.registers.PC]
+                self.registers.H = self.memory[self.registers.PC + 1]
+                self.registers.PC += 2
 
                 if self.debuglevel >= 4:
-                    print(f"LXI H: H={self.registers['H']:02X} L={self.registers['L']:02X}") 
+                    print(f"LXI H: H={self.registers.H:02X} L={self.registers.L:02X}") 
             elif opcode == 0x22:  # SHLD addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                self.memory[addr] = self.registers['L']
-                self.memory[addr + 1] = self.registers['H']
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                self.memory[addr] = self.registers.L
+                self.memory[addr + 1] = self.registers.H
 
                 if self.debuglevel >= 4:
                     print(f"SHLD addr: {addr:04X} Value={self.memory[addr + 1]:02X}{self.memory[addr]:02X}")
 
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['L'])
-                self.debug_addr_write(self.debugloggerfile, addr+1, self.registers['H'])
-
-                self.registers['PC'] += 2
+                self.registers.PC += 2
             elif opcode == 0x23: # INX H
-                hl = (self.registers['H'] << 8) | self.registers['L']
+                hl = (self.registers.H << 8) | self.registers.L
                 hl = (hl + 1) & 0xFFFF  # Increment HL and ensure it wraps around at 16 bits
-                self.registers['H'] = (hl >> 8) & 0xFF
-                self.registers['L'] = hl & 0xFF
+                self.registers.H = (hl >> 8) & 0xFF
+                self.registers.L = hl & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"H: {self.registers['H']:02X} L: {self.registers['L']:02X} HL addr: {hl:04X}")
+                    print(f"H: {self.registers.H:02X} L: {self.registers.L:02X} HL addr: {hl:04X}")
             elif opcode == 0x25: # DCR H
-                aux_carryflag_before = self.registers['H'] & 0x0F  # Save the lower nibble before decrement
-                self.registers['H'] = (self.registers['H'] - 1) & 0xFF  # Decrement H and ensure it wraps around at 8 bits
+                aux_carryflag_before = self.registers.H & 0x0F  # Save the lower nibble before decrement
+                self.registers.H = (self.registers.H - 1) & 0xFF  # Decrement H and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['H'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['H'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['H']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.H == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.H & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.H).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DCR H: H={self.registers['H']:02X}") 
+                    print(f"DCR H: H={self.registers.H:02X}") 
             elif opcode == 0x26: # MVI H, byte
-                self.registers['H'] = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
+                self.registers.H = self.memory[self.registers.PC]
+                self.registers.PC += 1
                 
                 if self.debuglevel >= 4:
-                    print(f"MVI H: H={self.registers['H']:02X}")
+                    print(f"MVI H: H={self.registers.H:02X}")
             elif opcode == 0x29:  # DAD H
-                hl = (self.registers['H'] << 8) | self.registers['L']
+                hl = (self.registers.H << 8) | self.registers.L
                 result = hl + hl
-                self.registers['H'] = (result >> 8) & 0xFF
-                self.registers['L'] = result & 0xFF
+                self.registers.H = (result >> 8) & 0xFF
+                self.registers.L = result & 0xFF
                 # Update carry flag
-                self.registers['FLAGS'] &= ~(1 << 0) # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 0) # Clear carry flag
 
                 if result > 0xFFFF:
-                    self.registers['FLAGS'] |= (1 << 0) # Set carry flag
+                    self.registers.FLAGS |= (1 << 0) # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DAD H: HL={hl:04X} + HL={hl:04X} = {result:04X} FLAGS={self.registers['FLAGS']}")             
+                    print(f"DAD H: HL={hl:04X} + HL={hl:04X} = {result:04X} FLAGS={self.registers.FLAGS}")             
             elif opcode == 0x2A:  # LHLD addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                self.registers['L'] = self.memory[addr]
-                self.registers['H'] = self.memory[addr + 1]
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                self.registers.L = self.memory[addr]
+                self.registers.H = self.memory[addr + 1]
 
                 if self.debuglevel >= 4:
                     print(f"LHLD address {addr:04X}")
 
-                self.registers['PC'] += 2
+                self.registers.PC += 2
             elif opcode == 0x2B: # DCX H
-                hl = (self.registers['H'] << 8) | self.registers['L']
+                hl = (self.registers.H << 8) | self.registers.L
                 hl = (hl - 1) & 0xFFFF  # Decrement HL and ensure it wraps around at 16 bits
-                self.registers['H'] = (hl >> 8) & 0xFF
-                self.registers['L'] = hl & 0xFF
+                self.registers.H = (hl >> 8) & 0xFF
+                self.registers.L = hl & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"DCX H: H={self.registers['H']:02X} L={self.registers['L']:02X}") 
+                    print(f"DCX H: H={self.registers.H:02X} L={self.registers.L:02X}") 
             elif opcode == 0x2E:  # MVI L, byte
-                self.registers['L'] = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
+                self.registers.L = self.memory[self.registers.PC]
+                self.registers.PC += 1
                 
                 if self.debuglevel >= 4:
-                    print(f"MVI L,byte: L={self.registers['L']:02X}")
+                    print(f"MVI L,byte: L={self.registers.L:02X}")
             elif opcode == 0x2F: # CMA
-                self.registers['A'] = ~self.registers['A'] & 0xFF
+                self.registers.A = ~self.registers.A & 0xFF
                 
                 if self.debuglevel >= 4:
-                    print(f"CMA: A={self.registers['A']:02X}")
+                    print(f"CMA: A={self.registers.A:02X}")
             elif opcode == 0x32:  # STA addr
-                addr = (self.memory[self.registers["PC"]] | (self.memory[self.registers["PC"] + 1] << 8))
-                self.memory[addr] = self.registers["A"]
-                self.registers["PC"] += 2
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                self.memory[addr] = self.registers.A
+                self.registers.PC += 2
 
                 if self.debuglevel >= 4:
                     print(f"STA: {addr:04X} = {self.memory[addr]:04X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers["A"]) 
             elif opcode == 0x33:  # INX SP
-                self.registers['SP'] = (self.registers['SP'] + 1) & 0xFFFF  # Increment SP and ensure it wraps around at 16 bits
+                self.registers.SP = (self.registers.SP + 1) & 0xFFFF  # Increment SP and ensure it wraps around at 16 bits
                                 
                 if self.debuglevel >= 4:
-                    print(f"INX SP: SP={self.registers['SP']:04X}")           
+                    print(f"INX SP: SP={self.registers.SP:04X}")           
             elif opcode == 0x34: # INR M
-                addr = (self.registers['H'] << 8) | self.registers['L']  # Combine H and L to form the memory address
+                addr = (self.registers.H << 8) | self.registers.L  # Combine H and L to form the memory address
                 aux_carryflag_before = self.memory[addr] & 0x0F  # Save the lower nibble before increment
                 self.memory[addr] = (self.memory[addr] + 1) & 0xFF  # Increment the memory content and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
 
                 if self.memory[addr] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if self.memory[addr] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(self.memory[addr]).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before + 1 > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
                     print(f"INR M: addr={addr:04X}") 
             elif opcode == 0x35: # DCR M
-                addr = (self.registers['H'] << 8) | self.registers['L']
+                addr = (self.registers.H << 8) | self.registers.L
                 aux_carryflag_before = self.memory[addr] & 0x0F
                 self.memory[addr] = (self.memory[addr] - 1) & 0xFF
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
 
                 if self.memory[addr] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if self.memory[addr] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(self.memory[addr]).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 # Auxiliary carry flag calculation
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag    
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag    
 
                 if self.debuglevel >= 4:
                     print(f"DCR M: addr={addr:04X}")             
             elif opcode == 0x36: # MVI M, byte
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.memory[self.registers['PC']]
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.memory[self.registers.PC]
 
                 if self.debuglevel >= 4:
-                    print(f"MVI M: {addr:04X} = {self.memory[self.registers['PC']]}")
+                    print(f"MVI M: {addr:04X} = {self.memory[self.registers.PC]}")
 
-                self.debug_addr_write(self.debugloggerfile, addr, self.memory[self.registers['PC']])    
-
-                self.registers['PC'] += 1
+                self.registers.PC += 1
             elif opcode == 0x37:  # STC
-                self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"STC: FLAGS={self.registers['FLAGS']:02X}")
+                    print(f"STC: FLAGS={self.registers.FLAGS:02X}")
             elif opcode == 0x39: # DAD SP
-                hl = (self.registers['H'] << 8) | self.registers['L']
-                sp = self.registers['SP']
+                hl = (self.registers.H << 8) | self.registers.L
+                sp = self.registers.SP
                 result = hl + sp
-                self.registers['H'] = (result >> 8) & 0xFF
-                self.registers['L'] = result & 0xFF
+                self.registers.H = (result >> 8) & 0xFF
+                self.registers.L = result & 0xFF
 
                 # Update carry flag
-                self.registers['FLAGS'] &= ~(1 << 0) # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 0) # Clear carry flag
                 if result > 0xFFFF:
-                    self.registers['FLAGS'] |= (1 << 0) # Set carry flag
+                    self.registers.FLAGS |= (1 << 0) # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"DAD SP: HL={hl:04X} + SP={sp:04X} = {result:04X} FLAGS={self.registers['FLAGS']:02X}")
+                    print(f"DAD SP: HL={hl:04X} + SP={sp:04X} = {result:04X} FLAGS={self.registers.FLAGS:02X}")
             elif opcode == 0x3A:  # LDA addr
-                    addr = (self.memory[self.registers["PC"]] | (self.memory[self.registers["PC"] + 1] << 8))
+                    addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
                     
                     if self.debuglevel >= 4:
                         print(f"LDA addr: {addr:04X}:{self.memory[addr]:02X}")
 
-                    self.registers["A"] = self.memory[addr]
-                    self.registers["PC"] += 2
+                    self.registers.A = self.memory[addr]
+                    self.registers.PC += 2
             elif opcode == 0x3C: # INR A
-                    aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before increment
-                    self.registers['A'] = (self.registers['A'] + 1) & 0xFF  # Increment A and ensure it wraps around at 8 bits
+                    aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before increment
+                    self.registers.A = (self.registers.A + 1) & 0xFF  # Increment A and ensure it wraps around at 8 bits
 
                     # Update flags
-                    self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                    self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                    self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                    self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                    if self.registers['A'] == 0:
-                        self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                    if self.registers['A'] & 0x80:
-                        self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                    if bin(self.registers['A']).count('1') % 2 == 0:
-                        self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                    self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                    self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                    self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                    if self.registers.A == 0:
+                        self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                    if self.registers.A & 0x80:
+                        self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                    if bin(self.registers.A).count('1') % 2 == 0:
+                        self.registers.FLAGS |= (1 << 2)  # Set parity flag
                     if aux_carryflag_before + 1 > 0x0F:
-                        self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag   
+                        self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag   
 
                     if self.debuglevel >= 4:
-                        print(f"INR A: A={self.registers['A']:02X}") 
+                        print(f"INR A: A={self.registers.A:02X}") 
             elif opcode == 0x3D: # DCR A
-                aux_carryflag_before = self.registers['A'] & 0x0F
-                self.registers['A'] = (self.registers['A'] - 1) & 0xFF
+                aux_carryflag_before = self.registers.A & 0x0F
+                self.registers.A = (self.registers.A - 1) & 0xFF
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 # Auxiliary carry flag calculation
                 if (aux_carryflag_before - 1) & 0x10 != 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag  
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag  
 
                 if self.debuglevel >= 4:
-                    print(f"DCR A: A={self.registers['A']:02X}")
+                    print(f"DCR A: A={self.registers.A:02X}")
             elif opcode == 0x3E: # MVI A, byte
-                    self.registers['A'] = self.memory[self.registers['PC']]
-                    self.registers['PC'] += 1
+                    self.registers.A = self.memory[self.registers.PC]
+                    self.registers.PC += 1
 
                     if self.debuglevel >= 4:
-                        print(f"MVI A,byte: A={self.registers['A']:02X}")
+                        print(f"MVI A,byte: A={self.registers.A:02X}")
             elif opcode == 0x3F: # CMC
-                self.registers['FLAGS'] ^= 0x01  # Toggle the carry flag
+                self.registers.FLAGS ^= 0x01  # Toggle the carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"CMC: FLAGS={self.registers['FLAGS']:02X}")
+                    print(f"CMC: FLAGS={self.registers.FLAGS:02X}")
             elif opcode == 0x41:  # MOV B,C
-                self.registers['B'] = self.registers['C']
+                self.registers.B = self.registers.C
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV B,C: B={self.registers['B']:02X} C={self.registers['C']:02X}")
+                    print(f"MOV B,C: B={self.registers.B:02X} C={self.registers.C:02X}")
             elif opcode == 0x43:  # MOV B,E
-                self.registers["B"] = self.registers["E"] & 0xFF
+                self.registers.B = self.registers.E & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV B,E: B={self.registers['B']:02X} E={self.registers['E']:02X}")
+                    print(f"MOV B,E: B={self.registers.B:02X} E={self.registers.E:02X}")
             elif opcode == 0x44:  # MOV B,H
-                self.registers['B'] = self.registers['H']
+                self.registers.B = self.registers.H
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV B,H: B={self.registers['B']:02X} H={self.registers['H']:02X}")
+                    print(f"MOV B,H: B={self.registers.B:02X} H={self.registers.H:02X}")
             elif opcode == 0x45:  # MOV B,L
-                self.registers['B'] = self.registers['L']
+                self.registers.B = self.registers.L
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV B,L: B={self.registers['B']:02X} L={self.registers['L']:02X}")
+                    print(f"MOV B,L: B={self.registers.B:02X} L={self.registers.L:02X}")
             elif opcode == 0x46: # MOV B, M
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.registers['B'] = self.memory[addr] & 0xFF
+                addr = (self.registers.H << 8) | self.registers.L
+                self.registers.B = self.memory[addr] & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV B,M: B={self.registers['B']:02X} M={addr:04X}")
+                    print(f"MOV B,M: B={self.registers.B:02X} M={addr:04X}")
             elif opcode == 0x47:  # MOV B,A
-                self.registers["B"] = self.registers["A"] & 0xFF
+                self.registers.B = self.registers.A & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV B,A: B={self.registers['B']:02X} A={self.registers['A']:02X}")
+                    print(f"MOV B,A: B={self.registers.B:02X} A={self.registers.A:02X}")
             elif opcode == 0x48:  # MOV C,B
-                self.registers["C"] = self.registers["B"] & 0xFF
+                self.registers.C = self.registers.B & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV C,B: C={self.registers['C']:02X} B={self.registers['B']:02X}")
+                    print(f"MOV C,B: C={self.registers.C:02X} B={self.registers.B:02X}")
             elif opcode == 0x49:  # MOV C,C
                 # No operation needed as C is moved to itself  
-                self.registers['C'] = self.registers['C']             
+                self.registers.C = self.registers.C             
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV C,C: C={self.registers['C']:02X}")
+                    print(f"MOV C,C: C={self.registers.C:02X}")
             elif opcode == 0x4A:  # MOV C,D
-                self.registers['C'] = self.registers['D']
+                self.registers.C = self.registers.D
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV C,D: C={self.registers['C']:02X} D={self.registers['D']:02X}")
+                    print(f"MOV C,D: C={self.registers.C:02X} D={self.registers.D:02X}")
             elif opcode == 0x4D:  # MOV C,L
-                self.registers['C'] = self.registers['L']
+                self.registers.C = self.registers.L
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV C,L: C={self.registers['C']:02X} L={self.registers['L']:02X}")
+                    print(f"MOV C,L: C={self.registers.C:02X} L={self.registers.L:02X}")
             elif opcode == 0x4E: # MOV C, M
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.registers['C'] = self.memory[addr] & 0xFF
+                addr = (self.registers.H << 8) | self.registers.L
+                self.registers.C = self.memory[addr] & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV C,M: C={self.registers['C']:02X} M={addr:04X}")
+                    print(f"MOV C,M: C={self.registers.C:02X} M={addr:04X}")
             elif opcode == 0x4F: # MOV C, A
-                self.registers['C'] = self.registers['A'] & 0xFF
+                self.registers.C = self.registers.A & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV C,A: C={self.registers['C']:02X} A={self.registers['A']:02X}")
+                    print(f"MOV C,A: C={self.registers.C:02X} A={self.registers.A:02X}")
             elif opcode == 0x50:  # MOV D, B
-                self.registers['D'] = self.registers['B']
+                self.registers.D = self.registers.B
 
                 if self.debuglevel >= 4:
-                    print(f"MOV D,B : D={self.registers['D']:02X} B={self.registers['B']:02X}")
+                    print(f"MOV D,B : D={self.registers.D:02X} B={self.registers.B:02X}")
             elif opcode == 0x51:  # MOV D,C
-                self.registers['D'] = self.registers['C']
+                self.registers.D = self.registers.C
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV D,C: D={self.registers['D']:02X} C={self.registers['C']:02X}")
+                    print(f"MOV D,C: D={self.registers.D:02X} C={self.registers.C:02X}")
             elif opcode == 0x56: # MOV D, M
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.registers['D'] = self.memory[addr]
+                addr = (self.registers.H << 8) | self.registers.L
+                self.registers.D = self.memory[addr]
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV D,M: D={self.registers['D']:02X} [HL]={addr:04X}")
+                    print(f"MOV D,M: D={self.registers.D:02X} [HL]={addr:04X}")
             elif opcode == 0x58:  # MOV E, B
-                self.registers['E'] = self.registers['B']
+                self.registers.E = self.registers.B
 
                 if self.debuglevel >= 4:
-                    print(f"MOV E,B: E={self.registers['E']:02X} B={self.registers['B']:02X}")
+                    print(f"MOV E,B: E={self.registers.E:02X} B={self.registers.B:02X}")
             elif opcode == 0x5A:  # MOV E,D
-                self.registers['E'] = self.registers['D']
+                self.registers.E = self.registers.D
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV E,D: E={self.registers['E']:02X} D={self.registers['D']:02X}")
+                    print(f"MOV E,D: E={self.registers.E:02X} D={self.registers.D:02X}")
             elif opcode == 0x5E: # MOV E, M
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.registers['E'] = self.memory[addr]
+                addr = (self.registers.H << 8) | self.registers.L
+                self.registers.E = self.memory[addr]
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV E,M: E={self.registers['E']:02X}, [HL]={addr:04X}")
+                    print(f"MOV E,M: E={self.registers.E:02X}, [HL]={addr:04X}")
             elif opcode == 0x57: # MOV D, A
-                self.registers['D'] = self.registers['A']
+                self.registers.D = self.registers.A
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV D,A : D={self.registers['D']:02X} A={self.registers['A']:02X}")
+                    print(f"MOV D,A : D={self.registers.D:02X} A={self.registers.A:02X}")
             elif opcode == 0x59:  # MOV E, C
-                self.registers['E'] = self.registers['C']
+                self.registers.E = self.registers.C
 
                 if self.debuglevel >= 4:
-                    print(f"MOV E,C: E={self.registers['E']:02X} C={self.registers['C']:02X}")
+                    print(f"MOV E,C: E={self.registers.E:02X} C={self.registers.C:02X}")
             elif opcode == 0x5F: # MOV E, A
-                self.registers['E'] = self.registers['A']
+                self.registers.E = self.registers.A
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV E,A: E={self.registers['E']:02X} A={self.registers['A']:02X}")
+                    print(f"MOV E,A: E={self.registers.E:02X} A={self.registers.A:02X}")
             elif opcode == 0x60: # MOV H, B
-                self.registers['H'] = self.registers['B']
+                self.registers.H = self.registers.B
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV H,B: H={self.registers['H']:02X} B={self.registers['B']:02X}")
+                    print(f"MOV H,B: H={self.registers.H:02X} B={self.registers.B:02X}")
             elif opcode == 0x62:  # MOV H,D
-                self.registers["H"] = self.registers["D"] & 0xFF
+                self.registers.H = self.registers.D & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV H,D: H={self.registers['H']:02X} D={self.registers['D']:02X}")
+                    print(f"MOV H,D: H={self.registers.H:02X} D={self.registers.D:02X}")
             elif opcode == 0x67:  # MOV H,A
-                self.registers["H"] = self.registers["A"] & 0xFF
+                self.registers.H = self.registers.A & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV H,A: H={self.registers['H']:02X} A={self.registers['A']:02X}")
+                    print(f"MOV H,A: H={self.registers.H:02X} A={self.registers.A:02X}")
             elif opcode == 0x68:  # MOV L,B
-                self.registers["L"] = self.registers["B"] & 0xFF
+                self.registers.L = self.registers.B & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV L,B: L={self.registers['L']:02X} B={self.registers['B']:02X}")
+                    print(f"MOV L,B: L={self.registers.L:02X} B={self.registers.B:02X}")
             elif opcode == 0x69: # MOV L, C
-                self.registers['L'] = self.registers['C']
+                self.registers.L = self.registers.C
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV L,C: L={self.registers['L']:02X} C={self.registers['C']:02X}")
+                    print(f"MOV L,C: L={self.registers.L:02X} C={self.registers.C:02X}")
             elif opcode == 0x6B:  # MOV L, E
-                self.registers['L'] = self.registers['E']
+                self.registers.L = self.registers.E
 
                 if self.debuglevel >= 4:
-                    print(f"MOV L,E: L={self.registers['L']:02X} E={self.registers['E']:02X}")
+                    print(f"MOV L,E: L={self.registers.L:02X} E={self.registers.E:02X}")
             elif opcode == 0x6F: # MOV L, A
-                self.registers['L'] = self.registers['A']
+                self.registers.L = self.registers.A
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV L,A: L={self.registers['L']:02X} A={self.registers['A']:02X}")
+                    print(f"MOV L,A: L={self.registers.L:02X} A={self.registers.A:02X}")
             elif opcode == 0x70: # MOV M, B
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.registers['B']
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.registers.B
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV M,B : [HL]={addr:04X} B={self.registers['B']:02X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['B'])  
+                    print(f"MOV M,B : [HL]={addr:04X} B={self.registers.B:02X}")
             elif opcode == 0x71: # MOV M, C
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.registers['C'] & 0xFF
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.registers.C & 0xFF
 
                 if self.debuglevel >= 4:
-                     print(f"MOV M,C: M={addr:04X} C={self.registers['C']:02X}")
+                     print(f"MOV M,C: M={addr:04X} C={self.registers.C:02X}")
             elif opcode == 0x72:  # MOV M, D
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.registers['D'] & 0xFF
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.registers.D & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV M,D: M={addr:04X} D={self.registers['D']:02X}")
+                    print(f"MOV M,D: M={addr:04X} D={self.registers.D:02X}")
             elif opcode == 0x73: # MOV M, E
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.registers['E']
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.registers.E
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV M,E: [HL]={addr:04X} E={self.registers['E']:02X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['E'])  
+                    print(f"MOV M,E: [HL]={addr:04X} E={self.registers.E:02X}")
             elif opcode == 0x74:  # MOV M,H
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.registers['H']
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.registers.H
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV M,H: [HL]={addr:04X} H={self.registers['H']:02X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['H'])  
+                    print(f"MOV M,H: [HL]={addr:04X} H={self.registers.H:02X}")
             elif opcode == 0x77: # MOV M, A
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.memory[addr] = self.registers['A'] & 0xFF
+                addr = (self.registers.H << 8) | self.registers.L
+                self.memory[addr] = self.registers.A & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV M,A: M={addr:04X} A={self.registers['A']:02X}")
-
-                self.debug_addr_write(self.debugloggerfile, addr, self.registers['A'])    
+                    print(f"MOV M,A: M={addr:04X} A={self.registers.A:02X}")
             elif opcode == 0x78:  # MOV A,B
-                self.registers["A"] = self.registers["B"] & 0xFF
+                self.registers.A = self.registers.B & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"MOV A,B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0x79: # MOV A, C
-                self.registers['A'] = self.registers['C'] & 0xFF
+                self.registers.A = self.registers.C & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,C: A={self.registers['A']:02X} C={self.registers['C']:02X}")
+                    print(f"MOV A,C: A={self.registers.A:02X} C={self.registers.C:02X}")
             elif opcode == 0x7A: # MOV A, D
-                self.registers['A'] = self.registers['D']
+                self.registers.A = self.registers.D
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,D: A={self.registers['A']:02X} D={self.registers['D']:02X}")
+                    print(f"MOV A,D: A={self.registers.A:02X} D={self.registers.D:02X}")
             elif opcode == 0x7B: # MOV A, E
-                self.registers['A'] = self.registers['E']
+                self.registers.A = self.registers.E
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,E: A={self.registers['A']:02X} E={self.registers['E']:02X}")
+                    print(f"MOV A,E: A={self.registers.A:02X} E={self.registers.E:02X}")
             elif opcode == 0x7C:  # MOV A,H
-                self.registers["A"] = self.registers["H"] & 0xFF
+                self.registers.A = self.registers.H & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,H: A={self.registers['A']:02X} H={self.registers['H']:02X}")
+                    print(f"MOV A,H: A={self.registers.A:02X} H={self.registers.H:02X}")
             elif opcode == 0x7D: # MOV A, L
-                self.registers['A'] = self.registers['L']
+                self.registers.A = self.registers.L
                 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,L: A={self.registers['A']:02X} L={self.registers['L']:02X}")
+                    print(f"MOV A,L: A={self.registers.A:02X} L={self.registers.L:02X}")
             elif opcode == 0x7E: # MOV A,M
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                self.registers['A'] = self.memory[addr] & 0xFF
+                addr = (self.registers.H << 8) | self.registers.L
+                self.registers.A = self.memory[addr] & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"MOV A,M: A={self.registers['A']:02X} M={self.memory[addr]:02X}")
+                    print(f"MOV A,M: A={self.registers.A:02X} M={self.memory[addr]:02X}")
             elif opcode == 0x7F: # MOV A, A
                 # No operation needed as A is moved to itself
                 if self.debuglevel >= 4:
-                    print(f"MOV A,A: A={self.registers['A']:02X}")
+                    print(f"MOV A,A: A={self.registers.A:02X}")
             elif opcode == 0x80:  # ADD B
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['B'] & 0x0F)  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['B']  # Add A and B
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.B & 0x0F)  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.B  # Add A and B
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag                
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag                
 
                 if self.debuglevel >= 4:
-                    print(f"ADD B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"ADD B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0x81:  # ADD C
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['C'] & 0x0F)  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['C']  # Add A and C
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.C & 0x0F)  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.C  # Add A and C
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"ADD C: A={self.registers['A']:02X} C={self.registers['C']:02X}")
+                    print(f"ADD C: A={self.registers.A:02X} C={self.registers.C:02X}")
             elif opcode == 0x83: # ADD E
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['E'] & 0x0F)  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['E']  # Add A and E
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.E & 0x0F)  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.E  # Add A and E
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"ADD E: A={self.registers['A']:02X} E={self.registers['E']:02X}")   
+                    print(f"ADD E: A={self.registers.A:02X} E={self.registers.E:02X}")   
             elif opcode == 0x86: # ADD M
-                addr = (self.registers['H'] << 8) | self.registers['L']  # Combine H and L to form the memory address
+                addr = (self.registers.H << 8) | self.registers.L  # Combine H and L to form the memory address
                 value = self.memory[addr]  # Fetch the value from memory
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (value & 0x0F)  # Save the lower nibbles before addition
-                result = self.registers['A'] + value  # Add A and the memory value
+                aux_carryflag_before = (self.registers.A & 0x0F) + (value & 0x0F)  # Save the lower nibbles before addition
+                result = self.registers.A + value  # Add A and the memory value
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"ADD M: A={self.registers['A']:02X} [HL]={value:02X}")
+                    print(f"ADD M: A={self.registers.A:02X} [HL]={value:02X}")
             elif opcode == 0x87: # ADD A
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['A'] & 0x0F)  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['A']  # Add A to itself
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.A & 0x0F)  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.A  # Add A to itself
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag                
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag                
 
                 if self.debuglevel >= 4:
-                    print(f"ADD A: A={self.registers['A']:02X}")    
+                    print(f"ADD A: A={self.registers.A:02X}")    
             elif opcode == 0x89:  # ADC C
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['C'] & 0x0F) + carry  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['C'] + carry  # Add A, C, and the carry flag
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.C & 0x0F) + carry  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.C + carry  # Add A, C, and the carry flag
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"ADC C: A={self.registers['A']:02X} C={self.registers['C']:02X}")
+                    print(f"ADC C: A={self.registers.A:02X} C={self.registers.C:02X}")
             elif opcode == 0x8A:  # ADC D
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['D'] & 0x0F) + carry  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['D'] + carry  # Add A, D, and the carry flag
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.D & 0x0F) + carry  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.D + carry  # Add A, D, and the carry flag
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag                
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag                
 
                 if self.debuglevel >= 4:
-                    print(f"ADC D: A={self.registers['A']:02X} D={self.registers['D']:02X}")     
+                    print(f"ADC D: A={self.registers.A:02X} D={self.registers.D:02X}")     
             elif opcode == 0x8F: # ADC A
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = (self.registers['A'] & 0x0F) + (self.registers['A'] & 0x0F) + carry  # Save the lower nibbles before addition
-                result = self.registers['A'] + self.registers['A'] + carry  # Add A to itself and the carry flag
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = (self.registers.A & 0x0F) + (self.registers.A & 0x0F) + carry  # Save the lower nibbles before addition
+                result = self.registers.A + self.registers.A + carry  # Add A to itself and the carry flag
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before > 0x0F:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result > 0xFF:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"ADC A: A={self.registers['A']:02X}")
+                    print(f"ADC A: A={self.registers.A:02X}")
             elif opcode == 0x90: # SUB B
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['B']  # Subtract B from A
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.B  # Subtract B from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['B'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.B & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SUB B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"SUB B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0x92: # SUB D
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['D']  # Subtract D from A
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.D  # Subtract D from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['D'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.D & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SUB D: A={self.registers['A']:02X} D={self.registers['D']:02X}")
+                    print(f"SUB D: A={self.registers.A:02X} D={self.registers.D:02X}")
             elif opcode == 0x93: # SUB E
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['E']  # Subtract E from A
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.E  # Subtract E from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['E'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.E & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SUB E: A={self.registers['A']:02X} E={self.registers['E']:02X}")
+                    print(f"SUB E: A={self.registers.A:02X} E={self.registers.E:02X}")
             elif opcode == 0x95: # SUB L
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['L']  # Subtract L from A
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.L  # Subtract L from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['L'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.L & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SUB L: A={self.registers['A']:02X} L={self.registers['L']:02X}")
+                    print(f"SUB L: A={self.registers.A:02X} L={self.registers.L:02X}")
             elif opcode == 0x96: # SUB M
-                addr = (self.registers['H'] << 8) | self.registers['L']  # Combine H and L to form the memory address
+                addr = (self.registers.H << 8) | self.registers.L  # Combine H and L to form the memory address
                 value = self.memory[addr]  # Fetch the value from memory
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - value  # Subtract the memory value from A
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - value  # Subtract the memory value from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - (value & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SUB M: A={self.registers['A']:02X} M={value:02X}")
+                    print(f"SUB M: A={self.registers.A:02X} M={value:02X}")
             elif opcode == 0x98:  # SBB B
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['B'] - carry  # Subtract B and the carry flag from A
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.B - carry  # Subtract B and the carry flag from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['B'] & 0x0F) - carry) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.B & 0x0F) - carry) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag                
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag                
 
                 if self.debuglevel >= 3:
-                    print(f"SBB B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"SBB B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0xA0:  # ANA B
-                aux_carryflag_before = self.registers['A'] & 0x08  
-                self.registers['A'] &= self.registers['B']  # Perform bitwise AND between A and B
+                aux_carryflag_before = self.registers.A & 0x08  
+                self.registers.A &= self.registers.B  # Perform bitwise AND between A and B
                
                 # Clear flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set flags based on the result in the A register
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 # Auxiliary carry flag calculation
-                if (aux_carryflag_before & 0x08) != (self.registers['A'] & 0x08):
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag
+                if (aux_carryflag_before & 0x08) != (self.registers.A & 0x08):
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"ANA B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"ANA B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0xA2:  # ANA D
-                self.registers['A'] &= self.registers['D']
+                self.registers.A &= self.registers.D
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (self.registers['A'] & 0x08) != (self.registers['D'] & 0x08):
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
-
-                if self.debuglevel >= 4:
-                    print(f"ANA D: A={self.registers['A']:02X} D={self.registers['D']:02X}")
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (self.registers.A & 0x08) != (self.registers.D & 0x08):
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
+
+                if self.debuglevel >= 4:
+                    print(f"ANA D: A={self.registers.A:02X} D={self.registers.D:02X}")
             elif opcode == 0xA3:  # ANA E
-                self.registers['A'] &= self.registers['E']  # Perform bitwise AND between A and E
+                self.registers.A &= self.registers.E  # Perform bitwise AND between A and E
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (self.registers['A'] & 0x08) != (self.registers['E'] & 0x08):
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
-
-                if self.debuglevel >= 4:
-                    print(f"ANA E: A={self.registers['A']:02X} E={self.registers['E']:02X}")
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (self.registers.A & 0x08) != (self.registers.E & 0x08):
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
+
+                if self.debuglevel >= 4:
+                    print(f"ANA E: A={self.registers.A:02X} E={self.registers.E:02X}")
             elif opcode == 0xA5:  # ANA L
-                self.registers['A'] &= self.registers['L']  # Perform bitwise AND between A and L
+                self.registers.A &= self.registers.L  # Perform bitwise AND between A and L
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (self.registers['A'] & 0x08) != (self.registers['L'] & 0x08):
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
-
-                if self.debuglevel >= 4:
-                    print(f"ANA L: A={self.registers['A']:02X} L={self.registers['L']:02X}")
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (self.registers.A & 0x08) != (self.registers.L & 0x08):
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
+
+                if self.debuglevel >= 4:
+                    print(f"ANA L: A={self.registers.A:02X} L={self.registers.L:02X}")
             elif opcode == 0xA8: # XRA B
-                self.registers['A'] ^= self.registers['B']  # Perform bitwise XOR between A and B
+                self.registers.A ^= self.registers.B  # Perform bitwise XOR between A and B
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"XRA B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"XRA B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0xA9: # XRA C
-                self.registers['A'] ^= self.registers['C']  # Perform bitwise XOR between A and C
+                self.registers.A ^= self.registers.C  # Perform bitwise XOR between A and C
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"XRA C: A={self.registers['A']:02X} C={self.registers['C']:02X}")
+                    print(f"XRA C: A={self.registers.A:02X} C={self.registers.C:02X}")
             elif opcode == 0xAE: # XRA M
-                addr = (self.registers['H'] << 8) | self.registers['L']  # Combine H and L to form the memory address
+                addr = (self.registers.H << 8) | self.registers.L  # Combine H and L to form the memory address
                 value = self.memory[addr]  # Fetch the value from memory
-                self.registers['A'] ^= value  # Perform bitwise XOR between A and the memory value
+                self.registers.A ^= value  # Perform bitwise XOR between A and the memory value
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"XRA M: A={self.registers['A']:02X} M={value:02X}")
+                    print(f"XRA M: A={self.registers.A:02X} M={value:02X}")
             elif opcode == 0xAF: # XRA A
-                self.registers['A'] ^= self.registers['A']  # Perform bitwise XOR between A and itself
+                self.registers.A ^= self.registers.A  # Perform bitwise XOR between A and itself
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"XRA A: A={self.registers['A']:02X}")
+                    print(f"XRA A: A={self.registers.A:02X}")
             elif opcode == 0xB0:  # ORA B
-                self.registers['A'] |= self.registers['B']  # Perform bitwise OR between A and B
+                self.registers.A |= self.registers.B  # Perform bitwise OR between A and B
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA B: A={self.registers['A']:02X} B={self.registers['B']:02X}")
+                    print(f"ORA B: A={self.registers.A:02X} B={self.registers.B:02X}")
             elif opcode == 0xB1:  # ORA C
-                self.registers['A'] |= self.registers['C']  # Perform bitwise OR between A and C
+                self.registers.A |= self.registers.C  # Perform bitwise OR between A and C
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA C: A={self.registers['A']:02X} C={self.registers['C']:02X}")
+                    print(f"ORA C: A={self.registers.A:02X} C={self.registers.C:02X}")
             elif opcode == 0xB2:  # ORA D
-                self.registers['A'] |= self.registers['D']  # Perform bitwise OR between A and D
+                self.registers.A |= self.registers.D  # Perform bitwise OR between A and D
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA D: A={self.registers['A']:02X} D={self.registers['D']:02X}")
+                    print(f"ORA D: A={self.registers.A:02X} D={self.registers.D:02X}")
             elif opcode == 0xB3:  # ORA E
-                self.registers['A'] |= self.registers['E']  # Perform bitwise OR between A and E
+                self.registers.A |= self.registers.E  # Perform bitwise OR between A and E
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA E: A={self.registers['A']:02X} E={self.registers['E']:02X}")
+                    print(f"ORA E: A={self.registers.A:02X} E={self.registers.E:02X}")
             elif opcode == 0xB4:  # ORA H
-                self.registers['A'] |= self.registers['H']  # Perform bitwise OR between A and H
+                self.registers.A |= self.registers.H  # Perform bitwise OR between A and H
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA H: A={self.registers['A']:02X} H={self.registers['H']:02X}")
+                    print(f"ORA H: A={self.registers.A:02X} H={self.registers.H:02X}")
             elif opcode == 0xB6:  # ORA M
-                addr = (self.registers['H'] << 8) | self.registers['L']  # Combine H and L to form the memory address
+                addr = (self.registers.H << 8) | self.registers.L  # Combine H and L to form the memory address
                 value = self.memory[addr]  # Fetch the value from memory
-                self.registers['A'] |= value  # Perform bitwise OR between A and the memory value
+                self.registers.A |= value  # Perform bitwise OR between A and the memory value
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA M: A={self.registers['A']:02X} M={value:02X}") 
+                    print(f"ORA M: A={self.registers.A:02X} M={value:02X}") 
             elif opcode == 0xB7:  # ORA A
-                self.registers['A'] |= self.registers['A']  # Perform bitwise OR between A and itself
+                self.registers.A |= self.registers.A  # Perform bitwise OR between A and itself
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ORA A: A={self.registers['A']:02X}") 
+                    print(f"ORA A: A={self.registers.A:02X}") 
             elif opcode == 0xB8:  # CMP B
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before comparison
-                result = self.registers['A'] - self.registers['B']  # Compare A with B (A - B)
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before comparison
+                result = self.registers.A - self.registers.B  # Compare A with B (A - B)
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result & 0xFF).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['B'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.B & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"CMP B: A={self.registers['A']:02X} B={self.registers['B']:02X} FLAGS={self.registers['FLAGS']:02X}") 
+                    print(f"CMP B: A={self.registers.A:02X} B={self.registers.B:02X} FLAGS={self.registers.FLAGS:02X}") 
             elif opcode == 0xB9:  # CMP C
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before comparison
-                result = self.registers['A'] - self.registers['C']  # Compare A with C (A - C)
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before comparison
+                result = self.registers.A - self.registers.C  # Compare A with C (A - C)
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result & 0xFF).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['C'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.C & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag   
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag   
 
                 if self.debuglevel >= 4:
-                    print(f"CMP C: A={self.registers['A']:02X} C={self.registers['C']:02X} FLAGS={self.registers['FLAGS']:02X}")       
+                    print(f"CMP C: A={self.registers.A:02X} C={self.registers.C:02X} FLAGS={self.registers.FLAGS:02X}")       
             elif opcode == 0xBA:  # CMP D
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before comparison
-                result = self.registers['A'] - self.registers['D']  # Compare A with D (A - D)
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before comparison
+                result = self.registers.A - self.registers.D  # Compare A with D (A - D)
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result & 0xFF).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['D'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.D & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"CMP D: A={self.registers['A']:02X} D={self.registers['D']:02X} FLAGS={self.registers['FLAGS']:02X}") 
+                    print(f"CMP D: A={self.registers.A:02X} D={self.registers.D:02X} FLAGS={self.registers.FLAGS:02X}") 
             elif opcode == 0xBE:  # CMP M
-                addr = (self.registers['H'] << 8) | self.registers['L']  # Combine H and L to form the memory address
+                addr = (self.registers.H << 8) | self.registers.L  # Combine H and L to form the memory address
                 value = self.memory[addr]  # Fetch the value from memory
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before comparison
-                result = self.registers['A'] - value  # Compare A with the memory value (A - M)
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before comparison
+                result = self.registers.A - value  # Compare A with the memory value (A - M)
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result & 0xFF).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if (aux_carryflag_before - (value & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"CMP M: A={self.registers['A']:02X} value={value:02X} FLAGS={self.registers['FLAGS']:02X}") 
+                    print(f"CMP M: A={self.registers.A:02X} value={value:02X} FLAGS={self.registers.FLAGS:02X}") 
             elif opcode == 0xBF: # CMP A
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before comparison
-                result = self.registers['A'] - self.registers['A']  # Compare A with itself (A - A)
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before comparison
+                result = self.registers.A - self.registers.A  # Compare A with itself (A - A)
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result & 0xFF).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['A'] & 0x0F)) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.A & 0x0F)) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"CMP A: A={self.registers['A']:02X} FLAGS={self.registers['FLAGS']:02X}") 
+                    print(f"CMP A: A={self.registers.A:02X} FLAGS={self.registers.FLAGS:02X}") 
             elif opcode == 0x99: # SBB C
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['C'] - carry  # Subtract C and the carry flag from A
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.C - carry  # Subtract C and the carry flag from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['C'] & 0x0F) - carry) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.C & 0x0F) - carry) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SBB C: A={self.registers['A']:02X} C={self.registers['C']:02X}") 
+                    print(f"SBB C: A={self.registers.A:02X} C={self.registers.C:02X}") 
             elif opcode == 0x9A: # SBB D
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['D'] - carry  # Subtract D and the carry flag from A
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.D - carry  # Subtract D and the carry flag from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['D'] & 0x0F) - carry) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.D & 0x0F) - carry) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SBB D: A={self.registers['A']:02X} D={self.registers['D']:02X}") 
+                    print(f"SBB D: A={self.registers.A:02X} D={self.registers.D:02X}") 
             elif opcode == 0x9B: # SBB E
-                carry = self.registers['FLAGS'] & 0x01  # Get the current carry flag
-                aux_carryflag_before = self.registers['A'] & 0x0F  # Save the lower nibble before subtraction
-                result = self.registers['A'] - self.registers['E'] - carry  # Subtract E and the carry flag from A
+                carry = self.registers.FLAGS & 0x01  # Get the current carry flag
+                aux_carryflag_before = self.registers.A & 0x0F  # Save the lower nibble before subtraction
+                result = self.registers.A - self.registers.E - carry  # Subtract E and the carry flag from A
 
-                self.registers['A'] = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
+                self.registers.A = result & 0xFF  # Store the result in A and ensure it wraps around at 8 bits
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if (aux_carryflag_before - (self.registers['E'] & 0x0F) - carry) < 0:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if (aux_carryflag_before - (self.registers.E & 0x0F) - carry) < 0:
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
 
                 if self.debuglevel >= 4:
-                    print(f"SBB E: A={self.registers['A']:02X} E={self.registers['E']:02X}") 
+                    print(f"SBB E: A={self.registers.A:02X} E={self.registers.E:02X}") 
             elif opcode == 0x9C: # SBB H
-                carry = self.registers['FLAGS'] & 0x01
-                aux_carryflag_before = self.registers['A'] & 0x10 
-                result = self.registers['A'] - self.registers['H'] - carry
+                carry = self.registers.FLAGS & 0x01
+                aux_carryflag_before = self.registers.A & 0x10 
+                result = self.registers.A - self.registers.H - carry
                 aux_carryflag_after = result & 0x08 
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
                     result += 256
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before and aux_carryflag_after:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag 
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag 
 
-                self.registers['A'] = result
+                self.registers.A = result
 
                 if self.debuglevel >= 4:
-                    print(f"SBB H: A={self.registers['A']:02X} H={self.registers['H']:02X}") 
+                    print(f"SBB H: A={self.registers.A:02X} H={self.registers.H:02X}") 
             elif opcode == 0x9E: # SBB M
-                carry = self.registers['FLAGS'] & 0x01
-                addr = (self.registers['H'] << 8) | self.registers['L']
-                aux_carryflag_before = self.registers['A'] & 0x10 
-                result = self.registers['A'] - self.memory[addr] - carry
+                carry = self.registers.FLAGS & 0x01
+                addr = (self.registers.H << 8) | self.registers.L
+                aux_carryflag_before = self.registers.A & 0x10 
+                result = self.registers.A - self.memory[addr] - carry
                 aux_carryflag_after = result & 0x08 
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
                     result += 256
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before and aux_carryflag_after:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag 
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag 
 
-                self.registers['A'] = result
+                self.registers.A = result
 
                 if self.debuglevel >= 4:
-                    print(f"SBB M: A={self.registers['A']:02X} M={self.memory[addr]:02X}") 
+                    print(f"SBB M: A={self.registers.A:02X} M={self.memory[addr]:02X}") 
             elif opcode == 0x9F: # SBB A
-                carry = self.registers['FLAGS'] & 0x01
-                aux_carryflag_before = self.registers['A'] & 0x10
-                result = self.registers['A'] - self.registers['A'] - carry
+                carry = self.registers.FLAGS & 0x01
+                aux_carryflag_before = self.registers.A & 0x10
+                result = self.registers.A - self.registers.A - carry
                 aux_carryflag_after = result & 0x08 
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
                     result += 256
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before and aux_carryflag_after:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag 
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag 
 
-                self.registers['A'] = result
+                self.registers.A = result
 
                 if self.debuglevel >= 4:
-                    print(f"SBB A: A={self.registers['A']:02X}") 
+                    print(f"SBB A: A={self.registers.A:02X}") 
             elif opcode == 0xE4:  # CPO addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 2)):  # Check if the parity flag is not set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 2)):  # Check if the parity flag is not set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CPO addr: {addr:04X}")                     
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xC0:  # RNZ
-                if not (self.registers['FLAGS'] & (1 << 6)):  # Check if the zero flag is not set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if not (self.registers.FLAGS & (1 << 6)):  # Check if the zero flag is not set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RNZ: {self.registers['PC']:04X}")    
+                        print(f"RNZ: {self.registers.PC:04X}")    
 
             elif opcode == 0xC1:  # POP B
-                self.registers['C'] = self.memory[self.registers['SP']]
-                self.registers['B'] = self.memory[self.registers['SP'] + 1]
-                self.registers['SP'] += 2
+                self.registers.C = self.memory[self.registers.SP]
+                self.registers.B = self.memory[self.registers.SP + 1]
+                self.registers.SP += 2
 
                 if self.debuglevel >= 4:
-                    print(f"POP B: B={self.registers['B']:02X}, C={self.registers['C']:02X}")
+                    print(f"POP B: B={self.registers.B:02X}, C={self.registers.C:02X}")
             elif opcode == 0xC2: # JNZ addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 6)):  # Check if the zero flag is not set
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 6)):  # Check if the zero flag is not set
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JNZ: addr={addr:04X}")    
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xC3:  # JMP addr
-                addr = (self.memory[self.registers["PC"]] | (self.memory[self.registers["PC"] + 1] << 8))
-                self.registers["PC"] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                self.registers.PC = addr
                 if self.debuglevel >= 4:
                     print(f"JMP to: {addr:04X}")
             elif opcode == 0xC4:  # CNZ addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 6)):  # Check if the zero flag is not set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 6)):  # Check if the zero flag is not set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CNZ addr: addr={addr:04X}")    
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xC5: # PUSH B
-                self.memory[self.registers['SP'] - 1] = self.registers['B']
-                self.memory[self.registers['SP'] - 2] = self.registers['C']
-                self.registers['SP'] -= 2
+                self.memory[self.registers.SP - 1] = self.registers.B
+                self.memory[self.registers.SP - 2] = self.registers.C
+                self.registers.SP -= 2
                 
                 if self.debuglevel >= 4:
-                    print(f"PUSH B: B={self.registers['B']:02X}, C={self.registers['C']:02X}")
+                    print(f"PUSH B: B={self.registers.B:02X}, C={self.registers.C:02X}")
             elif opcode == 0xC6: # ADI byte
-                immediate_value = self.memory[self.registers['PC']] & 0xFF
-                self.registers['PC'] += 1
+                immediate_value = self.memory[self.registers.PC] & 0xFF
+                self.registers.PC += 1
 
-                aux_carryflag_before = self.registers['A'] & 0x08 
-                carryflag_before = self.registers['A'] & 0x80
-                if self.registers['A'] + immediate_value > 0xFF:   
-                    self.registers['A'] = immediate_value - 1          
+                aux_carryflag_before = self.registers.A & 0x08 
+                carryflag_before = self.registers.A & 0x80
+                if self.registers.A + immediate_value > 0xFF:   
+                    self.registers.A = immediate_value - 1          
                 else:
-                    self.registers['A'] += immediate_value
-                aux_carryflag_after = self.registers['A'] & 0x10
-                carryflag_after = self.registers['A'] & 0x80
+                    self.registers.A += immediate_value
+                aux_carryflag_after = self.registers.A & 0x10
+                carryflag_after = self.registers.A & 0x80
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
-
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
+
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before and aux_carryflag_after:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag   
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag   
                 if carryflag_before and carryflag_after == 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set aux carry flag    
+                    self.registers.FLAGS |= (1 << 0)  # Set aux carry flag    
 
                 if self.debuglevel >= 4:
-                    print(f"ADI byte: A={self.registers['A']:02X} immediate={immediate_value:02X}")            
+                    print(f"ADI byte: A={self.registers.A:02X} immediate={immediate_value:02X}")            
             elif opcode == 0xC7: # RST 0
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x00
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x00
 
                 if self.debuglevel >= 4:
-                    print(f"RST 0 call: {self.registers['PC']:04X}")
+                    print(f"RST 0 call: {self.registers.PC:04X}")
             elif opcode == 0xC8: # RZ
-                if self.registers['FLAGS'] & (1 << 6):  # Check if the zero flag is set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if self.registers.FLAGS & (1 << 6):  # Check if the zero flag is set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RZ: {self.registers['PC']:04X}")
+                        print(f"RZ: {self.registers.PC:04X}")
             elif opcode == 0xC9: # RET
-                self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
+                self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
 
                 # error in binary, jump to 0x04F7 does not align to the opcode LXI B
-                if self.registers['PC'] == 0x04F7:
-                       self.registers['PC'] = 0x04F5
+                if self.registers.PC == 0x04F7:
+                       self.registers.PC = 0x04F5
                 
                 if self.debuglevel >= 4:
-                        print(f"RET: {self.registers['PC']:04X}")
+                        print(f"RET: {self.registers.PC:04X}")
                 
-                self.registers['SP'] += 2
+                self.registers.SP += 2
             elif opcode == 0xCA: # JZ addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & (1 << 6):  # Check if the zero flag is set
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & (1 << 6):  # Check if the zero flag is set
                     # error in binary, jump to 0x04F7 does not align to the opcode LXI B
                     if addr == 0x04F7:
                         addr = 0x04F5
 
-                    self.registers['PC'] = addr
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JZ to: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xCC: # CZ addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & (1 << 6):  # Check if the zero flag is set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF         # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & (1 << 6):  # Check if the zero flag is set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF         # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CZ to: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xCD: # CALL addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                self.registers['PC'] += 2
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF         # Push low byte of PC
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                self.registers.PC += 2
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF         # Push low byte of PC
 
                 if self.debuglevel >= 4:
                     print(f"Call: {addr:04X}")
 
-                self.registers['SP'] -= 2
-                self.registers['PC'] = addr
+                self.registers.SP -= 2
+                self.registers.PC = addr
             elif opcode == 0xCE: # ACI byte
-                immediate_value = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
-                carry = self.registers['FLAGS'] & 0x01
-                aux_carryflag_before = self.registers['A'] & 0x08 
-                result = self.registers['A'] + immediate_value + carry
+                immediate_value = self.memory[self.registers.PC]
+                self.registers.PC += 1
+                carry = self.registers.FLAGS & 0x01
+                aux_carryflag_before = self.registers.A & 0x08 
+                result = self.registers.A + immediate_value + carry
                 aux_carryflag_after = result & 0x10 
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result > 255:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
                     result -= 256
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before and aux_carryflag_after:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag
 
-                self.registers['A'] = result
+                self.registers.A = result
 
                 if self.debuglevel >= 4:
-                    print(f"ACI byte: A={self.registers['A']:02X} byte={immediate_value:02X}")
+                    print(f"ACI byte: A={self.registers.A:02X} byte={immediate_value:02X}")
             elif opcode == 0xCF: # RST 1
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x08
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x08
 
                 if self.debuglevel >= 4:
-                    print(f"RST 1 call: {self.registers['PC']:04X}")
+                    print(f"RST 1 call: {self.registers.PC:04X}")
             elif opcode == 0xD0: # RNC
-                if not (self.registers['FLAGS'] & 0x01):  # Check if the carry flag is not set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if not (self.registers.FLAGS & 0x01):  # Check if the carry flag is not set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RNC to: {self.registers['PC']:04X}")
+                        print(f"RNC to: {self.registers.PC:04X}")
             elif opcode == 0xD1:  # POP D
-                self.registers['E'] = self.memory[self.registers['SP']]
-                self.registers['D'] = self.memory[self.registers['SP'] + 1]
-                self.registers['SP'] += 2
+                self.registers.E = self.memory[self.registers.SP]
+                self.registers.D = self.memory[self.registers.SP + 1]
+                self.registers.SP += 2
 
                 if self.debuglevel >= 4:
                     print("POP D")
             elif opcode == 0xD2: # JNC addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & 0x01):  # Check if the carry flag is not set
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & 0x01):  # Check if the carry flag is not set
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JNC to: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xD4:  # CNC addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & 0x01):  # Check if the carry flag is not set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & 0x01):  # Check if the carry flag is not set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CNC to: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xD7: # RST 2
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF         # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x10
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF         # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x10
 
                 if self.debuglevel >= 4:
-                    print(f"RST 2 call: {self.registers['PC']:04X}")
+                    print(f"RST 2 call: {self.registers.PC:04X}")
             elif opcode == 0xD8: # RC
-                if self.registers['FLAGS'] & 0x01:  # Check if the carry flag is set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if self.registers.FLAGS & 0x01:  # Check if the carry flag is set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RC call: {self.registers['PC']:04X}")
+                        print(f"RC call: {self.registers.PC:04X}")
             elif opcode == 0xDA: # JC addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & 0x01:  # Check if the carry flag is set
-                        self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & 0x01:  # Check if the carry flag is set
+                        self.registers.PC = addr
 
                         if self.debuglevel >= 4:
                             print(f"JC to: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xDB:  # IN port
-                port = self.memory[self.registers["PC"]] & 0xFF
-                self.registers["PC"] += 1
-                inledcnt = (inledcnt + 1) % 5
-                if inledcnt == 4:
-                    self.leds[INP_LED].turn_on()
-                self.registers["A"] = self.input_port(pc, port) & 0xFF
-                if inledcnt == 4:
-                    self.leds[INP_LED].turn_off()
+                port = self.memory[self.registers.PC] & 0xFF
+                self.registers.PC += 1
+                self.panel.pulse(INP_LED)
+                self.registers.A = self.input_port(pc, port) & 0xFF
 
                 if self.debuglevel >= 4:
-                    print(f"IN: Port={port:02X} Data={self.registers["A"]:02X}")
+                    print(f"IN: Port={port:02X} Data={self.registers.A:02X}")
             elif opcode == 0xD3:  # OUT port
-                port = self.memory[self.registers["PC"]] & 0xFF
-                self.registers["PC"] += 1
-                self.leds[OUT_LED].turn_on()
-                self.output_port(self.registers["A"], port)
-                self.leds[OUT_LED].turn_off()
+                port = self.memory[self.registers.PC] & 0xFF
+                self.registers.PC += 1
+                self.panel.pulse(OUT_LED)
+                self.output_port(self.registers.A, port)
 
                 if self.debuglevel >= 4:
-                    print(f"OUT: Port={port:02X} Data={self.registers["A"]:02X}")                
+                    print(f"OUT: Port={port:02X} Data={self.registers.A:02X}")                
             elif opcode == 0xD5: # PUSH D
-                self.memory[self.registers['SP'] - 1] = self.registers['D']
-                self.memory[self.registers['SP'] - 2] = self.registers['E']
-                self.registers['SP'] -= 2
+                self.memory[self.registers.SP - 1] = self.registers.D
+                self.memory[self.registers.SP - 2] = self.registers.E
+                self.registers.SP -= 2
 
                 if self.debuglevel >= 4:
                     print("PUSH D")
             elif opcode == 0xD6:  # SUI byte
-                immediate_value = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
-                result = self.registers['A'] - immediate_value
+                immediate_value = self.memory[self.registers.PC]
+                self.registers.PC += 1
+                result = self.registers.A - immediate_value
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
                     result += 256
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result & 0xFF).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 # Auxiliary carry flag calculation
-                if (self.registers['A'] & 0x0F) < (immediate_value & 0x0F):
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag
+                if (self.registers.A & 0x0F) < (immediate_value & 0x0F):
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag
 
-                self.registers['A'] = result & 0xFF   
+                self.registers.A = result & 0xFF   
 
                 if self.debuglevel >= 4:
-                    print(f"SUI data: {self.registers['A']:02X}")
+                    print(f"SUI data: {self.registers.A:02X}")
             elif opcode == 0xDC: # CC addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & 0x01: # Check if the carry flag is set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & 0x01: # Check if the carry flag is set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CC to: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2             
+                    self.registers.PC += 2             
             elif opcode == 0xDE: # SBI byte
-                immediate_value = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
-                carry = self.registers['FLAGS'] & 0x01
-                aux_carryflag_before = self.registers['A'] & 0x10 
-                result = self.registers['A'] - immediate_value - carry
+                immediate_value = self.memory[self.registers.PC]
+                self.registers.PC += 1
+                carry = self.registers.FLAGS & 0x01
+                aux_carryflag_before = self.registers.A & 0x10 
+                result = self.registers.A - immediate_value - carry
                 aux_carryflag_after = result & 0x08 
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 if result < 0:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
                     result += 256
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
                 if aux_carryflag_before and aux_carryflag_after:
-                    self.registers['FLAGS'] |= (1 << 4)  # Set aux carry flag 
+                    self.registers.FLAGS |= (1 << 4)  # Set aux carry flag 
 
-                self.registers['A'] = result
+                self.registers.A = result
 
                 if self.debuglevel >= 4:
-                    print(f"SBI A: A={self.registers['A']:02X}")
+                    print(f"SBI A: A={self.registers.A:02X}")
             elif opcode == 0xDF: # RST 3
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF         # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x18
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF         # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x18
 
                 if self.debuglevel >= 4:
-                    print(f"RST 3 call: {self.registers['PC']:04X}")
+                    print(f"RST 3 call: {self.registers.PC:04X}")
             elif opcode == 0xE0:  # RPO
-                if not (self.registers['FLAGS'] & (1 << 2)):  # Check if the parity flag is not set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if not (self.registers.FLAGS & (1 << 2)):  # Check if the parity flag is not set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RPO PC: {self.registers['PC']:04X}")
+                        print(f"RPO PC: {self.registers.PC:04X}")
             elif opcode == 0xE1: # POP H
-                self.registers['L'] = self.memory[self.registers['SP']]
-                self.registers['H'] = self.memory[self.registers['SP'] + 1]
-                self.registers['SP'] += 2
+                self.registers.L = self.memory[self.registers.SP]
+                self.registers.H = self.memory[self.registers.SP + 1]
+                self.registers.SP += 2
 
                 if self.debuglevel >= 4:
                     print("POP H")
             elif opcode == 0xE2:  # JPO addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 2)):  # Check if the parity flag is not set
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 2)):  # Check if the parity flag is not set
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JPO jump: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xE3: # XTHL
-                temp_l = self.memory[self.registers['SP']]
-                temp_h = self.memory[self.registers['SP'] + 1]
-                self.memory[self.registers['SP']] = self.registers['L']
-                self.memory[self.registers['SP'] + 1] = self.registers['H']
-                self.registers['L'] = temp_l
-                self.registers['H'] = temp_h
+                temp_l = self.memory[self.registers.SP]
+                temp_h = self.memory[self.registers.SP + 1]
+                self.memory[self.registers.SP] = self.registers.L
+                self.memory[self.registers.SP + 1] = self.registers.H
+                self.registers.L = temp_l
+                self.registers.H = temp_h
 
                 if self.debuglevel >= 4:
                     print("XTHL")
             elif opcode == 0xE4:  # CPO addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 2)):  # Check if the parity flag is not set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 2)):  # Check if the parity flag is not set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CPO addr: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xE5: # PUSH H
-                self.memory[self.registers['SP'] - 1] = self.registers['H']
-                self.memory[self.registers['SP'] - 2] = self.registers['L']
-                self.registers['SP'] -= 2
+                self.memory[self.registers.SP - 1] = self.registers.H
+                self.memory[self.registers.SP - 2] = self.registers.L
+                self.registers.SP -= 2
 
                 if self.debuglevel >= 4:
-                    print(f"PUSH HL: {self.registers['H']:02X}-{self.registers['L']:02X}")
+                    print(f"PUSH HL: {self.registers.H:02X}-{self.registers.L:02X}")
             elif opcode == 0xEA:  # JPE addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & (1 << 2):  # Check if the parity flag is set
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & (1 << 2):  # Check if the parity flag is set
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JPE jump: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xE7: # RST 4
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x20
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x20
 
                 if self.debuglevel >= 4:
-                    print(f"RST 4 call: {self.registers['PC']:04X}")
+                    print(f"RST 4 call: {self.registers.PC:04X}")
             elif opcode == 0xEB: # XCHG
-                tempreg = self.registers['D']
-                self.registers['D'] = self.registers['H']
-                self.registers['H'] = tempreg
+                tempreg = self.registers.D
+                self.registers.D = self.registers.H
+                self.registers.H = tempreg
 
-                tempreg = self.registers['E']
-                self.registers['E'] = self.registers['L']
-                self.registers['L'] = tempreg       
+                tempreg = self.registers.E
+                self.registers.E = self.registers.L
+                self.registers.L = tempreg       
 
                 if self.debuglevel >= 4:
                     print("XCHG")         
             elif opcode == 0xE6: # ANI byte
-                immediate_value = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
-                self.registers['A'] &= immediate_value                
+                immediate_value = self.memory[self.registers.PC]
+                self.registers.PC += 1
+                self.registers.A &= immediate_value                
 
                 # Clear flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set flags based on the result in the A register
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"ANI A & {immediate_value:02X} = {self.registers['A']:02X}")
+                    print(f"ANI A & {immediate_value:02X} = {self.registers.A:02X}")
             elif opcode == 0xE8:  # RPE
-                if self.registers['FLAGS'] & (1 << 2):  # Check if the parity flag is set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if self.registers.FLAGS & (1 << 2):  # Check if the parity flag is set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RPE PC: {self.registers['PC']:04X}")
+                        print(f"RPE PC: {self.registers.PC:04X}")
             elif opcode == 0xE9: # PCHL
-                self.registers['PC'] = (self.registers['H'] << 8) | self.registers['L']
+                self.registers.PC = (self.registers.H << 8) | self.registers.L
                 
                 if self.debuglevel >= 4:
-                    print(f"PCHL : PC={self.registers['PC']:04X}")
+                    print(f"PCHL : PC={self.registers.PC:04X}")
             elif opcode == 0xEC:  # CPE addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & (1 << 2):  # Check if the parity flag is set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & (1 << 2):  # Check if the parity flag is set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
                 
                 if self.debuglevel >= 4:
                     print(f"CPE addr: {addr:04X}")
             elif opcode == 0xEE: # XRI byte
-                immediate_value = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
-                self.registers['A'] ^= immediate_value
+                immediate_value = self.memory[self.registers.PC]
+                self.registers.PC += 1
+                self.registers.A ^= immediate_value
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
 
                 if self.debuglevel >= 4:
-                    print(f"XRI A: A={self.registers['A']:02X} byte={immediate_value:02X}:")
+                    print(f"XRI A: A={self.registers.A:02X} byte={immediate_value:02X}:")
             elif opcode == 0xEF:  # RST 5
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x28
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x28
 
                 if self.debuglevel >= 4:
-                    print(f"RST 5 call: {self.registers['PC']:04X}")
+                    print(f"RST 5 call: {self.registers.PC:04X}")
             elif opcode == 0xF0:  # RP
-                if not (self.registers['FLAGS'] & (1 << 7)):  # Check if the sign flag is not set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if not (self.registers.FLAGS & (1 << 7)):  # Check if the sign flag is not set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
                         print(f"RP: {addr:04X}") 
             elif opcode == 0xF1: # POP PSW
-                self.registers['FLAGS'] = self.memory[self.registers['SP']]
-                self.registers['A'] = self.memory[self.registers['SP'] + 1]
-                self.registers['SP'] += 2
+                self.registers.FLAGS = self.memory[self.registers.SP]
+                self.registers.A = self.memory[self.registers.SP + 1]
+                self.registers.SP += 2
 
                 if self.debuglevel >= 4:
                     print("POP PSW") 
             elif opcode == 0xF2:  # JP M, addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 7)):  # Check if the sign flag is set
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 7)):  # Check if the sign flag is set
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JP jump: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xF3:
                 self.interrupt_enabled = False
 
                 if self.debuglevel >= 3:
                     print("Interrupts Disabled")  # DI   
             elif opcode == 0xF4:  # CP addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if not (self.registers['FLAGS'] & (1 << 7)):  # Check if the sign flag is not set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if not (self.registers.FLAGS & (1 << 7)):  # Check if the sign flag is not set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CP call: {addr:04X}")     
                 else:
-                    self.registers['PC'] += 2 
+                    self.registers.PC += 2 
             elif opcode == 0xF5: # PUSH PSW
-                self.memory[self.registers['SP'] - 1] = self.registers['A']
-                self.memory[self.registers['SP'] - 2] = self.registers['FLAGS']
-                self.registers['SP'] -= 2  
+                self.memory[self.registers.SP - 1] = self.registers.A
+                self.memory[self.registers.SP - 2] = self.registers.FLAGS
+                self.registers.SP -= 2  
 
                 if self.debuglevel >= 4:
                     print("PUSH PSW")                 
             elif opcode == 0xF6:  # ORI byte
-                immediate_value = self.memory[self.registers['PC']]  # Fetch the immediate byte
-                self.registers['PC'] += 1  # Increment the program counter
-                self.registers['A'] |= immediate_value  # Perform bitwise OR between A and the immediate byte
+                immediate_value = self.memory[self.registers.PC]  # Fetch the immediate byte
+                self.registers.PC += 1  # Increment the program counter
+                self.registers.A |= immediate_value  # Perform bitwise OR between A and the immediate byte
 
                 # Clear flags
-                self.registers['FLAGS'] &= ~(1 << 7)  # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6)  # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4)  # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2)  # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0)  # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7)  # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6)  # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4)  # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2)  # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0)  # Clear carry flag
 
                 # Set flags based on the result in the A register
-                if self.registers['A'] == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
-                if self.registers['A'] & 0x80:
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
-                if bin(self.registers['A']).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag  
+                if self.registers.A == 0:
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
+                if self.registers.A & 0x80:
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
+                if bin(self.registers.A).count('1') % 2 == 0:
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag  
 
                 if self.debuglevel >= 4:
-                    print(f"ORI A: A={self.registers['A']:02X} byte={immediate_value}")    
+                    print(f"ORI A: A={self.registers.A:02X} byte={immediate_value}")    
             elif opcode == 0xF7: # RST 6
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF         # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x30   
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF         # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x30   
 
                 if self.debuglevel >= 4:
-                    print(f"RST 6 call: {self.registers['PC']:04X}")
+                    print(f"RST 6 call: {self.registers.PC:04X}")
             elif opcode == 0xF8:  # RM
-                if self.registers['FLAGS'] & (1 << 7):  # Check if the sign flag is set
-                    self.registers['PC'] = self.memory[self.registers['SP']] | (self.memory[self.registers['SP'] + 1] << 8)
-                    self.registers['SP'] += 2
+                if self.registers.FLAGS & (1 << 7):  # Check if the sign flag is set
+                    self.registers.PC = self.memory[self.registers.SP] | (self.memory[self.registers.SP + 1] << 8)
+                    self.registers.SP += 2
 
                     if self.debuglevel >= 4:
-                        print(f"RM SP: {self.registers['SP']:04X}")
+                        print(f"RM SP: {self.registers.SP:04X}")
             elif opcode == 0xFA:  # JM addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & (1 << 7):  # Check if the sign flag is set
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & (1 << 7):  # Check if the sign flag is set
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"JM addr: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2
+                    self.registers.PC += 2
             elif opcode == 0xFB:
                 self.interrupt_enabled = True
 
                 if self.debuglevel >= 3:
                     print("Interrupts Enabled")  # EI  
             elif opcode == 0xFC:  # CM addr
-                addr = (self.memory[self.registers['PC']] | (self.memory[self.registers['PC'] + 1] << 8))
-                if self.registers['FLAGS'] & (1 << 7):  # Check if the sign flag is set
-                    self.registers['PC'] += 2
-                    self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF  # Push high byte of PC
-                    self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF  # Push low byte of PC
-                    self.registers['SP'] -= 2
-                    self.registers['PC'] = addr
+                addr = (self.memory[self.registers.PC] | (self.memory[self.registers.PC + 1] << 8))
+                if self.registers.FLAGS & (1 << 7):  # Check if the sign flag is set
+                    self.registers.PC += 2
+                    self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF  # Push high byte of PC
+                    self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF  # Push low byte of PC
+                    self.registers.SP -= 2
+                    self.registers.PC = addr
 
                     if self.debuglevel >= 4:
                         print(f"CM addr: {addr:04X}")
                 else:
-                    self.registers['PC'] += 2 
+                    self.registers.PC += 2 
             elif opcode == 0xF9: # SPHL
-                self.registers['SP'] = (self.registers['H'] << 8) | self.registers['L']  
+                self.registers.SP = (self.registers.H << 8) | self.registers.L  
 
                 if self.debuglevel >= 4:
-                    print(f"SPHL = {self.registers['SP']:04X}")
+                    print(f"SPHL = {self.registers.SP:04X}")
             elif opcode == 0xFE:  # CPI byte
-                immediate_value = self.memory[self.registers['PC']]
-                self.registers['PC'] += 1
+                immediate_value = self.memory[self.registers.PC]
+                self.registers.PC += 1
 
-                result = (self.registers['A'] - immediate_value) & 0xFF                
+                result = (self.registers.A - immediate_value) & 0xFF                
 
                 # Update flags
-                self.registers['FLAGS'] &= ~(1 << 7) # Clear sign flag
-                self.registers['FLAGS'] &= ~(1 << 6) # Clear zero flag
-                self.registers['FLAGS'] &= ~(1 << 4) # Clear auxiliary carry flag
-                self.registers['FLAGS'] &= ~(1 << 2) # Clear parity flag
-                self.registers['FLAGS'] &= ~(1 << 0) # Clear carry flag
+                self.registers.FLAGS &= ~(1 << 7) # Clear sign flag
+                self.registers.FLAGS &= ~(1 << 6) # Clear zero flag
+                self.registers.FLAGS &= ~(1 << 4) # Clear auxiliary carry flag
+                self.registers.FLAGS &= ~(1 << 2) # Clear parity flag
+                self.registers.FLAGS &= ~(1 << 0) # Clear carry flag
 
                 if result == 0:
-                    self.registers['FLAGS'] |= (1 << 6)  # Set zero flag
+                    self.registers.FLAGS |= (1 << 6)  # Set zero flag
                 if result & (1 << (8 - 1)):
-                    self.registers['FLAGS'] |= (1 << 7)  # Set sign flag
+                    self.registers.FLAGS |= (1 << 7)  # Set sign flag
                 if bin(result).count('1') % 2 == 0:
-                    self.registers['FLAGS'] |= (1 << 2)  # Set parity flag
-                if  self.registers['A'] < immediate_value:
-                    self.registers['FLAGS'] |= (1 << 0)  # Set carry flag
-                if (self.registers['A'] & 0x0F) < (immediate_value & 0xFF):
-                    self.registers['FLAGS'] |= (1 << 4)  # Set auxiliary carry flag
+                    self.registers.FLAGS |= (1 << 2)  # Set parity flag
+                if  self.registers.A < immediate_value:
+                    self.registers.FLAGS |= (1 << 0)  # Set carry flag
+                if (self.registers.A & 0x0F) < (immediate_value & 0xFF):
+                    self.registers.FLAGS |= (1 << 4)  # Set auxiliary carry flag
 
                 if self.debuglevel >= 4:
                     print(f"CPI: {result:02X}")
             elif opcode == 0xFF: # RST 7
-                self.memory[self.registers['SP'] - 1] = (self.registers['PC'] >> 8) & 0xFF # Push high byte of PC
-                self.memory[self.registers['SP'] - 2] = self.registers['PC'] & 0xFF # Push low byte of PC
-                self.registers['SP'] -= 2
-                self.registers['PC'] = 0x38
+                self.memory[self.registers.SP - 1] = (self.registers.PC >> 8) & 0xFF # Push high byte of PC
+                self.memory[self.registers.SP - 2] = self.registers.PC & 0xFF # Push low byte of PC
+                self.registers.SP -= 2
+                self.registers.PC = 0x38
 
                 if self.debuglevel >= 4:
-                    print(f"RST 7 call: {self.registers['PC']:04X}")
+                    print(f"RST 7 call: {self.registers.PC:04X}")
             else:
-                self.running = False
+                self.undefined_opcode(opcode, pc)
+            
+            self.after_instruction()
 
-                print(f"Undefined opcode: {opcode:02X} at {pc:04X} = ABORTING!!!")
+        self.tstates += tstates
 
-                for opc in range(0,0x100):
-                    if opcodes_8080[opc][1] == 1:
-                        print(f"{opcodes_8080[opc][0]}")
 
-                if self.debuglogger == True:
-                    self.debugloggerfile.write(f"Undefined opcode: {opcode:02X} at {pc:04X} = ABORTING!!!")
-                    self.debuglogger = False
+def on_mouse_click(event):
+    x, y = event.x, event.y
+    #print(f"Mouse clicked at ({x}, {y})")
 
-                    self.debugloggerfile.close()               
-            
-            if self.altair_singlestep == True:
-                while len(self.inputbuffer) == 0 and self.altair_singlestep == True:
-                    time.sleep(0.1)
+def startup_phase(name):
+    # Record the time taken since the previous start-up phase
+    global startup_clock
 
-                if len(self.inputbuffer):
-                    self.inputbuffer.pop(0)   
+    now = time.perf_counter()
+    startup_timings.append((name, now - startup_clock))
+    startup_clock = now
 
-            if self.singlestep == True:
-                self.debug()
 
-            if self.debuglogger == True:
-                self.debug_write(self.debugloggerfile)
+def print_startup_timings():
+    print("Start-up timings:")
+    for name, seconds in startup_timings:
+        print(f"  {name:14s} {seconds * 1000:8.1f} ms")
+    print(f"  {'total':14s} {sum(seconds for name, seconds in startup_timings) * 1000:8.1f} ms")
 
 
-def on_mouse_click(event):
-    x, y = event.x, event.y
-    #print(f"Mouse clicked at ({x}, {y})")
+def panel_image_cache(filename, width):
+    # Pre-scaled copy of the panel image that Tk loads directly, keyed by the
+    # source file time and the target width. Only a rebuild needs PIL. Returns
+    # None when the cache can't be written.
+    base = os.path.splitext(filename)[0]
+    cached = f"{base}.{width}.{os.stat(filename).st_mtime_ns}.cache.png"
+    if os.path.exists(cached):
+        return cached
+
+    from PIL import Image
+
+    image = Image.open(filename)
+    height = int(width * image.height / image.width)  # Maintain aspect ratio
+    image = image.resize((width, height), Image.LANCZOS)
+
+    try:
+        image.save(cached + ".tmp", format="PNG", compress_level=1)
+        os.replace(cached + ".tmp", cached)
+    except OSError as error:
+        print(f"Front panel image not cached: {error}")
+        return None
+
+    # drop the copies made for an older image or another width
+    for stale in glob.glob(f"{glob.escape(base)}.*.cache.png"):
+        if stale != cached:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    return cached
+
 
 def start_tkinter():
+    import tkinter as tk
+    from tkinter import scrolledtext
+
     root = tk.Tk()
     root.title("MITS Altair 8800")
     root.geometry("800x600")  # Set an initial size for the window
@@ -3195,19 +3693,22 @@ def start_tkinter():
     icon_photo = tk.PhotoImage(file='ttyicon.png')
     root.wm_iconphoto(False, icon_photo)
     root.configure(bg='#F5F5DC')
+    startup_phase("tk window")
 
-    # Load the front panel image
-    image = Image.open('altair8800frontpanel.png')
-
-    # Resize the image
-    new_width = 800  # Adjust the width as needed
-    new_height = int(new_width * image.height / image.width)  # Maintain aspect ratio
-    image = image.resize((new_width, new_height), Image.LANCZOS)
+    # Load the front panel image, decoded and resized by PIL only when the cache is rebuilt
+    cached = panel_image_cache(PANEL_IMAGE, PANEL_WIDTH)
+    if cached is not None:
+        frontpanel_photo = tk.PhotoImage(file=cached)
+    else:
+        from PIL import Image, ImageTk
 
-    frontpanel_photo = ImageTk.PhotoImage(image)
+        image = Image.open(PANEL_IMAGE)
+        image = image.resize((PANEL_WIDTH, int(PANEL_WIDTH * image.height / image.width)), Image.LANCZOS)
+        frontpanel_photo = ImageTk.PhotoImage(image)
+    startup_phase("panel image")
 
     # Create a canvas to display the image and LEDs
-    canvas = tk.Canvas(root, width=image.width, height=image.height)
+    canvas = tk.Canvas(root, width=frontpanel_photo.width(), height=frontpanel_photo.height())
     canvas.pack()
 
     # Display the image on the canvas
@@ -3219,46 +3720,94 @@ def start_tkinter():
 
     text_area = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=100, height=20, font=("Dot Matrix", 14), bg='#F5F5DC', fg='black')
     text_area.pack(padx=10, pady=10)
-    
-    return (root, text_area, canvas)
-
-def run_altair():
-    global emulator_parser
-    global emulator_args
-
-    (root, text_area, canvas) = start_tkinter()
+    startup_phase("tty window")
 
-    print("Creating Altair 8800 Emulator")
-    altair8800 = Altair8800(text_area, canvas, root=root)
-
-    rom_argument = emulator_args.rom.split('=')[1] if '=' in emulator_args.rom else emulator_args.rom
-    rom_filename = os.path.basename(rom_argument)
-    altair8800.rom_file = rom_filename
+    return (root, text_area, canvas)
 
+def setup_altair(altair8800):
+    # Apply the command line options shared by the window and headless modes
     if emulator_args.usrfn:
         altair8800.usrfunction = True
 
-    altair8800.load_rom(rom_filename)
+    if emulator_args.restore:
+        # memory, registers and queued input come from the snapshot instead of the ROM
+        altair8800.restore_snapshot(emulator_args.restore)
+    else:
+        if emulator_args.rom is None:
+            emulator_parser.error("a rom or --restore snapshot is required")
+
+        rom_argument = emulator_args.rom.split('=')[1] if '=' in emulator_args.rom else emulator_args.rom
+        rom_filename = os.path.basename(rom_argument)
+        altair8800.rom_file = rom_filename
+
+        altair8800.load_rom(rom_filename)
+
+    # save the machine state when the CPU stops
+    altair8800.snapshot_file = emulator_args.snapshot
+
+    # per address profile, grouped by the routines of the BASIC listing
+    if emulator_args.profile:
+        symbols = {}
+        listing = emulator_args.symbols or next((name for name in profile8800.DEFAULT_SYMBOLS if os.path.exists(name)), None)
+        if listing is not None:
+            symbols = profile8800.load_symbols(listing)
+            print(f"Loaded {len(symbols)} symbols from {listing}")
+        altair8800.profiler = profile8800.Profiler(symbols)
+
+    # per machine opcode histogram, saved as CSV or JSON
+    altair8800.histogram_file = emulator_args.histogram
+    if emulator_args.histogramsample:
+        altair8800.histogram.sample = emulator_args.histogramsample
+
+    # time per BASIC line of the running program
+    if emulator_args.lineprofile:
+        altair8800.line_profiler = profile8800.LineProfiler(emulator_args.lineprofile)
+        if emulator_args.program:
+            altair8800.line_profiler.load_program(emulator_args.program)
+
+    # console keyboard and TTY printer sound backends
+    if altair8800.headless == False:
+        altair8800.keyboard = console8800.create_keyboard(emulator_args.keyboard)
+        altair8800.sound = console8800.create_sound(emulator_args.sound)
+
+    altair8800.lamp_test = emulator_args.lamptest
 
     # disable TTY printer sound
     if emulator_args.nosound == True:
         altair8800.play_sound = False
 
+    # the sound worker thread and the WAV file in memory are only set up when a sound can play
+    if altair8800.play_sound == True and not isinstance(altair8800.sound, console8800.NullSound):
+        try:
+            altair8800.printer_sound = console8800.SoundWorker(altair8800.sound, "ttyprinter2s.wav")
+        except OSError as error:
+            print(f"TTY printer sound disabled: {error}")
+
     # add breakpoints
     if emulator_args.bp1: 
-        altair8800.breakpoints.append(int(emulator_args.bp1, 16))
+        altair8800.breakpoints.add(emulator_args.bp1)
 
     if emulator_args.bp2:
-        altair8800.breakpoints.append(int(emulator_args.bp2, 16))
+        altair8800.breakpoints.add(emulator_args.bp2)
 
     if emulator_args.bp3:
-        altair8800.breakpoints.append(int(emulator_args.bp3, 16))
+        altair8800.breakpoints.add(emulator_args.bp3)
 
     if emulator_args.bp4:
-        altair8800.breakpoints.append(int(emulator_args.bp4, 16))
+        altair8800.breakpoints.add(emulator_args.bp4)
 
     if emulator_args.bp5:
-        altair8800.breakpoints.append(int(emulator_args.bp5, 16))
+        altair8800.breakpoints.add(emulator_args.bp5)
+
+    for spec in emulator_args.bp or []:
+        altair8800.breakpoints.add(spec)
+
+    # memory watchpoints
+    for spec in emulator_args.watch or []:
+        altair8800.breakpoints.add_watch(spec, "w")
+
+    for spec in emulator_args.rwatch or []:
+        altair8800.breakpoints.add_watch(spec, "r")
 
     if emulator_args.debuglevel:
         altair8800.debuglevel = emulator_args.debuglevel
@@ -3266,23 +3815,128 @@ def run_altair():
     if emulator_args.debuglogger:
         altair8800.debuglogger = True            
 
+    # select the CPU core
+    altair8800.core = emulator_args.core
+
+    # pace the CPU to a multiple of the 2 MHz Altair clock
+    altair8800.throttle = emulator_args.throttle
+
+
+def run_altair():
+    global emulator_parser
+    global emulator_args
+
+    (root, text_area, canvas) = start_tkinter()
+
+    print("Creating Altair 8800 Emulator")
+    altair8800 = Altair8800(text_area, canvas, root=root)
+    startup_phase("front panel")
+
+    setup_altair(altair8800)
+    startup_phase("setup")
+
+    # front panel refresh rate
+    altair8800.panel_renderer.set_fps(emulator_args.ledfps)
+    altair8800.panel_renderer.start()
+    altair8800.tty.start()
+
+    if emulator_args.timings:
+        # the first idle callback runs once the window has been drawn
+        root.after_idle(lambda: (startup_phase("first frame"), print_startup_timings()))
+
     # moved to Power  switch call back
     #threading.Thread(target=altair8800.execute).start()
     root.mainloop()
 
+
+def run_headless():
+    global emulator_args
+
+    altair8800 = Altair8800(None, None, None)
+    altair8800.play_sound = False
+    startup_phase("emulator")
+
+    # stdout is kept for the TTY output, the emulator's own messages go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        setup_altair(altair8800)
+        startup_phase("setup")
+
+        # answer the 4K BASIC start-up prompts: MEMORY SIZE, TERMINAL WIDTH, WANT SIN/RND/SQR
+        # a restored snapshot is already past them
+        if not emulator_args.restore:
+            for answer in emulator_args.startup.split(','):
+                altair8800.queue_line(answer.strip())
+
+        if emulator_args.program:
+            altair8800.queue_text_file(emulator_args.program)
+            altair8800.queue_line("RUN")
+
+        # lines typed while the program runs, e.g. answers to INPUT statements
+        if emulator_args.inputfile:
+            with open(emulator_args.inputfile, 'r') as file:
+                for line in file:
+                    altair8800.queue_line(line.rstrip('\r\n'))
+
+        if emulator_args.output:
+            altair8800.ttyout = open(emulator_args.output, 'w')
+
+        if emulator_args.timings:
+            print_startup_timings()
+
+        # a restored snapshot keeps the cycle count it was saved with, report this run's cycles
+        tstates = altair8800.tstates
+        started = time.perf_counter()
+        altair8800.execute()
+        elapsed = time.perf_counter() - started
+        tstates = altair8800.tstates - tstates
+
+        altair8800.ttyout.flush()
+        if emulator_args.output:
+            altair8800.ttyout.close()
+
+        print(f"\nAltair 8800 stopped: {altair8800.stop_reason}")
+        print(f"{altair8800.instructions} instructions, {tstates} T-states in {elapsed:.2f}s = {tstates / elapsed / 1e6:.3f} MHz emulated")
+
+
 if __name__ == "__main__":
     emulator_parser = argparse.ArgumentParser(description="Altair Emulator for 4K BASIC")
-    emulator_parser.add_argument("rom", type=str, help="Load Intel 8080 binary, rom=basic.rom")
+    emulator_parser.add_argument("rom", type=str, nargs="?", help="Load Intel 8080 binary, rom=basic.rom - not needed with --restore")
     emulator_parser.add_argument("--bp1", type=hex_type, help="Program code breakpoint #1 - 4 digit hexadecimal number")
     emulator_parser.add_argument("--bp2", type=hex_type, help="Program code breakpoint #2 - 4 digit hexadecimal number")
     emulator_parser.add_argument("--bp3", type=hex_type, help="Program code breakpoint #3 - 4 digit hexadecimal number")
     emulator_parser.add_argument("--bp4", type=hex_type, help="Program code breakpoint #4 - 4 digit hexadecimal number")
     emulator_parser.add_argument("--bp5", type=hex_type, help="Program code breakpoint #5 - 4 digit hexadecimal number")
+    emulator_parser.add_argument("--bp", type=breakpoint_type, action="append", help="Breakpoint ADDR[:CONDITION][#COUNT], e.g. 0377:A == 0x0D#2 - repeat for more")
+    emulator_parser.add_argument("--watch", type=watchpoint_type, action="append", help="Break before a write to ADDR[:CONDITION][#COUNT] - repeat for more")
+    emulator_parser.add_argument("--rwatch", type=watchpoint_type, action="append", help="Break before a read of ADDR[:CONDITION][#COUNT] - repeat for more")
     emulator_parser.add_argument("--debuglevel", type=int, choices=[1, 2, 3, 4], help="Set the debug information level (1-4)")
-    emulator_parser.add_argument("--debuglogger", action="store_true", help="Enables saving debug info to dblogger.txt")
+    emulator_parser.add_argument("--debuglogger", action="store_true", help="Record a binary instruction trace to dblogger.trc, decode it with trace8800.py")
+    emulator_parser.add_argument("--profile", action="store_true", help="Count instructions and T-states per address and print the busiest routines when the CPU stops")
+    emulator_parser.add_argument("--symbols", type=str, help="Assembler listing with the routine labels for --profile, default \"BASIC disassembly-source.lst\"")
+    emulator_parser.add_argument("--lineprofile", type=int, nargs="?", const=profile8800.DEFAULT_LINE_SAMPLE, help="Report the time spent on each BASIC line, sampled every N clock cycles (default 1000)")
+    emulator_parser.add_argument("--histogram", type=str, help="Count every opcode run and save the histogram to this .csv or .json file when the CPU stops")
+    emulator_parser.add_argument("--histogramsample", type=int, help="Count one opcode every N clock cycles instead of every instruction")
     emulator_parser.add_argument("--usrfn", action="store_true", help="Enables USR() functionality")
     emulator_parser.add_argument("--nosound", action="store_true", help="Do not play TTY printer sound")
+    emulator_parser.add_argument("--lamptest", type=float, default=LAMP_TEST_SECONDS, help="Power-on lamp test length in seconds, shown while the CPU starts, 0 = skip it")
+    emulator_parser.add_argument("--ledfps", type=int, default=leds8800.DEFAULT_FPS, help="Front panel LED refresh rate in frames per second")
+    emulator_parser.add_argument("--core", type=str, choices=["table", "block", "legacy"], default="table", help="CPU core: table driven dispatch, translated basic blocks or the legacy if/elif chain")
+    emulator_parser.add_argument("--keyboard", type=str, choices=console8800.KEYBOARD_BACKENDS, default="auto", help="Console keyboard backend, auto = msvcrt on Windows, termios on a POSIX terminal, pipe when stdin is redirected")
+    emulator_parser.add_argument("--sound", type=str, choices=console8800.SOUND_BACKENDS, default="auto", help="TTY printer sound backend, auto = winsound on Windows, otherwise none")
+    emulator_parser.add_argument("--throttle", type=float, default=0.0, help="Pace the CPU to this multiple of the 2 MHz Altair clock, e.g. 1 = real Altair speed, 0 = unlimited")
+    emulator_parser.add_argument("--headless", action="store_true", help="Run without the front panel window, TTY output goes to stdout or --output")
+    emulator_parser.add_argument("--program", type=str, help="Headless: BASIC program file to type in and RUN")
+    emulator_parser.add_argument("--inputfile", type=str, help="Headless: text file with lines typed after RUN, e.g. INPUT answers")
+    emulator_parser.add_argument("--startup", type=str, default="4096,80,N,N,N", help="Headless: comma separated answers to the BASIC start-up prompts")
+    emulator_parser.add_argument("--restore", type=str, help="Start from a machine state snapshot instead of loading the rom")
+    emulator_parser.add_argument("--snapshot", type=str, help="Save a machine state snapshot to this file when the CPU stops")
+    emulator_parser.add_argument("--output", type=str, help="Headless: write TTY output to this file instead of stdout")
+    emulator_parser.add_argument("--timings", action="store_true", help="Print how long each start-up phase took")
 
     emulator_args = emulator_parser.parse_args()
+    startup_phase("imports")
 
-    run_altair()
+    if emulator_args.headless:
+        run_headless()
+    else:
+        run_altair()
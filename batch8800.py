@@ -0,0 +1,327 @@
+# 2025 - Batch runner for Altair 4K BASIC programs
+
+# Runs a set of BASIC programs headless, one emulator per job, spread over a
+# pool of worker processes so a large batch (grading, regression runs, demos)
+# uses every CPU core. Each job boots BASIC, answers the start-up prompts,
+# types in its program and RUNs it, then types its scripted input. The TTY
+# output and the reason the run stopped are collected for every job, and
+# compared with an expected output file when the job has one.
+#
+# Jobs come from a directory - every .bas file, with the lines of a matching
+# .in file typed after RUN - or from a JSON manifest:
+#
+#   {"jobs": [{"program": "sort.bas", "input": "sortdata.txt", "expected": "sort.txt"},
+#             {"program": "usrfn.bas", "usrfn": true, "startup": "4080,80,N,N,N"}]}
+#
+# "input" is a file name or a list of lines, file names are relative to the
+# manifest. Examples:
+#
+#   py batch8800.py rom=BASICdisassembly-source.rom programs --outdir results
+#   py batch8800.py rom=BASICdisassembly-source.rom jobs.json --workers 8 --json results.json
+#
+# With --fork (Linux and other systems with os.fork) BASIC is booted once, up
+# to the OK prompt, and every job runs in a child forked from that warm
+# machine, which shares its memory copy-on-write and only types in its own
+# program. Jobs with different start-up answers or USR settings get one warm
+# machine each.
+
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import io
+import json
+import os
+import select
+import sys
+import threading
+import time
+
+DEFAULT_STARTUP = "4096,80,N,N,N"
+DEFAULT_TIMEOUT = 60.0
+
+
+def jobs_from_directory(directory):
+    jobs = []
+    for program in sorted(glob.glob(os.path.join(directory, "*.bas"))):
+        job = {"program": program}
+        scripted = os.path.splitext(program)[0] + ".in"
+        if os.path.exists(scripted):
+            job["input"] = scripted
+        jobs.append(job)
+
+    return jobs
+
+
+def jobs_from_manifest(filename):
+    with open(filename, "r") as f:
+        manifest = json.load(f)
+
+    base = os.path.dirname(os.path.abspath(filename))
+    jobs = manifest["jobs"] if isinstance(manifest, dict) else manifest
+    for job in jobs:
+        for key in ("program", "expected"):
+            if key in job:
+                job[key] = os.path.join(base, job[key])
+        if isinstance(job.get("input"), str):
+            job["input"] = os.path.join(base, job["input"])
+
+    return jobs
+
+
+def load_jobs(source):
+    jobs = jobs_from_directory(source) if os.path.isdir(source) else jobs_from_manifest(source)
+
+    for job in jobs:
+        job.setdefault("name", os.path.splitext(os.path.basename(job["program"]))[0])
+
+    return jobs
+
+
+def input_lines(job):
+    scripted = job.get("input", [])
+    if isinstance(scripted, str):
+        with open(scripted, "r") as f:
+            return [line.rstrip('\r\n') for line in f]
+
+    return scripted
+
+
+def queue_job(altair, job):
+    # Type the program and its input after the start-up answers
+    altair.queue_text_file(job["program"])
+    altair.queue_line("RUN")
+    for line in input_lines(job):
+        altair.queue_line(line)
+
+
+def boot_altair(rom, usrfn, core):
+    import altairemulator
+
+    altair = altairemulator.Altair8800(None, None, None)
+    altair.play_sound = False
+    altair.core = core
+    altair.usrfunction = usrfn
+    altair.ttyout = io.StringIO()
+    altair.load_rom(rom)
+
+    return altair
+
+
+def same_text(expected, output):
+    # Line by line, whatever the line endings
+    return expected.rstrip().splitlines() == output.rstrip().splitlines()
+
+
+def execute(altair, timeout):
+    # Run until the CPU stops or for timeout seconds, returns the wall time
+    def stop():
+        altair.stop_reason = "timeout"
+        altair.running = False
+
+    timer = None
+    if timeout > 0:
+        timer = threading.Timer(timeout, stop)
+        timer.daemon = True
+        timer.start()
+
+    started = time.perf_counter()
+    altair.execute()
+    wall = time.perf_counter() - started
+
+    if timer is not None:
+        timer.cancel()
+
+    return wall
+
+
+def execute_job(altair, job, timeout):
+    # Run the queued job to the end, returns the result record
+    wall = execute(altair, timeout)
+    output = altair.ttyout.getvalue()
+    result = {
+        "name": job["name"],
+        "program": job["program"],
+        "stop_reason": altair.stop_reason,
+        "instructions": altair.instructions,
+        "wall_seconds": round(wall, 3),
+        "output": output,
+        "matched": None
+    }
+
+    if "expected" in job:
+        with open(job["expected"], "r") as f:
+            result["matched"] = same_text(f.read(), output)
+
+    return result
+
+
+def error_result(job, error):
+    return {"name": job["name"], "program": job["program"], "stop_reason": f"error: {error}",
+            "instructions": 0, "wall_seconds": 0.0, "output": "", "matched": False}
+
+
+def run_job(job, rom, core, timeout):
+    # One job in a worker process
+    try:
+        # keep the emulator's own messages out of the output
+        with contextlib.redirect_stdout(io.StringIO()):
+            altair = boot_altair(rom, job.get("usrfn", False), core)
+            for answer in job.get("startup", DEFAULT_STARTUP).split(','):
+                altair.queue_line(answer.strip())
+            queue_job(altair, job)
+            return execute_job(altair, job, timeout)
+    except Exception as error:
+        return error_result(job, error)
+
+
+def boot_warm(rom, core, usrfn, startup, timeout):
+    # Boot BASIC and answer the start-up prompts, the headless machine stops at the OK prompt
+    with contextlib.redirect_stdout(io.StringIO()):
+        altair = boot_altair(rom, usrfn, core)
+        for answer in startup.split(','):
+            altair.queue_line(answer.strip())
+        execute(altair, timeout)
+
+    if altair.stop_reason != "input exhausted":
+        raise RuntimeError(f"BASIC did not reach the OK prompt: {altair.stop_reason}")
+
+    return altair
+
+
+def fork_job(altair, job, timeout):
+    # Run a job in a child of this process, which starts from the warm machine.
+    # Returns the child pid and the pipe its result arrives on.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid != 0:
+        os.close(write_fd)
+        return pid, read_fd
+
+    os.close(read_fd)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            queue_job(altair, job)
+            result = execute_job(altair, job, timeout)
+    except Exception as error:
+        result = error_result(job, error)
+
+    with os.fdopen(write_fd, "w") as f:
+        json.dump(result, f)
+    os._exit(0)
+
+
+def print_result(result):
+    matched = {None: "", True: "  output matches", False: "  OUTPUT DIFFERS"}[result["matched"]]
+    print(f"{result['name']:20s} {result['stop_reason']:18s} {result['instructions']:>12,d} instr "
+          f"{result['wall_seconds']:8.2f}s{matched}")
+
+
+def save_output(result, outdir):
+    with open(os.path.join(outdir, result["name"] + ".txt"), "w", newline="") as f:
+        f.write(result["output"])
+
+
+def run_pool(jobs, rom, core, timeout, workers):
+    # Jobs in parallel, results in job order
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job, rom, core, timeout) for job in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            print_result(future.result())
+
+        return [future.result() for future in futures]
+
+
+def run_forked(jobs, rom, core, timeout, workers):
+    # Jobs in children forked from warm machines, at most workers at a time, results in job order
+    warm = {}  # (usrfn, startup) -> warm machine
+    started = time.perf_counter()
+    for job in jobs:
+        key = (job.get("usrfn", False), job.get("startup", DEFAULT_STARTUP))
+        if key not in warm:
+            warm[key] = boot_warm(rom, core, *key, timeout)
+    print(f"Booted {len(warm)} warm machine(s) in {time.perf_counter() - started:.2f}s")
+
+    results = [None] * len(jobs)
+    waiting = list(enumerate(jobs))
+    running = {}  # pipe -> (job index, pid, data read so far)
+
+    while waiting or running:
+        while waiting and len(running) < workers:
+            index, job = waiting.pop(0)
+            pid, pipe = fork_job(warm[(job.get("usrfn", False), job.get("startup", DEFAULT_STARTUP))], job, timeout)
+            running[pipe] = (index, pid, [])
+
+        # read the pipes as results arrive, a child blocks until its output is read
+        ready, _, _ = select.select(list(running), [], [])
+        for pipe in ready:
+            index, pid, data = running[pipe]
+            chunk = os.read(pipe, 65536)
+            if chunk:
+                data.append(chunk)
+                continue
+
+            os.close(pipe)
+            os.waitpid(pid, 0)
+            del running[pipe]
+            try:
+                results[index] = json.loads(b"".join(data))
+            except ValueError:
+                results[index] = error_result(jobs[index], "worker died")
+            print_result(results[index])
+
+    return results
+
+
+def report(results, wall, workers):
+    cpu_seconds = sum(result["wall_seconds"] for result in results)
+    failed = [result for result in results if result["matched"] is False or result["stop_reason"].startswith(("error", "timeout"))]
+
+    print(f"\n{len(results)} jobs in {wall:.2f}s with {workers} workers = {len(results) / max(wall, 0.001):.2f} jobs/s, "
+          f"speedup {cpu_seconds / max(wall, 0.001):.1f}x, {len(failed)} failed")
+
+    return failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Altair 4K BASIC programs in parallel, headless")
+    parser.add_argument("rom", type=str, help="Altair 4K BASIC binary, rom=basic.rom")
+    parser.add_argument("jobs", type=str, help="Directory of .bas files (with optional .in input files) or a JSON manifest")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes, default one per CPU")
+    parser.add_argument("--core", type=str, choices=["table", "block", "legacy"], default="block", help="Emulator CPU core")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Stop a job after this many seconds, 0 = no limit")
+    parser.add_argument("--outdir", type=str, help="Save each job's TTY output here as NAME.txt")
+    parser.add_argument("--json", type=str, help="Save all results to this JSON file")
+    parser.add_argument("--fork", action="store_true", help="Boot BASIC once and fork each job from the warm machine (needs os.fork)")
+    args = parser.parse_args()
+
+    rom = os.path.abspath(args.rom.split('=')[1] if '=' in args.rom else args.rom)
+    jobs = load_jobs(args.jobs)
+    if not jobs:
+        parser.error(f"no jobs in {args.jobs}")
+
+    if args.fork and not hasattr(os, "fork"):
+        parser.error("--fork needs os.fork, e.g. Linux")
+
+    workers = max(1, min(args.workers or 1, len(jobs)))
+    started = time.perf_counter()
+    if args.fork:
+        try:
+            results = run_forked(jobs, rom, args.core, args.timeout, workers)
+        except RuntimeError as error:
+            sys.exit(f"--fork: {error}")
+    else:
+        results = run_pool(jobs, rom, args.core, args.timeout, workers)
+    failed = report(results, time.perf_counter() - started, workers)
+
+    if args.outdir:
+        os.makedirs(args.outdir, exist_ok=True)
+        for result in results:
+            save_output(result, args.outdir)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"rom": rom, "core": args.core, "workers": workers, "results": results}, f, indent=2)
+        print(f"Saved {args.json}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,212 @@
+# 2025 - Benchmarks for the Altair 8800 emulator CPU cores
+
+# Runs Altair 4K BASIC headless on the bundled .bas programs, plus a synthetic
+# 8080 loop that needs no ROM, and reports instructions per second, emulated
+# MHz, wall time and peak memory. Every run gets its own emulator process so
+# the peak memory and caches of one run don't leak into the next. Results can
+# be saved as JSON and compared with an earlier run, e.g. before and after a
+# change to the CPU loop:
+#
+#   py benchmark8800.py rom=BASICdisassembly-source.rom --json before.json
+#   py benchmark8800.py rom=BASICdisassembly-source.rom --compare before.json
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows - no peak memory figure
+
+CORES = ["table", "block", "legacy"]
+
+# Nested loop touching registers, memory, the stack and conditional branches, about 1.3M instructions
+LOOP_8080 = [
+    0x16, 0x0A,          # 0000 MVI D,10
+    0x00,                # 0002 NOP
+    0x06, 0x00,          # 0003 MVI B,0
+    0x0E, 0x28,          # 0005 MVI C,40
+    0x21, 0x00, 0x10,    # 0007 LXI H,1000
+    0x7E,                # 000A MOV A,M
+    0x80,                # 000B ADD B
+    0x77,                # 000C MOV M,A
+    0x23,                # 000D INX H
+    0xCD, 0x20, 0x00,    # 000E CALL 0020
+    0x05,                # 0011 DCR B
+    0xC2, 0x0A, 0x00,    # 0012 JNZ 000A
+    0x0D,                # 0015 DCR C
+    0xC2, 0x0A, 0x00,    # 0016 JNZ 000A
+    0x15,                # 0019 DCR D
+    0xC2, 0x03, 0x00,    # 001A JNZ 0003
+    0x76                 # 001D HLT
+]
+LOOP_8080_SUBROUTINE = [
+    0xC5,                # 0020 PUSH B
+    0xAF,                # 0021 XRA A
+    0xB0,                # 0022 ORA B
+    0xFE, 0x05,          # 0023 CPI 5
+    0xC1,                # 0025 POP B
+    0xC9                 # 0026 RET
+]
+
+WORKLOADS = {
+    "primenumber": {"program": "primenumber.bas"},
+    "sort": {"program": "sort.bas", "input": ["42", "7", "19", "3", "88", "61", "25", "11"]},
+    "ctof": {"program": "ctof.bas"},
+    "usrfn": {"program": "usrfn.bas", "usrfn": True, "startup": "4080,80,N,N,N"},
+    "loop8080": {"synthetic": True}
+}
+
+DEFAULT_STARTUP = "4096,80,N,N,N"
+
+
+def peak_memory_kb():
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS, KB elsewhere
+
+
+def run_workload(name, core, rom):
+    # One benchmark run in this process, returns the result record
+    import altairemulator
+
+    workload = WORKLOADS[name]
+    altair = altairemulator.Altair8800(None, None, None)
+    altair.play_sound = False
+    altair.core = core
+    altair.ttyout = io.StringIO()
+
+    # keep the emulator's own messages out of the result
+    with contextlib.redirect_stdout(io.StringIO()):
+        if workload.get("synthetic"):
+            altair.memory[0:len(LOOP_8080)] = bytes(LOOP_8080)
+            altair.memory[0x20:0x20 + len(LOOP_8080_SUBROUTINE)] = bytes(LOOP_8080_SUBROUTINE)
+        else:
+            altair.usrfunction = workload.get("usrfn", False)
+            altair.load_rom(rom)
+            for answer in workload.get("startup", DEFAULT_STARTUP).split(','):
+                altair.queue_line(answer)
+            altair.queue_text_file(workload["program"])
+            altair.queue_line("RUN")
+            for line in workload.get("input", []):
+                altair.queue_line(line)
+
+        started = time.perf_counter()
+        altair.execute()
+        wall = time.perf_counter() - started
+
+    return {
+        "workload": name,
+        "core": core,
+        "instructions": altair.instructions,
+        "tstates": altair.tstates,
+        "wall_seconds": round(wall, 4),
+        "instructions_per_second": round(altair.instructions / wall),
+        "emulated_mhz": round(altair.tstates / wall / 1e6, 3),
+        "peak_memory_kb": peak_memory_kb(),
+        "stop_reason": altair.stop_reason,
+        "output_chars": len(altair.ttyout.getvalue())
+    }
+
+
+def run_in_process(name, core, rom):
+    # Run one benchmark in a fresh interpreter, the result is the last line of its output
+    command = [sys.executable, os.path.abspath(__file__), "--worker", name, "--core", core]
+    if rom:
+        command.append(rom)
+
+    finished = subprocess.run(command, capture_output=True, text=True)
+    if finished.returncode != 0:
+        raise RuntimeError(f"{name} on the {core} core failed:\n{finished.stderr}")
+
+    return json.loads(finished.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def best_of(runs):
+    return min(runs, key=lambda result: result["wall_seconds"])
+
+
+def print_result(result):
+    peak = f"{result['peak_memory_kb'] / 1024:.1f} MB" if result["peak_memory_kb"] is not None else "-"
+    print(f"{result['workload']:12s} {result['core']:7s} {result['instructions']:>11,d} instr "
+          f"{result['wall_seconds']:8.3f}s {result['instructions_per_second'] / 1e6:7.3f} Minstr/s "
+          f"{result['emulated_mhz']:7.3f} MHz  peak {peak}  ({result['stop_reason']})")
+
+
+def compare(results, filename):
+    with open(filename, "r") as f:
+        baseline = json.load(f)
+
+    before = {(result["workload"], result["core"]): result for result in baseline["results"]}
+
+    print(f"\nCompared with {filename} (commit {baseline.get('commit')}):")
+    for result in results:
+        old = before.get((result["workload"], result["core"]))
+        if old is None:
+            continue
+        speedup = result["instructions_per_second"] / max(1, old["instructions_per_second"])
+        print(f"{result['workload']:12s} {result['core']:7s} {old['instructions_per_second'] / 1e6:7.3f} -> "
+              f"{result['instructions_per_second'] / 1e6:7.3f} Minstr/s  x{speedup:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Altair 8800 emulator CPU benchmarks")
+    parser.add_argument("rom", type=str, nargs="?", help="Altair 4K BASIC binary, rom=basic.rom - without it only the synthetic loop runs")
+    parser.add_argument("--workload", type=str, action="append", choices=list(WORKLOADS), help="Run only this workload - repeat for more")
+    parser.add_argument("--core", type=str, action="append", choices=CORES, help="CPU core to measure - repeat for more, default table and block")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per workload, the fastest is reported")
+    parser.add_argument("--json", type=str, help="Save the results to this JSON file")
+    parser.add_argument("--compare", type=str, help="JSON results of an earlier run to compare with")
+    parser.add_argument("--worker", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    rom = None
+    if args.rom:
+        rom = os.path.basename(args.rom.split('=')[1] if '=' in args.rom else args.rom)
+
+    if args.worker:
+        print(json.dumps(run_workload(args.worker, args.core[0], rom)))
+        sys.exit(0)
+
+    cores = args.core or ["table", "block"]
+    results = []
+    for name in args.workload or list(WORKLOADS):
+        if rom is None and not WORKLOADS[name].get("synthetic"):
+            print(f"{name:12s} skipped, no rom")
+            continue
+        for core in cores:
+            result = best_of([run_in_process(name, core, rom) for _ in range(max(1, args.repeat))])
+            print_result(result)
+            results.append(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results
+            }, f, indent=2)
+        print(f"\nSaved {args.json}")
+
+    if args.compare:
+        compare(results, args.compare)
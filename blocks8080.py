@@ -0,0 +1,201 @@
+# 2025 - Basic block translation cache for the Altair 8800 emulator
+
+# Straight-line runs of 8080 code are translated into one Python function per
+# block, built from the same statements as the cpu8080 handlers with the
+# address and operand bytes folded in as constants. A block ends after a jump,
+# call, return, RST or PCHL, or before an instruction that has to run through
+# the interpreter (IN, OUT, HLT, EI, DI, undefined opcodes).
+#
+# Blocks are cached by start address. The code map counts the cached blocks
+# covering every byte, and stores to a covered byte drop those blocks, so
+# self-modifying code (BASIC patches its own IN/OUT and USR code) is
+# translated again on its next run. The blocks are also indexed by the 256
+# byte pages they cover, so a store only looks at the blocks near it.
+
+import re
+
+from opcodes import opcodes_8080
+import cpu8080
+
+MAX_BLOCK_INSTRUCTIONS = 32
+PAGE_SHIFT = 8
+
+# Opcodes left to the interpreter handler: I/O and CPU state changes the machine has to see
+INTERPRETED = ('IN', 'OUT', 'HLT', 'EI', 'DI', 'UNUSED')
+
+# Instructions that end a block
+BRANCHES = ('JMP', 'CALL', 'RET', 'RST', 'PCHL')
+
+# A store statement in the handler source, e.g. "M[sp] = R.L"
+STORE = re.compile(r"^M\[(.*)\] = (.*)$")
+
+
+def instruction_length(opcode):
+    mnemonic = opcodes_8080[opcode][0]
+    if '16' in mnemonic:
+        return 3
+    if 'd8' in mnemonic:
+        return 2
+    return 1
+
+
+def ends_block(name):
+    if name in BRANCHES:
+        return True
+    return name[0] in 'JCR' and name[1:] in cpu8080.conditions
+
+
+def instruction_source(opcode, addr, memory):
+    # Handler statements for the instruction at addr with the operands and
+    # address as constants. Stores are followed by a code map check.
+    byte = memory[(addr + 1) & 0xFFFF]
+    word = byte | (memory[(addr + 2) & 0xFFFF] << 8)
+
+    lines = []
+    stores = False
+    for line in cpu8080.opcode_source(opcode):
+        line = line.replace(cpu8080.WORD, f"{word:#06x}").replace(cpu8080.BYTE, f"{byte:#04x}")
+        line = re.sub(r"\bpc\b", f"{addr:#06x}", line)
+
+        indent = line[:len(line) - len(line.lstrip())]
+        for statement in line.strip().split("; "):
+            store = STORE.match(statement)
+            if store:
+                stores = True
+                lines.append(f"{indent}w = {store.group(1)}")
+                lines.append(f"{indent}M[w] = {store.group(2)}")
+                lines.append(f"{indent}if C[w]: hit = X(w)")
+            else:
+                lines.append(indent + statement)
+
+    return lines, stores
+
+
+class BlockCache:
+    def __init__(self, cpu, table):
+        self.cpu = cpu
+        self.table = table  # interpreter handlers from cpu8080.build_dispatch_table
+        self.memory = cpu.memory
+        self.blocks = [None] * 0x10000  # start address -> block function or interpreter handler
+        self.tstates = [0] * 0x10000  # start address -> base clock cycles of the block
+        self.instructions = [0] * 0x10000  # start address -> instructions in the block
+        self.ranges = {}  # start address -> (first, last) byte covered
+        self.code_map = bytearray(0x10000)  # cached blocks covering each byte, a few at most as blocks are short
+        self.pages = [set() for _ in range(0x10000 >> PAGE_SHIFT)]  # page -> start addresses of the blocks covering it
+        self.translated = 0
+        self.invalidated = 0
+
+        self.namespace = {
+            'R': cpu.registers,
+            'M': cpu.memory,
+            'C': self.code_map,
+            'X': self.code_write,
+            'cpu': cpu,
+            'SZP': cpu8080.SZP,
+            'ADD_FLAGS': cpu8080.ADD_FLAGS,
+            'SUB_FLAGS': cpu8080.SUB_FLAGS,
+            'INR_FLAGS': cpu8080.INR_FLAGS,
+            'DCR_FLAGS': cpu8080.DCR_FLAGS
+        }
+
+
+    def translate(self, start):
+        # Decode the block at start, compile it and cache it
+        memory = self.memory
+        addr = start
+        body = []
+        tstates = 0
+        count = 0
+        has_stores = False
+        exits = []  # body index of each early exit, holding its address, clock cycles and instructions so far
+
+        while count < MAX_BLOCK_INSTRUCTIONS and addr < 0x10000:
+            opcode = memory[addr]
+            name = opcodes_8080[opcode][0].split(' ')[0]
+            length = instruction_length(opcode)
+
+            if name in INTERPRETED or addr + length > 0x10000:
+                break
+
+            lines, stores = instruction_source(opcode, addr, memory)
+            body.append(f"# {addr:04X} {opcodes_8080[opcode][0]}")
+            tstates += cpu8080.tstates_8080[opcode]
+            has_stores = has_stores or stores
+            count += 1
+            addr += length
+
+            if ends_block(name):
+                body += lines
+                break
+
+            # drop the fall through return, leave the block early if a store changed cached code
+            body += lines[:-1]
+            if stores:
+                exits.append(len(body))
+                body.append((addr, tstates, count))
+
+        if count == 0:
+            # the first instruction is left to the interpreter
+            opcode = memory[start]
+            block = self.table[opcode]
+            tstates = cpu8080.tstates_8080[opcode]
+            count = 1
+            addr = min(start + instruction_length(opcode), 0x10000)
+        else:
+            for index in exits:
+                # the rest of the block is translated again, so its cycles are not counted here
+                exit_addr, exit_tstates, exit_count = body[index]
+                body[index] = f"if hit: cpu.tstates -= {tstates - exit_tstates}; cpu.instructions -= {count - exit_count}; return {exit_addr:#06x}"
+            if not body[-1].startswith("return"):
+                body.append(f"return {addr:#06x}")
+            if has_stores:
+                body.insert(0, "hit = False")
+            source = f"def block_{start:04X}(pc):\n" + "\n".join("    " + line for line in body) + "\n"
+            exec(compile(source, f"<block {start:04X}>", "exec"), self.namespace)
+            block = self.namespace.pop(f"block_{start:04X}")
+            self.translated += 1
+
+        self.blocks[start] = block
+        self.tstates[start] = tstates
+        self.instructions[start] = count
+        self.ranges[start] = (start, addr - 1)
+        code_map = self.code_map
+        for byte in range(start, addr):
+            code_map[byte] += 1
+        for page in range(start >> PAGE_SHIFT, ((addr - 1) >> PAGE_SHIFT) + 1):
+            self.pages[page].add(start)
+
+        return block
+
+
+    def code_write(self, addr):
+        # A store hit cached code - drop every block covering addr
+        self.invalidate(addr, addr)
+        return True
+
+
+    def invalidate(self, first, last):
+        # Drop the cached blocks overlapping first..last, e.g. after a front panel deposit
+        ranges = self.ranges
+        pages = self.pages
+        code_map = self.code_map
+        nearby = set()
+        for page in range(first >> PAGE_SHIFT, (last >> PAGE_SHIFT) + 1):
+            nearby |= pages[page]
+
+        for start in nearby:
+            low, high = ranges[start]
+            if low > last or high < first:
+                continue
+
+            del ranges[start]
+            self.blocks[start] = None
+            for byte in range(low, high + 1):
+                code_map[byte] -= 1
+            for page in range(low >> PAGE_SHIFT, (high >> PAGE_SHIFT) + 1):
+                pages[page].discard(start)
+            self.invalidated += 1
+
+
+    def flush(self):
+        self.invalidate(0x0000, 0xFFFF)
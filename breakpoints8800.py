@@ -0,0 +1,220 @@
+# 2025 - Breakpoints and watchpoints for the Altair 8800 emulator debugger
+
+# PC breakpoints are kept in a dict keyed by address, so checking one
+# instruction costs the same however many breakpoints are set. Watchpoints
+# break before an instruction reads or writes a watched address; the memory
+# an instruction touches is worked out from its opcode and the registers.
+# Any breakpoint can have a register condition, e.g. "A == 0x0D and HL > 0x1000",
+# and a hit count: it only stops from that hit on. Conditions can use the
+# registers, BC, DE, HL, SP, PC and M[addr]; one that fails to evaluate, e.g.
+# a division by zero, stops the CPU with the error.
+#
+# Breakpoints are only checked by the instrumented CPU loop, which runs
+# whenever at least one is set.
+#
+# Specs, as used on the command line:
+#   0377               break at 0377
+#   0377:A == 0x0D     break at 0377 when A is 0D
+#   0377#5             break at 0377 from the 5th hit on
+#   :B == 0            break at any address when B is 0
+
+from opcodes import opcodes_8080
+import cpu8080
+
+WATCH_MODES = ["r", "w", "rw"]
+
+# Names a condition can use: the registers, the register pairs and M, the memory
+CONDITION_NAMES = set(cpu8080.RegisterFile.__slots__) | {"BC", "DE", "HL", "M"}
+
+
+def compile_condition(condition):
+    # Code for a condition, ValueError or SyntaxError if it can't be evaluated
+    code = compile(condition, "<breakpoint>", "eval")
+    unknown = sorted(set(code.co_names) - CONDITION_NAMES)
+    if unknown:
+        raise ValueError(f"unknown name {', '.join(unknown)} in {condition}")
+
+    return code
+
+
+class Breakpoint:
+    def __init__(self, kind, addr=None, condition=None, count=1):
+        self.kind = kind  # "pc", "condition", "read" or "write"
+        self.addr = addr
+        self.condition = condition
+        self.code = compile_condition(condition) if condition else None
+        self.count = count
+        self.hits = 0
+        self.error = None  # why the condition last failed to evaluate
+
+
+    def triggered(self, names):
+        # Count the hit and tell if the breakpoint stops the CPU
+        if self.code is not None:
+            self.error = None
+            try:
+                if not eval(self.code, {"__builtins__": {}}, names):
+                    return False
+            except Exception as error:
+                # stop and say why rather than end the CPU loop, e.g. a division by zero
+                self.error = f"{type(error).__name__}: {error}"
+                self.hits += 1
+                return True
+
+        self.hits += 1
+        return self.hits >= self.count
+
+
+    def __str__(self):
+        if self.kind == "condition":
+            text = "Break"
+        elif self.kind == "pc":
+            text = f"Breakpoint at {self.addr:04X}"
+        else:
+            text = f"Watchpoint {self.kind} {self.addr:04X}"
+
+        if self.condition:
+            text += f" if {self.condition}"
+        if self.count > 1:
+            text += f" from hit {self.count}"
+        if self.error:
+            text += f" ({self.error})"
+
+        return text + f" - {self.hits} hits"
+
+
+def parse_spec(spec):
+    # "ADDR[:CONDITION][#COUNT]" -> (addr or None, condition or None, count)
+    count = 1
+    if '#' in spec:
+        spec, count = spec.rsplit('#', 1)
+        count = int(count)
+
+    addr, _, condition = spec.partition(':')
+    addr = int(addr, 16) if addr.strip() else None
+
+    return addr, condition.strip() or None, count
+
+
+def memory_accesses(opcode, pc, R, M):
+    # Addresses the instruction at pc is about to read and write
+    name, _, operands = opcodes_8080[opcode][0].partition(' ')
+    operands = [operand.strip() for operand in operands.split(',')] if operands else []
+    hl = (R.H << 8) | R.L
+    sp = R.SP
+    word = M[(pc + 1) & 0xFFFF] | (M[(pc + 2) & 0xFFFF] << 8)
+    stack = (sp, (sp + 1) & 0xFFFF)
+    pushed = ((sp - 1) & 0xFFFF, (sp - 2) & 0xFFFF)
+
+    if name in ('STAX', 'LDAX'):
+        hi, lo = cpu8080.register_pairs[operands[0]]
+        addr = ((R[hi] << 8) | R[lo],)
+        return ((), addr) if name == 'STAX' else (addr, ())
+
+    if name in ('STA', 'LDA'):
+        return ((), (word,)) if name == 'STA' else ((word,), ())
+
+    if name in ('SHLD', 'LHLD'):
+        addrs = (word, (word + 1) & 0xFFFF)
+        return ((), addrs) if name == 'SHLD' else (addrs, ())
+
+    if name in ('INR', 'DCR') and operands[0] == 'M':
+        return (hl,), (hl,)
+
+    if name in ('MOV', 'MVI') and operands[0] == 'M':
+        return (), (hl,)
+
+    if operands and operands[-1] == 'M':
+        # MOV r,M and the accumulator arithmetic
+        return (hl,), ()
+
+    if name in ('PUSH', 'CALL', 'RST'):
+        return (), pushed
+
+    if name in ('POP', 'RET'):
+        return stack, ()
+
+    if name == 'XTHL':
+        return stack, stack
+
+    if name[0] in 'CR' and name[1:] in cpu8080.conditions:
+        if not eval(cpu8080.conditions[name[1:]], {"R": R}):
+            return (), ()
+        return ((), pushed) if name[0] == 'C' else (stack, ())
+
+    return (), ()
+
+
+class Breakpoints:
+    def __init__(self):
+        self.pc = {}  # address -> list of Breakpoint
+        self.conditions = []  # condition only, checked at every instruction
+        self.reads = {}  # address -> list of Breakpoint
+        self.writes = {}
+
+
+    def __len__(self):
+        return sum(len(found) for found in self.pc.values()) + len(self.conditions) + \
+               sum(len(found) for found in self.reads.values()) + sum(len(found) for found in self.writes.values())
+
+
+    def all(self):
+        for table in (self.pc, self.reads, self.writes):
+            for found in table.values():
+                yield from found
+        yield from self.conditions
+
+
+    def add(self, spec):
+        # PC or condition breakpoint from a spec string
+        addr, condition, count = parse_spec(spec)
+        if addr is None:
+            if condition is None:
+                raise ValueError(f"Empty breakpoint: {spec}")
+            self.conditions.append(Breakpoint("condition", condition=condition, count=count))
+        else:
+            self.pc.setdefault(addr, []).append(Breakpoint("pc", addr, condition, count))
+
+
+    def add_watch(self, spec, mode="w"):
+        addr, condition, count = parse_spec(spec)
+        if addr is None or mode not in WATCH_MODES:
+            raise ValueError(f"Bad watchpoint: {spec} {mode}")
+
+        if 'r' in mode:
+            self.reads.setdefault(addr, []).append(Breakpoint("read", addr, condition, count))
+        if 'w' in mode:
+            self.writes.setdefault(addr, []).append(Breakpoint("write", addr, condition, count))
+
+
+    def clear(self):
+        self.pc.clear()
+        self.conditions.clear()
+        self.reads.clear()
+        self.writes.clear()
+
+
+    def check(self, pc, opcode, registers, memory):
+        # The breakpoint stopping the instruction at pc, or None
+        candidates = list(self.pc.get(pc, ())) + self.conditions
+
+        if self.reads or self.writes:
+            reads, writes = memory_accesses(opcode, pc, registers, memory)
+            for addr in reads:
+                candidates += self.reads.get(addr, ())
+            for addr in writes:
+                candidates += self.writes.get(addr, ())
+
+        if not candidates:
+            return None
+
+        names = registers.as_dict()
+        names.update(BC=(registers.B << 8) | registers.C, DE=(registers.D << 8) | registers.E,
+                     HL=(registers.H << 8) | registers.L, M=memory)
+
+        stop = None
+        for breakpoint in candidates:
+            if breakpoint.triggered(names) and stop is None:
+                stop = breakpoint
+
+        return stop
@@ -0,0 +1,301 @@
+# 2025 - Console keyboard and sound backends for the Altair 8800 emulator
+
+# The keyboard backends read the console on their own thread and type the
+# characters into the emulator's TTY input buffer, so the CPU never polls the
+# keyboard itself. The sound backends play the teletype printer sound.
+#
+# Keyboard backends:  msvcrt  - Windows console
+#                     termios - POSIX terminal, non-blocking with select()
+#                     pipe    - stdin redirected from a file or pipe
+#                     queue   - in-memory only, input is queued by the program (headless)
+# Sound backends:     winsound - Windows
+#                     none     - silent
+#
+# SoundWorker plays the printer sound on a single thread.
+# TtyOutput collects the characters the CPU prints and writes them to the TTY
+# window and the console in chunks from the Tk thread.
+
+import os
+import sys
+import threading
+import time
+
+KEYBOARD_BACKENDS = ["auto", "msvcrt", "termios", "pipe", "queue"]
+SOUND_BACKENDS = ["auto", "winsound", "none"]
+TTY_FLUSH_MS = 20
+
+
+class QueueKeyboard:
+    # No console - characters only come from the emulator's own input buffer
+    def __init__(self):
+        self.altair = None
+        self.running = False
+        self.paused = False
+        self.lock = threading.Lock()
+
+
+    def start(self, altair):
+        self.altair = altair
+        self.running = True
+
+
+    def stop(self):
+        self.running = False
+
+
+    def pause(self):
+        # Hand the console back to input() for the debugger
+        with self.lock:
+            self.paused = True
+
+
+    def resume(self):
+        with self.lock:
+            self.paused = False
+
+
+    def deliver(self, data):
+        # Type console bytes into the TTY input: uppercase, ENTER = carriage return
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Skip characters that can't be decoded
+            return
+
+        self.altair.queue_input(map(ord, text.upper().replace('\n', '\r')))
+
+
+    def waiting(self):
+        # Leave keys in the console while the Altair is stopped for single stepping
+        return self.paused or self.altair.altair_singlestep
+
+
+class MsvcrtKeyboard(QueueKeyboard):
+    def start(self, altair):
+        super().start(altair)
+        threading.Thread(target=self.reader, daemon=True).start()
+
+
+    def reader(self):
+        import msvcrt
+
+        while self.running:
+            with self.lock:
+                if not self.waiting() and msvcrt.kbhit():
+                    while msvcrt.kbhit():
+                        self.deliver(msvcrt.getch())
+                    continue
+            time.sleep(0.01)
+
+
+class TermiosKeyboard(QueueKeyboard):
+    def __init__(self):
+        super().__init__()
+        self.fd = None
+        self.saved_mode = None
+
+
+    def start(self, altair):
+        import atexit
+        import termios
+        import tty
+
+        super().start(altair)
+        self.fd = sys.stdin.fileno()
+        self.saved_mode = termios.tcgetattr(self.fd)
+        atexit.register(self.restore)
+        # character at a time, no terminal echo - BASIC echoes what it reads
+        tty.setcbreak(self.fd)
+        threading.Thread(target=self.reader, daemon=True).start()
+
+
+    def stop(self):
+        super().stop()
+        self.restore()
+
+
+    def pause(self):
+        super().pause()
+        self.restore()
+
+
+    def resume(self):
+        import tty
+
+        super().resume()
+        if self.running:
+            tty.setcbreak(self.fd)
+
+
+    def restore(self):
+        import termios
+
+        if self.saved_mode is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.saved_mode)
+
+
+    def reader(self):
+        import select
+
+        while self.running:
+            with self.lock:
+                if not self.waiting():
+                    ready, _, _ = select.select([self.fd], [], [], 0.1)
+                    if ready:
+                        self.deliver(os.read(self.fd, 64))
+                    continue
+            time.sleep(0.1)
+
+
+class PipeKeyboard(QueueKeyboard):
+    # stdin is not a terminal - type everything read from it, stop at end of file
+    def start(self, altair):
+        super().start(altair)
+        threading.Thread(target=self.reader, daemon=True).start()
+
+
+    def reader(self):
+        fd = sys.stdin.fileno()
+
+        while self.running:
+            data = os.read(fd, 4096)
+            if not data:
+                break
+            self.deliver(data)
+
+
+def create_keyboard(name="auto"):
+    if name == "auto":
+        if not sys.stdin or not sys.stdin.isatty():
+            name = "pipe"
+        elif os.name == 'nt':
+            name = "msvcrt"
+        else:
+            name = "termios"
+
+    if name == "msvcrt":
+        return MsvcrtKeyboard()
+    if name == "termios":
+        return TermiosKeyboard()
+    if name == "pipe":
+        return PipeKeyboard()
+    if name == "queue":
+        return QueueKeyboard()
+
+    raise ValueError(f"Unknown keyboard backend: {name}")
+
+
+class NullSound:
+    def load(self, sound_file):
+        return None
+
+
+    def play(self, clip):
+        pass
+
+
+class WinsoundSound:
+    def load(self, sound_file):
+        # the whole WAV file, played from memory
+        with open(sound_file, 'rb') as f:
+            return f.read()
+
+
+    def play(self, clip):
+        import winsound
+
+        winsound.PlaySound(clip, winsound.SND_MEMORY)
+
+
+def create_sound(name="auto"):
+    if name == "auto":
+        name = "winsound" if os.name == 'nt' else "none"
+
+    if name == "winsound":
+        return WinsoundSound()
+    if name == "none":
+        return NullSound()
+
+    raise ValueError(f"Unknown sound backend: {name}")
+
+
+class SoundWorker:
+    # One long-lived thread plays the clip. Requests made while it is playing
+    # are coalesced into a single replay once it finishes.
+    def __init__(self, backend, sound_file):
+        self.backend = backend
+        self.clip = backend.load(sound_file)
+        self.requested = threading.Event()
+        threading.Thread(target=self.player, daemon=True).start()
+
+
+    def request(self):
+        self.requested.set()
+
+
+    def player(self):
+        while True:
+            self.requested.wait()
+            self.requested.clear()
+            self.backend.play(self.clip)
+
+
+def apply_backspaces(text):
+    # Erase characters followed by a backspace within a chunk. Returns the number
+    # of characters still to erase from text already shown and the remaining text.
+    erase = 0
+    kept = []
+    for char in text:
+        if char == '\b':
+            if kept:
+                kept.pop()
+            else:
+                erase += 1
+        else:
+            kept.append(char)
+
+    return erase, "".join(kept)
+
+
+class TtyOutput:
+    def __init__(self, text_widget, stream, interval=TTY_FLUSH_MS):
+        self.text_widget = text_widget
+        self.stream = stream
+        self.interval = interval
+        self.pending = []  # characters written by the CPU thread since the last flush
+        self.lock = threading.Lock()
+
+
+    def write(self, char):
+        with self.lock:
+            self.pending.append(char)
+
+
+    def start(self):
+        self.refresh()
+
+
+    def refresh(self):
+        self.flush()
+        self.text_widget.after(self.interval, self.refresh)
+
+
+    def flush(self):
+        # Tk thread only
+        with self.lock:
+            if not self.pending:
+                return
+            chunk, self.pending = self.pending, []
+
+        text = "".join(chunk)
+        self.stream.write(text)
+        self.stream.flush()
+
+        erase = 0
+        if '\b' in text:
+            erase, text = apply_backspaces(text)
+        if erase:
+            self.text_widget.delete(f"end - {erase + 1} chars", "end - 1 chars")
+        if text:
+            self.text_widget.insert("end", text)
+        self.text_widget.see("end")
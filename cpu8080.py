@@ -0,0 +1,417 @@
+# 2025 - Table driven Intel 8080 CPU core for the Altair 8800 emulator
+
+# Every entry in opcodes_8080 is turned into a small Python handler function.
+# A handler is called with the address of the opcode, executes the instruction
+# against the machine registers and memory, and returns the address of the
+# next instruction. The 256 handlers are kept in a list so the CPU loop can
+# dispatch with one index instead of walking a long if/elif chain.
+
+from opcodes import opcodes_8080
+from flags8080 import SZP, ADD_FLAGS, SUB_FLAGS, INR_FLAGS, DCR_FLAGS
+
+# Register pairs used by LXI, INX, DCX, DAD, PUSH and POP
+register_pairs = {
+    'B': ('B', 'C'),
+    'D': ('D', 'E'),
+    'H': ('H', 'L')
+}
+
+# Jump, call and return conditions - expression is true when the branch is taken
+conditions = {
+    'NZ': "not R.FLAGS & 0x40",
+    'Z':  "R.FLAGS & 0x40",
+    'NC': "not R.FLAGS & 0x01",
+    'C':  "R.FLAGS & 0x01",
+    'PO': "not R.FLAGS & 0x04",
+    'PE': "R.FLAGS & 0x04",
+    'P':  "not R.FLAGS & 0x80",
+    'M':  "R.FLAGS & 0x80"
+}
+
+# Extra clock cycles for a taken conditional CALL or RET, opcodes_8080 lists the not taken cycles
+TAKEN_EXTRA_TSTATES = 6
+
+# Base clock cycles per opcode, indexed by opcode
+tstates_8080 = [opcodes_8080[opcode][1] for opcode in range(0x100)]
+
+# Operand fetches relative to the opcode address
+BYTE = "M[pc + 1]"
+WORD = "(M[pc + 1] | (M[pc + 2] << 8))"
+HL = "((R.H << 8) | R.L)"
+
+
+# Intel 8080 register file. Registers are slots on a small object so the
+# handlers use fast attribute access, while the debugger can still read
+# and write them by name, e.g. registers['SP'].
+class RegisterFile:
+    __slots__ = ('A', 'B', 'C', 'D', 'E', 'H', 'L', 'PC', 'SP', 'FLAGS')
+
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self):
+        self.A = 0x00
+        self.B = 0x00
+        self.C = 0x00
+        self.D = 0x00
+        self.E = 0x00
+        self.H = 0x00
+        self.L = 0x00
+        self.PC = 0x0000
+        self.SP = 0xFFFF
+        self.FLAGS = 0x02
+
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+
+    def __setitem__(self, name, value):
+        setattr(self, name, value)
+
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def reg(name):
+    # Source/destination expression for an 8 bit register or M = memory at (HL)
+    if name == 'M':
+        return f"M[{HL}]"
+    return f"R.{name}"
+
+
+def push(value_hi, value_lo):
+    return [
+        "sp = (R.SP - 2) & 0xFFFF",
+        f"M[(sp + 1) & 0xFFFF] = {value_hi}",
+        f"M[sp] = {value_lo}",
+        "R.SP = sp"
+    ]
+
+
+def pop(dest_hi, dest_lo):
+    return [
+        "sp = R.SP",
+        f"{dest_lo} = M[sp]",
+        f"{dest_hi} = M[(sp + 1) & 0xFFFF]",
+        "R.SP = (sp + 2) & 0xFFFF"
+    ]
+
+
+def alu(operation, value):
+    # Accumulator arithmetic and logic shared by the register, memory and immediate forms.
+    # FLAGS comes from one lookup in the flags8080 tables.
+    if operation in ('ADD', 'ADI'):
+        return [
+            f"a = R.A; v = {value}",
+            "R.FLAGS = ADD_FLAGS[(a << 8) | v]",
+            "R.A = (a + v) & 0xFF"
+        ]
+    if operation in ('ADC', 'ACI'):
+        return [
+            f"a = R.A; v = {value}; c = R.FLAGS & 0x01",
+            "R.FLAGS = ADD_FLAGS[(c << 16) | (a << 8) | v]",
+            "R.A = (a + v + c) & 0xFF"
+        ]
+    if operation in ('SUB', 'SUI'):
+        return [
+            f"a = R.A; v = {value}",
+            "R.FLAGS = SUB_FLAGS[(a << 8) | v]",
+            "R.A = (a - v) & 0xFF"
+        ]
+    if operation in ('SBB', 'SBI'):
+        return [
+            f"a = R.A; v = {value}; c = R.FLAGS & 0x01",
+            "R.FLAGS = SUB_FLAGS[(c << 16) | (a << 8) | v]",
+            "R.A = (a - v - c) & 0xFF"
+        ]
+    if operation in ('CMP', 'CPI'):
+        return [f"R.FLAGS = SUB_FLAGS[(R.A << 8) | {value}]"]
+    if operation in ('ANA', 'ANI'):
+        return [
+            f"a = R.A; v = {value}; r = a & v",
+            "R.FLAGS = SZP[r] | (((a | v) & 0x08) << 1)",
+            "R.A = r"
+        ]
+    if operation in ('XRA', 'XRI'):
+        return [
+            f"r = R.A ^ {value}",
+            "R.FLAGS = SZP[r]",
+            "R.A = r"
+        ]
+    # ORA, ORI
+    return [
+        f"r = R.A | {value}",
+        "R.FLAGS = SZP[r]",
+        "R.A = r"
+    ]
+
+
+def opcode_source(opcode):
+    # Python statements for one instruction. 'pc' holds the address of the
+    # opcode and the statements end by returning the address of the next instruction.
+    mnemonic = opcodes_8080[opcode][0]
+    name, _, operands = mnemonic.partition(' ')
+    operands = [operand.strip() for operand in operands.split(',')] if operands else []
+
+    if name == 'NOP':
+        return ["return pc + 1"]
+
+    if name == 'LXI':
+        if operands[0] == 'SP':
+            return [f"R.SP = {WORD}", "return pc + 3"]
+        hi, lo = register_pairs[operands[0]]
+        return [f"R.{lo} = M[pc + 1]", f"R.{hi} = M[pc + 2]", "return pc + 3"]
+
+    if name in ('STAX', 'LDAX'):
+        hi, lo = register_pairs[operands[0]]
+        addr = f"((R.{hi} << 8) | R.{lo})"
+        if name == 'STAX':
+            return [f"M[{addr}] = R.A", "return pc + 1"]
+        return [f"R.A = M[{addr}]", "return pc + 1"]
+
+    if name in ('INX', 'DCX'):
+        step = "+ 1" if name == 'INX' else "- 1"
+        if operands[0] == 'SP':
+            return [f"R.SP = (R.SP {step}) & 0xFFFF", "return pc + 1"]
+        hi, lo = register_pairs[operands[0]]
+        return [
+            f"rp = (((R.{hi} << 8) | R.{lo}) {step}) & 0xFFFF",
+            f"R.{hi} = rp >> 8",
+            f"R.{lo} = rp & 0xFF",
+            "return pc + 1"
+        ]
+
+    if name == 'INR':
+        target = reg(operands[0])
+        return [
+            f"r = ({target} + 1) & 0xFF",
+            f"{target} = r",
+            "R.FLAGS = (R.FLAGS & 0x01) | INR_FLAGS[r]",
+            "return pc + 1"
+        ]
+
+    if name == 'DCR':
+        target = reg(operands[0])
+        return [
+            f"r = ({target} - 1) & 0xFF",
+            f"{target} = r",
+            "R.FLAGS = (R.FLAGS & 0x01) | DCR_FLAGS[r]",
+            "return pc + 1"
+        ]
+
+    if name == 'MVI':
+        return [f"{reg(operands[0])} = {BYTE}", "return pc + 2"]
+
+    if name == 'MOV':
+        return [f"{reg(operands[0])} = {reg(operands[1])}", "return pc + 1"]
+
+    if name == 'RLC':
+        return [
+            "a = R.A",
+            "R.A = ((a << 1) | (a >> 7)) & 0xFF",
+            "R.FLAGS = (R.FLAGS & 0xFE) | (a >> 7)",
+            "return pc + 1"
+        ]
+
+    if name == 'RRC':
+        return [
+            "a = R.A",
+            "R.A = ((a >> 1) | (a << 7)) & 0xFF",
+            "R.FLAGS = (R.FLAGS & 0xFE) | (a & 0x01)",
+            "return pc + 1"
+        ]
+
+    if name == 'RAL':
+        return [
+            "a = R.A",
+            "R.A = ((a << 1) | (R.FLAGS & 0x01)) & 0xFF",
+            "R.FLAGS = (R.FLAGS & 0xFE) | (a >> 7)",
+            "return pc + 1"
+        ]
+
+    if name == 'RAR':
+        return [
+            "a = R.A",
+            "R.A = (a >> 1) | ((R.FLAGS & 0x01) << 7)",
+            "R.FLAGS = (R.FLAGS & 0xFE) | (a & 0x01)",
+            "return pc + 1"
+        ]
+
+    if name == 'DAD':
+        if operands[0] == 'SP':
+            value = "R.SP"
+        else:
+            hi, lo = register_pairs[operands[0]]
+            value = f"((R.{hi} << 8) | R.{lo})"
+        return [
+            f"r = {HL} + {value}",
+            "R.H = (r >> 8) & 0xFF",
+            "R.L = r & 0xFF",
+            "R.FLAGS = (R.FLAGS & 0xFE) | (r >> 16)",
+            "return pc + 1"
+        ]
+
+    if name == 'SHLD':
+        return [
+            f"addr = {WORD}",
+            "M[addr] = R.L",
+            "M[(addr + 1) & 0xFFFF] = R.H",
+            "return pc + 3"
+        ]
+
+    if name == 'LHLD':
+        return [
+            f"addr = {WORD}",
+            "R.L = M[addr]",
+            "R.H = M[(addr + 1) & 0xFFFF]",
+            "return pc + 3"
+        ]
+
+    if name == 'STA':
+        return [f"M[{WORD}] = R.A", "return pc + 3"]
+
+    if name == 'LDA':
+        return [f"R.A = M[{WORD}]", "return pc + 3"]
+
+    if name == 'DAA':
+        return [
+            "a = R.A; f = R.FLAGS; carry = f & 0x01; correction = 0",
+            "if (a & 0x0F) > 0x09 or f & 0x10:",
+            "    correction = 0x06",
+            "if a > 0x99 or carry:",
+            "    correction |= 0x60",
+            "    carry = 0x01",
+            "r = a + correction",
+            "R.FLAGS = SZP[r & 0xFF] | carry | ((a ^ correction ^ r) & 0x10)",
+            "R.A = r & 0xFF",
+            "return pc + 1"
+        ]
+
+    if name == 'CMA':
+        return ["R.A ^= 0xFF", "return pc + 1"]
+
+    if name == 'STC':
+        return ["R.FLAGS |= 0x01", "return pc + 1"]
+
+    if name == 'CMC':
+        return ["R.FLAGS ^= 0x01", "return pc + 1"]
+
+    if name == 'HLT':
+        return ["cpu.halt(pc)", "return pc + 1"]
+
+    if name in ('ADD', 'ADC', 'SUB', 'SBB', 'ANA', 'XRA', 'ORA', 'CMP'):
+        return alu(name, reg(operands[0])) + ["return pc + 1"]
+
+    if name in ('ADI', 'ACI', 'SUI', 'SBI', 'ANI', 'XRI', 'ORI', 'CPI'):
+        return alu(name, BYTE) + ["return pc + 2"]
+
+    if name == 'RET':
+        return pop("hi", "lo") + ["return (hi << 8) | lo"]
+
+    if name[0] == 'R' and name[1:] in conditions:
+        return [f"if {conditions[name[1:]]}:", f"    cpu.tstates += {TAKEN_EXTRA_TSTATES}"] + \
+               ["    " + line for line in pop("hi", "lo")] + \
+               ["    return (hi << 8) | lo", "return pc + 1"]
+
+    if name == 'JMP':
+        return [f"return {WORD}"]
+
+    if name[0] == 'J' and name[1:] in conditions:
+        return [f"if {conditions[name[1:]]}:", f"    return {WORD}", "return pc + 3"]
+
+    if name == 'CALL':
+        # the address is fetched before the push, which may overwrite it
+        return [f"addr = {WORD}", "ret = pc + 3"] + push("ret >> 8", "ret & 0xFF") + ["return addr"]
+
+    if name[0] == 'C' and name[1:] in conditions:
+        return [f"if {conditions[name[1:]]}:", f"    cpu.tstates += {TAKEN_EXTRA_TSTATES}", f"    addr = {WORD}", "    ret = pc + 3"] + \
+               ["    " + line for line in push("ret >> 8", "ret & 0xFF")] + \
+               ["    return addr", "return pc + 3"]
+
+    if name == 'RST':
+        return ["ret = pc + 1"] + push("ret >> 8", "ret & 0xFF") + [f"return {int(operands[0]) * 8:#04x}"]
+
+    if name == 'PUSH':
+        if operands[0] == 'PSW':
+            return push("R.A", "R.FLAGS") + ["return pc + 1"]
+        hi, lo = register_pairs[operands[0]]
+        return push(f"R.{hi}", f"R.{lo}") + ["return pc + 1"]
+
+    if name == 'POP':
+        if operands[0] == 'PSW':
+            return pop("R.A", "f") + ["R.FLAGS = (f & 0xD5) | 0x02", "return pc + 1"]
+        hi, lo = register_pairs[operands[0]]
+        return pop(f"R.{hi}", f"R.{lo}") + ["return pc + 1"]
+
+    if name == 'IN':
+        return [f"R.A = cpu.in_instruction(pc, {BYTE}) & 0xFF", "return pc + 2"]
+
+    if name == 'OUT':
+        return [f"cpu.out_instruction(R.A, {BYTE})", "return pc + 2"]
+
+    if name == 'XTHL':
+        return [
+            "sp = R.SP",
+            "l = M[sp]; h = M[(sp + 1) & 0xFFFF]",
+            "M[sp] = R.L; M[(sp + 1) & 0xFFFF] = R.H",
+            "R.L = l; R.H = h",
+            "return pc + 1"
+        ]
+
+    if name == 'PCHL':
+        return [f"return {HL}"]
+
+    if name == 'SPHL':
+        return [f"R.SP = {HL}", "return pc + 1"]
+
+    if name == 'XCHG':
+        return [
+            "R.D, R.H = R.H, R.D",
+            "R.E, R.L = R.L, R.E",
+            "return pc + 1"
+        ]
+
+    if name == 'DI':
+        return ["cpu.interrupt_enabled = False", "return pc + 1"]
+
+    if name == 'EI':
+        return ["cpu.interrupt_enabled = True", "return pc + 1"]
+
+    # UNUSED opcodes
+    return [f"cpu.undefined_opcode({opcode:#04x}, pc)", "return pc + 1"]
+
+
+def handler_source(opcode):
+    lines = [f"def op_{opcode:02X}(pc):  # {opcodes_8080[opcode][0]}"]
+    lines += ["    " + line for line in opcode_source(opcode)]
+    return "\n".join(lines) + "\n"
+
+
+# The handler source only depends on opcodes_8080, so it is compiled once per process
+handlers_code = None
+
+
+def build_dispatch_table(cpu):
+    # Bind all 256 handlers to this machine's registers and memory
+    global handlers_code
+
+    if handlers_code is None:
+        source = "\n".join(handler_source(opcode) for opcode in range(0x100))
+        handlers_code = compile(source, "<cpu8080>", "exec")
+
+    namespace = {
+        'R': cpu.registers,
+        'M': cpu.memory,
+        'cpu': cpu,
+        'SZP': SZP,
+        'ADD_FLAGS': ADD_FLAGS,
+        'SUB_FLAGS': SUB_FLAGS,
+        'INR_FLAGS': INR_FLAGS,
+        'DCR_FLAGS': DCR_FLAGS
+    }
+    exec(handlers_code, namespace)
+
+    return [namespace[f"op_{opcode:02X}"] for opcode in range(0x100)]
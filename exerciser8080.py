@@ -0,0 +1,259 @@
+# 2025 - 8080 instruction set exerciser runner for the Altair 8800 emulator
+
+# Runs CP/M 8080 test programs such as 8080EXER/8080EXM, 8080PRE, CPUTEST,
+# TST8080 and CPUDIAG headless at full speed on the emulator CPU cores, to
+# check a core against real 8080 results. The .COM file is loaded at 0100
+# with a minimal CP/M environment around it:
+#
+#   0000  JMP WBOOT       warm boot, the program has finished
+#   0005  JMP BDOS        BDOS entry, 0006 also holds the top of the TPA
+#   BDOS  OUT BDOS_PORT   console functions handled by the runner
+#         RET
+#   WBOOT MVI C,0
+#         OUT BDOS_PORT
+#
+# Only the BDOS functions the exercisers use are handled: 0 (warm boot),
+# 2 (console output), 9 (print a $ terminated string) and 11 (console status).
+#
+# The exercisers print one line per instruction group with the CRC of the
+# results, e.g. "aluop nn......  ERROR **** crc expected:9e922f9e found:1a2b3c4d".
+# The runner collects them, reports the groups that fail and, with more than
+# one core, the groups where a core's CRC differs from the first core's:
+#
+#   py exerciser8080.py 8080EXM.COM --core table --core block
+
+import argparse
+import re
+import sys
+import threading
+import time
+
+import altairemulator
+
+CORES = ["table", "block", "legacy"]
+
+TPA = 0x0100
+BDOS_ADDR = 0xFF00
+WBOOT_ADDR = BDOS_ADDR + 3
+BDOS_PORT = 0xFE  # not used by the Altair SIO or the sense switches
+
+CPM_PAGE_ZERO = [
+    0xC3, WBOOT_ADDR & 0xFF, WBOOT_ADDR >> 8,    # 0000 JMP WBOOT
+    0x00, 0x00,                                  # 0003 IOBYTE, current drive
+    0xC3, BDOS_ADDR & 0xFF, BDOS_ADDR >> 8       # 0005 JMP BDOS
+]
+CPM_BDOS = [
+    0xD3, BDOS_PORT,     # BDOS  OUT BDOS_PORT
+    0xC9,                #       RET
+    0x0E, 0x00,          # WBOOT MVI C,0
+    0xD3, BDOS_PORT      #       OUT BDOS_PORT
+]
+
+# "dad <b,d,h,sp>................  PASS! crc is:14474ba6"
+GROUP_LINE = re.compile(r"^(?P<group>\S.*?)\s*\.{3,}\s*(?P<result>.*)$")
+CRC_MISMATCH = re.compile(r"crc expected:\s*(?P<expected>[0-9a-fA-F]{8})\s+found:\s*(?P<found>[0-9a-fA-F]{8})")
+CRC_VALUE = re.compile(r"crc is:\s*(?P<found>[0-9a-fA-F]{8})")
+
+
+class ExerciserConsole:
+    # BDOS console output, split into lines and parsed into group results
+    def __init__(self, echo=None):
+        self.echo = echo  # stream the program output is copied to as it runs
+        self.line = []
+        self.lines = []
+        self.groups = []  # {"group", "passed", "expected", "found"} per instruction group
+        self.errors = []  # other lines reporting a failure
+
+
+    def write(self, text):
+        for char in text:
+            if char == '\n':
+                self.end_line()
+            elif char != '\r':
+                self.line.append(char)
+
+
+    def end_line(self):
+        line = "".join(self.line).rstrip()
+        self.line = []
+        self.lines.append(line)
+
+        if self.echo is not None:
+            self.echo.write(line + "\n")
+            self.echo.flush()
+
+        found = GROUP_LINE.match(line)
+        if found and found.group("result"):
+            result = found.group("result")
+            mismatch = CRC_MISMATCH.search(result)
+            value = mismatch or CRC_VALUE.search(result)
+            self.groups.append({
+                "group": found.group("group"),
+                "passed": mismatch is None and "ERROR" not in result.upper(),
+                "expected": mismatch.group("expected").lower() if mismatch else None,
+                "found": value.group("found").lower() if value else None
+            })
+        elif "ERROR" in line.upper() or "FAIL" in line.upper():
+            self.errors.append(line)
+
+
+    def close(self):
+        if self.line:
+            self.end_line()
+
+
+class ExerciserAltair(altairemulator.Altair8800):
+    # Headless Altair with the BDOS shim on BDOS_PORT
+    def __init__(self, console):
+        super().__init__(None, None, None)
+        self.play_sound = False
+        self.console = console
+
+
+    def load_com(self, filename):
+        with open(filename, "rb") as f:
+            program = f.read()
+
+        if TPA + len(program) > BDOS_ADDR:
+            raise ValueError(f"{filename} is too large for the TPA")
+
+        self.memory[0:len(CPM_PAGE_ZERO)] = bytes(CPM_PAGE_ZERO)
+        self.memory[BDOS_ADDR:BDOS_ADDR + len(CPM_BDOS)] = bytes(CPM_BDOS)
+        self.memory[TPA:TPA + len(program)] = program
+
+        # started by the CCP: a return from the program goes to the warm boot
+        self.registers.SP = BDOS_ADDR - 2
+        self.memory[BDOS_ADDR - 2] = 0x00
+        self.memory[BDOS_ADDR - 1] = 0x00
+        self.registers.PC = TPA
+
+
+    def output_port(self, value, port):
+        if port == BDOS_PORT:
+            self.bdos()
+        else:
+            super().output_port(value, port)
+
+
+    def bdos(self):
+        R = self.registers
+        function = R.C
+
+        if function == 0:
+            self.running = False
+            self.stop_reason = "warm boot"
+        elif function == 2:
+            self.console.write(chr(R.E & 0x7F))
+        elif function == 9:
+            addr = (R.D << 8) | R.E
+            text = []
+            while self.memory[addr] != ord('$'):
+                text.append(chr(self.memory[addr] & 0x7F))
+                addr = (addr + 1) & 0xFFFF
+            self.console.write("".join(text))
+        elif function == 11:
+            R.A = 0x00  # no key pressed
+            R.L = 0x00
+        else:
+            self.running = False
+            self.stop_reason = f"BDOS function {function} not supported"
+
+
+    def stop_after(self, seconds):
+        # Timer callback for --timeout
+        self.stop_reason = f"timeout after {seconds}s"
+        self.running = False
+
+
+def run_exerciser(filename, core, timeout=0, echo=None):
+    # Run one exerciser on one core, returns the result record
+    console = ExerciserConsole(echo)
+    altair = ExerciserAltair(console)
+    altair.core = core
+    altair.load_com(filename)
+
+    timer = None
+    if timeout > 0:
+        timer = threading.Timer(timeout, altair.stop_after, args=(timeout,))
+        timer.daemon = True
+        timer.start()
+
+    started = time.perf_counter()
+    altair.execute()
+    wall = time.perf_counter() - started
+
+    if timer is not None:
+        timer.cancel()
+    console.close()
+
+    return {
+        "program": filename,
+        "core": core,
+        "stop_reason": altair.stop_reason,
+        "instructions": altair.instructions,
+        "tstates": altair.tstates,
+        "wall_seconds": round(wall, 3),
+        "groups": console.groups,
+        "errors": console.errors
+    }
+
+
+def result_failed(result):
+    return result["stop_reason"] != "warm boot" or len(result["errors"]) > 0 or \
+           any(not group["passed"] for group in result["groups"])
+
+
+def print_summary(result):
+    failed = [group for group in result["groups"] if not group["passed"]]
+    rate = result["instructions"] / max(result["wall_seconds"], 0.001) / 1e6
+
+    print(f"{result['core']:7s} {len(result['groups'])} groups, {len(failed)} failed, "
+          f"{result['instructions']:,d} instr in {result['wall_seconds']:.2f}s = {rate:.3f} Minstr/s ({result['stop_reason']})")
+    for group in failed:
+        if group["expected"]:
+            print(f"        FAIL {group['group']}: crc expected {group['expected']} found {group['found']}")
+        else:
+            print(f"        FAIL {group['group']}")
+    for line in result["errors"]:
+        print(f"        {line}")
+
+
+def compare_cores(reference, result):
+    # Groups where a core's CRC differs from the reference core, returns the number found
+    theirs = {group["group"]: group["found"] for group in result["groups"]}
+    mismatches = 0
+
+    for group in reference["groups"]:
+        found = theirs.get(group["group"], "missing")
+        if found != group["found"]:
+            print(f"        {result['core']} differs from {reference['core']} on {group['group']}: "
+                  f"{found} vs {group['found']}")
+            mismatches += 1
+
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run CP/M 8080 instruction exercisers on the Altair 8800 emulator CPU cores")
+    parser.add_argument("program", type=str, help="CP/M .COM exerciser, e.g. 8080EXM.COM, 8080PRE.COM, CPUTEST.COM, TST8080.COM")
+    parser.add_argument("--core", type=str, action="append", choices=CORES, help="CPU core to run - repeat for more, the first is the reference, default table")
+    parser.add_argument("--timeout", type=float, default=0, help="Stop a run after this many seconds, 0 = no limit")
+    parser.add_argument("--quiet", action="store_true", help="Do not show the exerciser output while it runs")
+    args = parser.parse_args()
+
+    results = []
+    for core in args.core or ["table"]:
+        if not args.quiet:
+            print(f"== {args.program} on the {core} core ==")
+        results.append(run_exerciser(args.program, core, args.timeout, None if args.quiet else sys.stdout))
+
+    print()
+    failures = 0
+    for result in results:
+        print_summary(result)
+        if result_failed(result):
+            failures += 1
+        if result is not results[0]:
+            failures += compare_cores(results[0], result)
+
+    sys.exit(1 if failures else 0)
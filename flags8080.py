@@ -0,0 +1,85 @@
+# 2025 - Precomputed Intel 8080 flag tables for the Altair 8800 emulator
+
+# The flag byte of every 8 bit result is computed once at import so the CPU
+# core can set FLAGS with a table lookup instead of clearing and setting
+# each bit and counting parity bits per instruction. The 128K ADD and SUB
+# tables are put together a row of 256 operands at a time from byte slices,
+# a per entry loop would add about 100 ms to every start.
+#
+# Flag register bits: S Z 0 AC 0 P 1 CY
+
+FLAG_CARRY = 0x01
+FLAG_ALWAYS_ONE = 0x02
+FLAG_PARITY = 0x04
+FLAG_AUX_CARRY = 0x10
+FLAG_ZERO = 0x40
+FLAG_SIGN = 0x80
+
+
+def build_szp():
+    # Sign, zero and even parity of an 8 bit value, plus the always-one bit
+    table = bytearray(0x100)
+
+    for value in range(0x100):
+        flags = (value & FLAG_SIGN) | FLAG_ALWAYS_ONE
+        if value == 0:
+            flags |= FLAG_ZERO
+        if bin(value).count('1') % 2 == 0:
+            flags |= FLAG_PARITY
+        table[value] = flags
+
+    return bytes(table)
+
+
+SZP = build_szp()
+
+
+def or_rows(*rows):
+    # Byte by byte OR of equal length rows
+    value = 0
+    for row in rows:
+        value |= int.from_bytes(row, "little")
+
+    return value.to_bytes(len(rows[0]), "little")
+
+
+def build_add_flags():
+    # Index: (carry in << 16) | (A << 8) | operand
+    rows = []
+    szp = SZP * 2
+
+    for carry in (0, 1):
+        for a in range(0x100):
+            start = a + carry  # result of operand 0, the operands carry out from 0x100 - start on
+            half = (a & 0x0F) + carry  # the low nibbles carry into bit 4 from 0x10 - half on
+            rows.append(or_rows(szp[start:start + 0x100],
+                                bytes(0x100 - start) + bytes([FLAG_CARRY]) * start,
+                                (bytes(0x10 - half) + bytes([FLAG_AUX_CARRY]) * half) * 0x10))
+
+    return b"".join(rows)
+
+
+def build_sub_flags():
+    # Index: (borrow in << 16) | (A << 8) | operand. CY is set on borrow and AC
+    # follows the 8080, which subtracts by adding the complement of the operand.
+    rows = []
+    szp = SZP[::-1] * 2  # results fall as the operand rises
+
+    for borrow in (0, 1):
+        for a in range(0x100):
+            start = a - borrow  # result of operand 0, the operands borrow from start + 1 on
+            half = max(0, (a & 0x0F) - borrow + 1)  # low nibble operands that don't borrow from bit 4
+            first = (0xFF - start) & 0xFF
+            rows.append(or_rows(szp[first:first + 0x100],
+                                bytes(start + 1) + bytes([FLAG_CARRY]) * (0xFF - start),
+                                (bytes([FLAG_AUX_CARRY]) * half + bytes(0x10 - half)) * 0x10))
+
+    return b"".join(rows)
+
+
+ADD_FLAGS = build_add_flags()
+SUB_FLAGS = build_sub_flags()
+
+# INR and DCR leave CY alone, index is the 8 bit result
+INR_FLAGS = bytes(SZP[value] | (FLAG_AUX_CARRY if (value & 0x0F) == 0x00 else 0) for value in range(0x100))
+DCR_FLAGS = bytes(SZP[value] | (FLAG_AUX_CARRY if (value & 0x0F) != 0x0F else 0) for value in range(0x100))
@@ -2,7 +2,7 @@
 
 # Class to realize Altair 8800 front panel LEDs
 
-import tkinter as tk
+import time
 
 led_info = { # X, Y, Label
     # Data LEDs
@@ -50,6 +50,108 @@ led_info = { # X, Y, Label
     35: [70, 25, "INTE"]
 }
 
+# First LED number of each group in led_info
+DATA_LED_BASE = 0
+ADDRESS_LED_BASE = 8
+STATUS_LED_BASE = 24
+
+# Default front panel refresh rate
+DEFAULT_FPS = 30
+
+
+# Front panel lamp state. The CPU thread only writes integers here and never
+# touches Tk; PanelRenderer paints the LEDs from the Tk thread.
+class PanelState:
+    def __init__(self):
+        self.data = 0x00        # D0-D7
+        self.address = 0x0000   # A0-A15
+        self.status = 0x000     # status LEDs, bit 0 = LED 24 (HLDA)
+        self.pulses = 0x000     # status LEDs lit for at least one frame, e.g. INP/OUT strobes
+
+
+    def status_on(self, ledno):
+        self.status |= 1 << (ledno - STATUS_LED_BASE)
+
+
+    def status_off(self, ledno):
+        self.status &= ~(1 << (ledno - STATUS_LED_BASE))
+
+
+    def pulse(self, ledno):
+        self.pulses |= 1 << (ledno - STATUS_LED_BASE)
+
+
+    def lamps(self):
+        # All 36 LEDs as one integer, bit n = LED n
+        return (self.data << DATA_LED_BASE) | (self.address << ADDRESS_LED_BASE) | ((self.status | self.pulses) << STATUS_LED_BASE)
+
+
+# Repaints the front panel from a PanelState on a Tk after() timer,
+# only touching the LEDs whose state changed since the last frame.
+class PanelRenderer:
+    def __init__(self, canvas, leds, panel, fps=DEFAULT_FPS):
+        self.canvas = canvas
+        self.leds = leds
+        self.panel = panel
+        self.interval = 0
+        self.set_fps(fps)
+        self.shown = 0  # lamps painted in the last frame
+        self.animation = None  # (frames, start time) while a lamp animation plays
+
+
+    def set_fps(self, fps):
+        self.interval = max(1, int(1000 / max(1, fps)))
+
+
+    def start(self):
+        self.refresh()
+
+
+    def play(self, frames):
+        # Show a lamp animation, a list of (lamps, seconds), instead of the panel
+        # state, e.g. the power-on lamp test. Can be called from the CPU thread.
+        self.animation = (frames, time.perf_counter())
+
+
+    def animation_lamps(self):
+        # Lamps of the animation frame due now, None once the animation is over
+        animation = self.animation
+        if animation is None:
+            return None
+
+        frames, started = animation
+        elapsed = time.perf_counter() - started
+        for lamps, seconds in frames:
+            if elapsed < seconds:
+                return lamps
+            elapsed -= seconds
+
+        if self.animation is animation:
+            self.animation = None
+        return None
+
+
+    def refresh(self):
+        lamps = self.animation_lamps()
+        if lamps is None:
+            lamps = self.panel.lamps()
+        self.panel.pulses = 0
+
+        changed = lamps ^ self.shown
+        ledno = 0
+        while changed:
+            if changed & 1:
+                if (lamps >> ledno) & 1:
+                    self.leds[ledno].turn_on()
+                else:
+                    self.leds[ledno].turn_off()
+            changed >>= 1
+            ledno += 1
+
+        self.shown = lamps
+        self.canvas.after(self.interval, self.refresh)
+
+
 class LED:
     def __init__(self, canvas, x, y, name=""):
         self.canvas = canvas
@@ -0,0 +1,231 @@
+# 2025 - Per-address execution profiler for the Altair 8800 emulator
+
+# --profile counts how often the instruction at every address runs, and its
+# clock cycles, in two flat 64K arrays. When the CPU stops the counts are
+# grouped by routine, using the labels of an assembler listing such as
+# "BASIC disassembly-source.lst": every address belongs to the nearest label
+# at or below it. The report lists the routines with the most self time, i.e.
+# the cycles spent in the routine's own instructions, not in the ones it calls.
+#
+# Cycles are the base cycles of each opcode, the extra cycles of a taken
+# conditional CALL or RET are not included.
+#
+# --lineprofile samples the line number 4K BASIC is running, kept in its
+# CURRENT_LINE variable, each time the CPU loops hand a batch of clock cycles
+# to the emulator, and charges the instructions and cycles of the batch to
+# that line. It costs one sample per batch, so it can be left on for whole
+# programs, and the report says which BASIC lines the time goes to.
+#
+# OpcodeHistogram counts the opcodes a machine runs in a flat array, one per
+# emulator instance. The instrumented and legacy CPU loops always count,
+# --histogram also counts in the fast loops and saves the histogram as CSV or
+# JSON, --histogramsample counts one opcode every N clock cycles instead.
+
+import array
+import bisect
+import csv
+import json
+import re
+import time
+
+from opcodes import opcodes_8080
+import cpu8080
+
+DEFAULT_SYMBOLS = ["BASIC disassembly-source.lst", "BASICdisassembly-source.lst"]
+TOP_ROUTINES = 20
+TOP_ADDRESSES = 10
+
+# 4K BASIC CURRENT_LINE, the word just below STACK_TOP and the pointers at 0165-016E
+CURRENT_LINE_ADDR = 0x0161
+DIRECT_MODE = 0xFFFF  # CURRENT_LINE while BASIC runs a typed command, e.g. while a program is typed in
+DEFAULT_LINE_SAMPLE = 1000  # clock cycles between line samples
+TOP_LINES = 20
+
+# Listing line: address, optional code bytes, then the label, e.g.
+#   02C2 CD 01 02     InputLineWith:  CALL 0201
+LISTING_LINE = re.compile(r"(?:^|\s)(?P<addr>[0-9A-Fa-f]{4})(?::|\s)\s*(?:[0-9A-Fa-f]{2}\s+)*(?P<label>[A-Za-z_.?@$][\w.?@$]*):")
+
+
+def load_symbols(filename):
+    # Label address -> name from an assembler listing, EQU constants are skipped
+    symbols = {}
+    with open(filename, "r", errors="replace") as f:
+        for line in f:
+            code = line.split(';', 1)[0]
+            found = LISTING_LINE.search(code)
+            if found and not re.search(r"\bEQU\b", code[found.end():], re.IGNORECASE):
+                symbols.setdefault(int(found.group("addr"), 16), found.group("label"))
+
+    return symbols
+
+
+class Profiler:
+    def __init__(self, symbols=None):
+        self.counts = array.array('Q', bytes(8 * 0x10000))  # instructions run per address
+        self.tstates = array.array('Q', bytes(8 * 0x10000))  # clock cycles per address
+        self.symbols = {}
+        self.addresses = []  # sorted label addresses
+        if symbols:
+            self.set_symbols(symbols)
+
+
+    def set_symbols(self, symbols):
+        self.symbols = dict(symbols)
+        self.addresses = sorted(self.symbols)
+
+
+    def count(self, pc, opcode):
+        # One instruction, for the CPU loops that don't update the arrays inline
+        self.counts[pc] += 1
+        self.tstates[pc] += cpu8080.tstates_8080[opcode]
+
+
+    def reset(self):
+        # In place, the profiled CPU loop holds the arrays
+        self.counts[:] = array.array('Q', bytes(8 * 0x10000))
+        self.tstates[:] = array.array('Q', bytes(8 * 0x10000))
+
+
+    def routine(self, addr):
+        # Address of the label addr belongs to, or None before the first label
+        index = bisect.bisect_right(self.addresses, addr) - 1
+        return self.addresses[index] if index >= 0 else None
+
+
+    def name(self, addr):
+        # Label or label+offset of addr, empty before the first label
+        start = self.routine(addr)
+        if start is None:
+            return ""
+        if start == addr:
+            return self.symbols[start]
+        return f"{self.symbols[start]}+{addr - start:X}"
+
+
+    def routines(self):
+        # (label address or None, instructions, cycles) per routine, most cycles first
+        totals = {}
+        counts = self.counts
+        tstates = self.tstates
+        for addr in range(0x10000):
+            if counts[addr]:
+                total = totals.setdefault(self.routine(addr), [0, 0])
+                total[0] += counts[addr]
+                total[1] += tstates[addr]
+
+        return sorted(((start, instructions, cycles) for start, (instructions, cycles) in totals.items()),
+                      key=lambda routine: routine[2], reverse=True)
+
+
+    def report(self, out, top=TOP_ROUTINES):
+        total = max(1, sum(self.tstates))
+        out.write(f"\nProfile: {sum(self.counts):,d} instructions, {sum(self.tstates):,d} T-states\n")
+
+        out.write("Routines by self time:\n")
+        for start, instructions, cycles in self.routines()[:top]:
+            name = "(no label)" if start is None else f"{start:04X} {self.symbols[start]}"
+            out.write(f"  {100 * cycles / total:6.2f}% {cycles:>14,d} T {instructions:>13,d} instr  {name}\n")
+
+        out.write("Hottest addresses:\n")
+        hottest = sorted((addr for addr in range(0x10000) if self.counts[addr]), key=lambda addr: self.tstates[addr], reverse=True)
+        for addr in hottest[:TOP_ADDRESSES]:
+            out.write(f"  {100 * self.tstates[addr] / total:6.2f}% {self.tstates[addr]:>14,d} T {self.counts[addr]:>13,d} instr  {addr:04X} {self.name(addr)}\n")
+
+
+class LineProfiler:
+    def __init__(self, interval=DEFAULT_LINE_SAMPLE, line_addr=CURRENT_LINE_ADDR):
+        self.interval = interval  # clock cycles between samples, the CPU loops' batch size
+        self.line_addr = line_addr
+        self.lines = {}  # BASIC line number -> [instructions, clock cycles, wall seconds]
+        self.source = {}  # BASIC line number -> program text, for the report
+        self.instructions = 0  # machine counters at the last sample
+        self.tstates = 0
+        self.clock = None
+
+
+    def load_program(self, filename):
+        # Program text by line number, from the .bas file typed into BASIC
+        with open(filename, "r") as f:
+            for line in f:
+                number, _, text = line.strip().partition(' ')
+                if number.isdigit():
+                    self.source[int(number)] = text.strip()
+
+
+    def sample(self, altair):
+        # Charge everything since the last sample to the line BASIC is running now
+        now = time.perf_counter()
+        memory = altair.memory
+        line = memory[self.line_addr] | (memory[self.line_addr + 1] << 8)
+
+        if self.clock is not None:
+            total = self.lines.get(line)
+            if total is None:
+                total = self.lines[line] = [0, 0, 0.0]
+            total[0] += altair.instructions - self.instructions
+            total[1] += altair.tstates - self.tstates
+            total[2] += now - self.clock
+
+        self.instructions = altair.instructions
+        self.tstates = altair.tstates
+        self.clock = now
+
+
+    def report(self, out, clock_hz, top=TOP_LINES):
+        program = {line: total for line, total in self.lines.items() if line != DIRECT_MODE}
+        total = max(1, sum(cycles for instructions, cycles, wall in program.values()))
+        out.write(f"\nBASIC line profile: {len(program)} lines, {total / clock_hz:.3f}s of Altair time in the program\n")
+
+        for line, (instructions, cycles, wall) in sorted(program.items(), key=lambda item: item[1][1], reverse=True)[:top]:
+            out.write(f"  {line:5d} {100 * cycles / total:6.2f}% {cycles / clock_hz * 1000:10.1f} ms "
+                      f"{instructions:>12,d} instr {wall * 1000:9.1f} ms wall  {self.source.get(line, '')}\n")
+
+        if DIRECT_MODE in self.lines:
+            instructions, cycles, wall = self.lines[DIRECT_MODE]
+            out.write(f"  direct mode  {cycles / clock_hz * 1000:10.1f} ms {instructions:>12,d} instr {wall * 1000:9.1f} ms wall\n")
+
+
+class OpcodeHistogram:
+    def __init__(self, sample=0):
+        self.counts = array.array('Q', bytes(8 * 0x100))  # executions per opcode
+        self.sample = sample  # 0 = every instruction, N = one opcode every N clock cycles
+        self.next_sample = 0  # machine T-state count of the next sample
+
+
+    def reset(self):
+        # In place, the CPU loops hold the array
+        self.counts[:] = array.array('Q', bytes(8 * 0x100))
+        self.next_sample = 0
+
+
+    def snapshot(self):
+        # Copy of the counts, e.g. to subtract from a later snapshot
+        return array.array('Q', self.counts)
+
+
+    def sample_opcode(self, altair):
+        # Called with each batch of clock cycles while sampling
+        if altair.tstates >= self.next_sample:
+            self.counts[altair.memory[altair.registers.PC & 0xFFFF]] += 1
+            self.next_sample = altair.tstates + self.sample
+
+
+    def rows(self, counts=None):
+        # (opcode, mnemonic, count) for every opcode
+        counts = self.counts if counts is None else counts
+        return [(opcode, opcodes_8080[opcode][0], counts[opcode]) for opcode in range(0x100)]
+
+
+    def save(self, filename):
+        # CSV, or JSON when the file name ends in .json
+        if filename.lower().endswith(".json"):
+            with open(filename, "w") as f:
+                json.dump({"sample": self.sample, "total": sum(self.counts),
+                           "opcodes": [{"opcode": f"{opcode:02X}", "mnemonic": mnemonic, "count": count}
+                                       for opcode, mnemonic, count in self.rows()]}, f, indent=2)
+        else:
+            with open(filename, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["opcode", "mnemonic", "count"])
+                for opcode, mnemonic, count in self.rows():
+                    writer.writerow([f"{opcode:02X}", mnemonic, count])
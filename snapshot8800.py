@@ -0,0 +1,59 @@
+# 2025 - Machine state snapshots for the Altair 8800 emulator
+
+# A snapshot holds everything needed to carry on from where the CPU stopped:
+# the registers, interrupt enable, sense switches, T-state count, the TTY
+# input still queued and the 64KB of memory, zlib compressed. Restoring one
+# replaces the ROM load and start-up prompts, e.g. a headless run that stops
+# at the BASIC OK prompt saves a warm machine that later runs start from.
+#
+# Layout, little endian: HEADER, queued input bytes, compressed memory
+
+import struct
+import zlib
+
+SNAPSHOT_MAGIC = b"A8800SNP"
+SNAPSHOT_VERSION = 1
+
+# magic, version, A, B, C, D, E, H, L, FLAGS, PC, SP, interrupt enabled,
+# sense switches, T-states, queued input length
+HEADER = struct.Struct("<8sHBBBBBBBBHHBBQI")
+
+
+def save(altair, filename):
+    R = altair.registers
+    queued = bytes(code & 0xFF for code in altair.inputbuffer)
+
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                            R.A, R.B, R.C, R.D, R.E, R.H, R.L, R.FLAGS, R.PC & 0xFFFF, R.SP,
+                            1 if altair.interrupt_enabled else 0, altair.sense_switches,
+                            altair.tstates, len(queued)))
+        f.write(queued)
+        f.write(zlib.compress(altair.memory_view, 6))
+
+
+def restore(altair, filename):
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    (magic, version, A, B, C, D, E, H, L, FLAGS, PC, SP,
+     interrupt_enabled, sense_switches, tstates, queued) = HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError(f"{filename} is not an Altair 8800 snapshot")
+
+    offset = HEADER.size
+    memory = zlib.decompress(data[offset + queued:])
+    if len(memory) != len(altair.memory):
+        raise ValueError(f"{filename}: snapshot memory size {len(memory)} does not match")
+
+    # in place, the CPU core and loaders hold references to memory
+    altair.memory[:] = memory
+
+    R = altair.registers
+    R.A, R.B, R.C, R.D, R.E, R.H, R.L, R.FLAGS = A, B, C, D, E, H, L, FLAGS
+    R.PC, R.SP = PC, SP
+    altair.interrupt_enabled = interrupt_enabled == 1
+    altair.sense_switches = sense_switches
+    altair.tstates = tstates
+    altair.inputbuffer.clear()
+    altair.queue_input(data[offset:offset + queued])
@@ -2,7 +2,6 @@
 
 # Class to realize Altair 8800 front panel switches
 
-import tkinter as tk
 import threading
 import time
 import sys
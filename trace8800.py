@@ -0,0 +1,137 @@
+# 2025 - Binary execution trace for the Altair 8800 emulator
+
+# --debuglogger records every instruction the instrumented CPU loop runs into
+# dblogger.trc as fixed size binary records, collected in a large buffer and
+# written in chunks. Run this module to turn a trace into the old text log:
+#
+#   py trace8800.py dblogger.trc dblogger.txt
+#
+# Record layout, little endian, RECORD_SIZE bytes:
+#   kind, opcode, PC, A, B, C, D, E, H, L, FLAGS, SP, time (seconds since the epoch)
+# An INSTRUCTION record holds the registers before the instruction ran. It is
+# followed by one WRITE record per memory write, with the address in the PC
+# field and the value written in the A field. An END record holds the
+# registers when the trace was closed.
+
+import argparse
+import datetime
+import struct
+import time
+
+from opcodes import opcodes_8080
+import breakpoints8800
+
+TRACE_MAGIC = b"A8800TRC"
+TRACE_VERSION = 1
+INSTRUCTION = 0
+WRITE = 1
+END = 2
+
+RECORD = struct.Struct("<BBHBBBBBBBBHI")
+RECORD_SIZE = RECORD.size
+HEADER = struct.Struct("<8sHH")
+BUFFER_SIZE = 1 << 20
+
+
+class TraceWriter:
+    def __init__(self, filename, buffer_size=BUFFER_SIZE):
+        self.file = open(filename, "wb")
+        self.file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD_SIZE))
+        self.buffer = bytearray(buffer_size - buffer_size % RECORD_SIZE)
+        self.offset = 0
+        self.writes = ()  # addresses the current instruction writes
+        self.records = 0
+
+
+    def record(self, kind, opcode, pc, R, now):
+        RECORD.pack_into(self.buffer, self.offset, kind, opcode, pc,
+                         R.A, R.B, R.C, R.D, R.E, R.H, R.L, R.FLAGS, R.SP, now)
+        self.offset += RECORD_SIZE
+        self.records += 1
+        if self.offset == len(self.buffer):
+            self.flush()
+
+
+    def instruction(self, pc, opcode, registers, memory):
+        # Before the instruction runs
+        self.record(INSTRUCTION, opcode, pc, registers, int(time.time()))
+        self.writes = breakpoints8800.memory_accesses(opcode, pc, registers, memory)[1]
+
+
+    def after_instruction(self, memory):
+        # Log the memory the instruction wrote
+        if self.writes:
+            now = int(time.time())
+            for addr in self.writes:
+                RECORD.pack_into(self.buffer, self.offset, WRITE, 0, addr, memory[addr], 0, 0, 0, 0, 0, 0, 0, 0, now)
+                self.offset += RECORD_SIZE
+                self.records += 1
+                if self.offset == len(self.buffer):
+                    self.flush()
+            self.writes = ()
+
+
+    def flush(self):
+        self.file.write(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+
+
+    def close(self, registers=None):
+        if self.file is not None:
+            if registers is not None:
+                self.record(END, 0, registers.PC, registers, int(time.time()))
+            self.flush()
+            self.file.close()
+            self.file = None
+
+
+def read_trace(filename):
+    # Yields the records of a trace file as tuples in RECORD field order
+    with open(filename, "rb") as f:
+        magic, version, size = HEADER.unpack(f.read(HEADER.size))
+        if magic != TRACE_MAGIC or version != TRACE_VERSION or size != RECORD_SIZE:
+            raise ValueError(f"{filename} is not an Altair 8800 trace")
+
+        while True:
+            chunk = f.read(BUFFER_SIZE - BUFFER_SIZE % RECORD_SIZE)
+            if not chunk:
+                break
+            yield from RECORD.iter_unpack(chunk[:len(chunk) - len(chunk) % RECORD_SIZE])
+
+
+def registers_text(A, B, C, D, E, H, L, FLAGS, SP):
+    return (f"SP: {SP:04X}\n"
+            f"A Reg: {A:02X} | B Reg: {B:02X} | C Reg: {C:02X}\n"
+            f"D Reg: {D:02X} | E Reg: {E:02X} | Flags: {FLAGS:02X}\n"
+            f"H Reg: {H:02X} | L Reg: {L:02X}\n\n")
+
+
+def decode(filename, out):
+    # Render a trace in the text layout of the old dblogger.txt: the instruction,
+    # the registers before it, its memory writes and the registers after it
+    started = False  # the registers before an instruction are also the registers after the previous one
+    for kind, opcode, pc, A, B, C, D, E, H, L, FLAGS, SP, now in read_trace(filename):
+        if kind == WRITE:
+            out.write(f"WRITE MEM {pc:04X} = {A:02X}\n")
+            continue
+
+        registers = registers_text(A, B, C, D, E, H, L, FLAGS, SP)
+        if started:
+            out.write(registers)
+        if kind == END:
+            break
+
+        stamp = datetime.datetime.fromtimestamp(now)
+        out.write(f"{stamp.hour}:{stamp.minute}:{stamp.second} {pc:04X} : {opcode:02X} {opcodes_8080[opcode][0]}\n")
+        out.write(registers)
+        started = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Decode an Altair 8800 emulator binary trace into text")
+    parser.add_argument("trace", nargs="?", default="dblogger.trc", help="Binary trace file (default dblogger.trc)")
+    parser.add_argument("output", nargs="?", default="dblogger.txt", help="Text output file (default dblogger.txt)")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as output:
+        decode(args.trace, output)